@@ -11,6 +11,7 @@ from rich.console import Console
 
 from harness.config_exporter import ConfigExporter
 from harness.config_importer import ConfigImporter
+from harness.graders.composite_grader import CompositeGrader
 from harness.reporter import Reporter
 from harness.runner import EvalRunner
 from harness.scaffold import ScaffoldGenerator
@@ -162,6 +163,11 @@ def cli(ctx: click.Context, env_file: Path | None):
     default=None,
     help="Limit to N runs for quick testing",
 )
+@click.option(
+    "--debug-log",
+    is_flag=True,
+    help="Also write a detailed .debug.jsonl log next to the results",
+)
 def run(
     task: Path,
     config: Path,
@@ -172,6 +178,7 @@ def run(
     preserve_artifacts: bool,
     dry_run: bool,
     limit: int | None,
+    debug_log: bool,
 ):
     """Run a single evaluation task.
 
@@ -250,7 +257,7 @@ def run(
     reporter.print_detailed_result(result, verbose=verbose)
 
     if output:
-        runner.save_results([result], output.name)
+        runner.save_results([result], output.name, save_debug=debug_log)
         console.print(f"\n[green]Results saved to {output}[/green]")
 
 
@@ -308,6 +315,40 @@ def run(
     default=None,
     help="Limit to N total runs for quick testing",
 )
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of runs to execute concurrently (default: 1)",
+)
+@click.option(
+    "--per-model-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum concurrent runs per model, to respect provider rate limits",
+)
+@click.option(
+    "--reuse-envs",
+    is_flag=True,
+    help="Reset one environment between repeated runs instead of re-copying the fixture (requires -j 1)",
+)
+@click.option(
+    "--cache-grades",
+    is_flag=True,
+    help="Reuse LLM grades when runs produce identical grading prompts",
+)
+@click.option(
+    "--debug-log",
+    is_flag=True,
+    help="Also write a detailed .debug.jsonl log next to the results",
+)
+@click.option(
+    "--stream-to",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Append each result to this .jsonl file as it completes",
+)
 def matrix(
     tasks: str,
     configs: str,
@@ -318,15 +359,28 @@ def matrix(
     preserve_artifacts: bool,
     dry_run: bool,
     limit: int | None,
+    concurrency: int,
+    per_model_concurrency: int | None,
+    reuse_envs: bool,
+    cache_grades: bool,
+    debug_log: bool,
+    stream_to: Path | None,
 ):
     """Run full evaluation matrix.
 
     Use --dry-run to validate configuration without executing.
     Use --limit N to run only N total samples for quick testing.
+    Use --concurrency N to run up to N evaluations at once.
+    Use --stream-to FILE to keep partial results if the run is interrupted.
     """
+    if reuse_envs and concurrency > 1:
+        raise click.UsageError("--reuse-envs only applies to sequential runs; drop it or use -j 1")
+
     runner = EvalRunner(
         use_container=container,
         preserve_artifacts=preserve_artifacts,
+        reuse_environments=reuse_envs,
+        grader=CompositeGrader(cache_grades=True) if cache_grades else None,
     )
 
     console.print(f"Loading tasks from {tasks}...")
@@ -429,12 +483,17 @@ def matrix(
         runs_per_combo=runs,
         callback=progress_callback,
         limit=limit,
+        concurrency=concurrency,
+        stream_to=stream_to,
+        per_model_concurrency=per_model_concurrency,
     )
 
     console.print()
     reporter.print_summary(all_results)
 
-    output_path = runner.save_results(all_results, output.name if output else None)
+    output_path = runner.save_results(
+        all_results, output.name if output else None, save_debug=debug_log
+    )
     console.print(f"\n[green]Results saved to {output_path}[/green]")
 
 
@@ -480,7 +539,16 @@ def regression(baseline: Path, current: Path, statistical: bool, threshold: floa
     console.print(f"Loading current from {current}...")
     current_results = runner.load_results(current)
 
-    reporter.print_regression_comparison(baseline_results, current_results)
+    # Group once and share between the printed table and the regression check
+    baseline_grouped = reporter.group_results(baseline_results)
+    current_grouped = reporter.group_results(current_results)
+
+    reporter.print_regression_comparison(
+        baseline_results,
+        current_results,
+        baseline_grouped=baseline_grouped,
+        current_grouped=current_grouped,
+    )
 
     # Check for regressions with statistical testing
     has_regressions, comparison_data = reporter.check_regression(
@@ -488,6 +556,8 @@ def regression(baseline: Path, current: Path, statistical: bool, threshold: floa
         current_results,
         threshold=threshold,
         require_significance=statistical,
+        baseline_grouped=baseline_grouped,
+        current_grouped=current_grouped,
     )
 
     if statistical:
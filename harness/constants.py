@@ -26,3 +26,12 @@ DEFAULT_DOCKER_IMAGE_TAG = "latest"
 # Container resource defaults
 DEFAULT_CONTAINER_MEMORY = "4g"
 DEFAULT_CONTAINER_CPU = 2.0
+
+# Output size cap (in characters) kept in memory for large captured outputs
+# (GradeResult.full_output, ExecutionTrace.stderr/raw_output). Anything beyond
+# the cap is spilled under the runner's artifacts directory and loaded on demand.
+MAX_INLINE_OUTPUT_CHARS = 64 * 1024
+
+# Default token pricing (USD per 1M tokens), Claude Sonnet rates
+DEFAULT_INPUT_COST_PER_1M = 3.0
+DEFAULT_OUTPUT_COST_PER_1M = 15.0
@@ -37,15 +37,17 @@ class CompositeGrader:
         self,
         llm_model: str = DEFAULT_GRADING_MODEL,
         api_key: str | None = None,
+        cache_grades: bool = False,
     ):
         """Initialize composite grader.
 
         Args:
             llm_model: Model to use for LLM grading
             api_key: Anthropic API key for LLM grading
+            cache_grades: Reuse LLM grades for identical grading prompts
         """
         self.code_grader = CodeGrader()
-        self.llm_grader = LLMGrader(model=llm_model, api_key=api_key)
+        self.llm_grader = LLMGrader(model=llm_model, api_key=api_key, cache_grades=cache_grades)
 
     def grade(
         self,
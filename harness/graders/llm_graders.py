@@ -12,9 +12,11 @@ Research sources:
 - LLM-as-a-Judge Survey (arxiv.org/html/2411.15594v6)
 """
 
+import hashlib
 import json
 import os
 from pathlib import Path
+import threading
 
 from anthropic import Anthropic
 
@@ -41,15 +43,23 @@ class LLMGrader:
         self,
         model: str = DEFAULT_GRADING_MODEL,
         api_key: str | None = None,
+        cache_grades: bool = False,
     ):
         """Initialize LLM grader.
 
         Args:
             model: Model to use for grading (default: Haiku for cost efficiency)
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            cache_grades: Reuse the grade for a grading prompt seen before
+                (e.g. repeated runs that produced identical output) instead
+                of calling the API again
         """
         self.model = model
         self.client = Anthropic(api_key=api_key or os.getenv("ANTHROPIC_API_KEY"))
+        self.cache_grades = cache_grades
+        # digest of (model, prompt) -> successful grade
+        self._grade_cache: dict[str, GradeResult] = {}
+        self._grade_cache_lock = threading.Lock()
 
     def grade(
         self,
@@ -81,6 +91,17 @@ class LLMGrader:
             assertion=assertion,
         )
 
+        cache_key = None
+        if self.cache_grades:
+            cache_key = hashlib.blake2b(
+                f"{self.model}\0{prompt}".encode(), digest_size=16
+            ).hexdigest()
+            with self._grade_cache_lock:
+                cached = self._grade_cache.get(cache_key)
+            if cached is not None:
+                # Copy, since callers set assertion_id on the result
+                return cached.model_copy(deep=True)
+
         try:
             response = self.client.messages.create(
                 model=self.model,
@@ -93,6 +114,9 @@ class LLMGrader:
             # Attach the grading prompt and full response
             result.grading_prompt = prompt
             result.full_output = response_text
+            if cache_key is not None:
+                with self._grade_cache_lock:
+                    self._grade_cache[cache_key] = result.model_copy(deep=True)
             return result
         except Exception as e:
             return GradeResult(
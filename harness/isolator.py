@@ -3,6 +3,7 @@
 import difflib
 import fnmatch
 import json
+import os
 import shutil
 import tarfile
 import tempfile
@@ -35,6 +36,21 @@ class IsolatedEnv:
         self.cleanup()
 
 
+class FileSnapshot(dict):
+    """File contents keyed by relative path, as captured by snapshot_files.
+
+    A plain dict of path -> content that also carries each file's
+    (st_size, st_mtime_ns), so diff_files can skip re-reading files whose
+    stat is unchanged.
+    """
+
+    stats: dict[str, tuple[int, int]]
+
+    def __init__(self, items: Any = (), stats: dict[str, tuple[int, int]] | None = None):
+        super().__init__(items)
+        self.stats = stats if stats is not None else {}
+
+
 class EnvironmentIsolator:
     """Creates isolated environments for evaluation runs."""
 
@@ -89,6 +105,85 @@ class EnvironmentIsolator:
 
         return IsolatedEnv(path=project_dir, temp_root=temp_root)
 
+    def reset_environment(
+        self,
+        env: IsolatedEnv,
+        fixture_path: Path | None = None,
+        claude_md: str | None = None,
+        skills_path: Path | None = None,
+        agents_md: str | None = None,
+    ) -> None:
+        """Restore an environment in place to what create_environment builds.
+
+        Like rsync, only files whose size or mtime differ from the fixture
+        (copytree preserves mtimes) are copied again; files the run added
+        are removed. Cheaper than a fresh environment when the fixture is
+        large and a run touches few files.
+
+        Args:
+            env: Environment previously returned by create_environment
+            fixture_path: Path to fixture project to restore
+            claude_md: Content for CLAUDE.md file
+            skills_path: Path to skills directory to restore
+            agents_md: Content for agents.md file
+        """
+        project_dir = env.path
+        if fixture_path and fixture_path.exists():
+            self._sync_tree(fixture_path, project_dir)
+        else:
+            shutil.rmtree(project_dir)
+            project_dir.mkdir()
+
+        if claude_md:
+            (project_dir / "CLAUDE.md").write_text(claude_md)
+        if agents_md:
+            (project_dir / "agents.md").write_text(agents_md)
+
+        # Skills are small; replace them wholesale
+        claude_dir = env.temp_root / ".claude"
+        if claude_dir.exists():
+            shutil.rmtree(claude_dir)
+        if skills_path and skills_path.exists():
+            claude_dir.mkdir()
+            shutil.copytree(skills_path, claude_dir / "skills")
+
+    @staticmethod
+    def _sync_tree(source: Path, dest: Path) -> None:
+        """Make dest a copy of source, copying only files whose stat differs."""
+        for dirpath, dirnames, filenames in os.walk(dest):
+            rel_dir = Path(dirpath).relative_to(dest)
+            for name in list(dirnames):
+                target = Path(dirpath) / name
+                origin = source / rel_dir / name
+                if target.is_symlink() or not origin.is_dir():
+                    # Remove dirs the run created (or that replaced a file)
+                    if target.is_symlink():
+                        target.unlink()
+                    else:
+                        shutil.rmtree(target)
+                    dirnames.remove(name)
+            for name in filenames:
+                target = Path(dirpath) / name
+                origin = source / rel_dir / name
+                if not origin.is_file():
+                    target.unlink()
+                    continue
+                st, origin_st = target.lstat(), origin.stat()
+                if target.is_symlink() or (st.st_size, st.st_mtime_ns) != (
+                    origin_st.st_size,
+                    origin_st.st_mtime_ns,
+                ):
+                    target.unlink()
+                    shutil.copy2(origin, target)
+
+        # Restore anything the run deleted
+        shutil.copytree(
+            source,
+            dest,
+            dirs_exist_ok=True,
+            copy_function=lambda src, dst: None if os.path.lexists(dst) else shutil.copy2(src, dst),
+        )
+
     def create_environment_for_task(
         self,
         task_fixture: Path | None,
@@ -120,7 +215,7 @@ class EnvironmentIsolator:
         self,
         env_path: Path,
         patterns: list[str] | None = None,
-    ) -> dict[str, str]:
+    ) -> FileSnapshot:
         """Capture file contents before execution.
 
         Args:
@@ -128,53 +223,114 @@ class EnvironmentIsolator:
             patterns: Glob patterns for files to track (default: source files)
 
         Returns:
-            Dict mapping relative path to file content
+            FileSnapshot mapping relative path to file content
         """
         if patterns is None:
             patterns = ["**/*.py", "**/*.js", "**/*.ts", "**/*.java", "**/*.go", "**/*.rs"]
 
-        snapshot: dict[str, str] = {}
+        snapshot = FileSnapshot()
 
         for pattern in patterns:
             for file_path in env_path.glob(pattern):
                 if file_path.is_file():
                     try:
                         rel_path = str(file_path.relative_to(env_path))
+                        st = file_path.stat()
                         # Skip very large files (> 1MB)
-                        if file_path.stat().st_size <= 1_000_000:
+                        if st.st_size <= 1_000_000:
                             snapshot[rel_path] = file_path.read_text(errors="replace")
+                            snapshot.stats[rel_path] = (st.st_size, st.st_mtime_ns)
                     except (OSError, UnicodeDecodeError):
                         continue
 
         return snapshot
 
+    def snapshot_is_current(
+        self,
+        snapshot: dict[str, str],
+        env_path: Path,
+        patterns: list[str] | None = None,
+    ) -> bool:
+        """Check whether a snapshot still describes the files in env_path.
+
+        Compares the (size, mtime) recorded for each tracked file with the
+        files now on disk, without reading them, so an added or removed file
+        also makes the snapshot stale. Shares diff_files' fast-mode caveat.
+
+        Args:
+            snapshot: Snapshot from snapshot_files()
+            env_path: Path to compare against
+            patterns: Glob patterns for files to track (default: source files)
+
+        Returns:
+            True if every tracked file matches the snapshot's stats
+        """
+        before_stats = getattr(snapshot, "stats", None)
+        if before_stats is None:
+            return False
+        if patterns is None:
+            patterns = ["**/*.py", "**/*.js", "**/*.ts", "**/*.java", "**/*.go", "**/*.rs"]
+
+        stats: dict[str, tuple[int, int]] = {}
+        for pattern in patterns:
+            for file_path in env_path.glob(pattern):
+                if file_path.is_file():
+                    try:
+                        st = file_path.stat()
+                    except OSError:
+                        continue
+                    if st.st_size <= 1_000_000:
+                        stats[str(file_path.relative_to(env_path))] = (
+                            st.st_size,
+                            st.st_mtime_ns,
+                        )
+
+        return stats == before_stats
+
     def diff_files(
         self,
         before: dict[str, str],
         env_path: Path,
         patterns: list[str] | None = None,
+        fast: bool = True,
     ) -> list[FileChange]:
         """Calculate file changes after execution.
 
+        In fast mode, a file whose size and mtime match the snapshot is taken
+        as unchanged without reading it. Like make or rsync's default check,
+        this misses an edit that keeps the size and restores the mtime; pass
+        fast=False to compare every file's content.
+
         Args:
             before: Snapshot from snapshot_files()
             env_path: Path to the evaluation environment
             patterns: Glob patterns for files to track (default: source files)
+            fast: Skip reading files whose (size, mtime) is unchanged
+                (default: True)
 
         Returns:
             List of FileChange records
         """
         if patterns is None:
             patterns = ["**/*.py", "**/*.js", "**/*.ts", "**/*.java", "**/*.go", "**/*.rs"]
+        before_stats = getattr(before, "stats", None) if fast else None
 
-        # Get current state
-        after: dict[str, str] = {}
+        # Get current state; None marks a file known unchanged from its stat
+        after: dict[str, str | None] = {}
         for pattern in patterns:
             for file_path in env_path.glob(pattern):
                 if file_path.is_file():
                     try:
                         rel_path = str(file_path.relative_to(env_path))
-                        if file_path.stat().st_size <= 1_000_000:
+                        st = file_path.stat()
+                        if st.st_size > 1_000_000:
+                            continue
+                        if before_stats and before_stats.get(rel_path) == (
+                            st.st_size,
+                            st.st_mtime_ns,
+                        ):
+                            after[rel_path] = None
+                        else:
                             after[rel_path] = file_path.read_text(errors="replace")
                     except (OSError, UnicodeDecodeError):
                         continue
@@ -183,13 +339,15 @@ class EnvironmentIsolator:
 
         # Find created and modified files
         for path, content in after.items():
+            if content is None:
+                continue
             if path not in before:
                 # New file created
                 changes.append(
                     FileChange(
                         path=path,
                         action="created",
-                        content_after=content[:10000] if len(content) > 10000 else content,
+                        content_after=content[:10000],
                     )
                 )
             elif before[path] != content:
@@ -0,0 +1,50 @@
+"""Compact JSON encoding and decoding for results files.
+
+orjson is optional (install the ``orjson`` extra). Without it the stdlib
+json module writes the same compact separators, keeps non-ASCII text
+unescaped and, like orjson, writes NaN and infinities as null, so both
+paths load back to the same values.
+"""
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+
+def _finite(obj: Any) -> Any:
+    """Replace non-finite floats with None, recursing into containers."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def json_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when available.
+
+    Non-finite floats are written as null on both paths.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(
+        _finite(obj),
+        default=str,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    ).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,13 +3,93 @@
 from abc import ABC
 from datetime import datetime
 from enum import Enum
+import hashlib
 from pathlib import Path
 import platform
-from typing import Any, Literal
+import re
+from typing import Annotated, Any, Literal
 
+import numpy as np
 from pydantic import BaseModel, Field
 
-from harness.constants import DEFAULT_EXECUTION_MODEL, DEFAULT_MAX_TURNS
+from harness.constants import (
+    DEFAULT_EXECUTION_MODEL,
+    DEFAULT_INPUT_COST_PER_1M,
+    DEFAULT_MAX_TURNS,
+    DEFAULT_OUTPUT_COST_PER_1M,
+    MAX_INLINE_OUTPUT_CHARS,
+)
+from harness.readability_jit import NUMBA_AVAILABLE, word_syllable_counts
+
+# Approximate tokenizers for batch readability scoring (see ReadabilityMetrics.from_contents)
+_WORD_RE = re.compile(r"\b\w+\b")
+_SENT_RE = re.compile(r"[.!?]+")
+_SYL_RE = re.compile(r"[aeiouy]+", re.IGNORECASE)
+
+# Tool groups for behavioral pattern detection (see ToolCallPattern.from_tool_calls)
+_READ_TOOLS = frozenset({"Read", "Glob", "Grep", "LS"})
+_WRITE_TOOLS = frozenset({"Write", "Edit"})
+_TEST_TOOLS = frozenset({"Bash"})  # Detect pytest/test commands
+
+_TRUNCATION_MARKER_RE = re.compile(r"\n\.\.\.\[truncated, see (?P<path>[^\]]+)\]$")
+
+
+def _word_syllable_counts(content: str) -> tuple[int, int]:
+    """Approximate (word, syllable) counts for batch readability scoring.
+
+    ASCII text goes through the compiled single-pass kernel when numba is
+    installed; otherwise the regex tokenizers above give the same counts.
+    """
+    if NUMBA_AVAILABLE and content.isascii():
+        return word_syllable_counts(np.frombuffer(content.encode("ascii"), dtype=np.uint8))
+    words = _WORD_RE.findall(content)
+    return len(words), sum(max(1, len(_SYL_RE.findall(w))) for w in words)
+
+
+def _spill_output(value: str, spill_dir: Path) -> str:
+    """Cap a captured output string to MAX_INLINE_OUTPUT_CHARS.
+
+    The full content is written to spill_dir (named by content hash) and the
+    returned value keeps the head plus a marker with the absolute path of the
+    spilled file. Values under the cap, including already-capped ones, are
+    returned unchanged, as is the full value if it cannot be written.
+
+    Args:
+        value: Output string to cap
+        spill_dir: Directory for the spilled file
+
+    Returns:
+        The original string, or its truncated head with a truncation marker
+    """
+    if len(value) <= MAX_INLINE_OUTPUT_CHARS:
+        return value
+
+    digest = hashlib.sha256(value.encode("utf-8", errors="replace")).hexdigest()[:16]
+    spill_path = spill_dir.resolve() / f"{digest}.log"
+    try:
+        if not spill_path.exists():
+            spill_path.parent.mkdir(parents=True, exist_ok=True)
+            spill_path.write_text(value, encoding="utf-8")
+    except OSError:
+        return value
+
+    marker = f"\n...[truncated, see {spill_path}]"
+    return value[: MAX_INLINE_OUTPUT_CHARS - len(marker)] + marker
+
+
+def _load_full_output(value: str) -> str:
+    """Return the untruncated content for a value produced by _spill_output.
+
+    Falls back to the in-memory value if it was never truncated or the
+    spilled file is no longer available.
+    """
+    match = _TRUNCATION_MARKER_RE.search(value)
+    if not match:
+        return value
+    try:
+        return Path(match.group("path")).read_text(encoding="utf-8")
+    except OSError:
+        return value
 
 
 class FileChange(BaseModel):
@@ -83,6 +163,11 @@ class LLMAssertion(Assertion):
     borderline_example: str | None = None
 
 
+# Union discriminated on "type", so pydantic-core picks the model directly
+# instead of trying each member in turn
+AnyAssertion = Annotated[CodeAssertion | LLMAssertion, Field(discriminator="type")]
+
+
 class Task(BaseModel):
     """Definition of an evaluation task."""
 
@@ -91,7 +176,7 @@ class Task(BaseModel):
     description: str
     difficulty: TaskDifficulty = TaskDifficulty.MEDIUM
     prompt: str
-    assertions: list[CodeAssertion | LLMAssertion] = Field(default_factory=list)
+    assertions: list[AnyAssertion] = Field(default_factory=list)
     scoring: dict[str, float] = Field(default_factory=dict)
     fixture_path: Path | None = None
     timeout_seconds: int = 300
@@ -174,8 +259,8 @@ class CostMetrics(BaseModel):
     def from_usage(
         cls,
         usage: "TokenUsage",
-        input_cost_per_1m: float = 3.0,
-        output_cost_per_1m: float = 15.0,
+        input_cost_per_1m: float = DEFAULT_INPUT_COST_PER_1M,
+        output_cost_per_1m: float = DEFAULT_OUTPUT_COST_PER_1M,
     ) -> "CostMetrics":
         """Calculate costs from token usage.
 
@@ -204,10 +289,6 @@ class ToolCallPattern(BaseModel):
         if not tool_calls:
             return cls()
 
-        read_tools = {"Read", "Glob", "Grep", "LS"}
-        write_tools = {"Write", "Edit"}
-        test_tools = {"Bash"}  # Detect pytest/test commands
-
         read_count = 0
         write_count = 0
         first_write_idx = None
@@ -215,20 +296,21 @@ class ToolCallPattern(BaseModel):
         first_test_idx = None
         error_count = 0
 
+        # The tool groups are disjoint, so each call matches at most one;
+        # "pytest" contains "test", so one lowercase check covers both
         for idx, tc in enumerate(tool_calls):
-            if tc.name in read_tools:
+            name = tc.name
+            if name in _READ_TOOLS:
                 read_count += 1
                 if first_read_idx is None:
                     first_read_idx = idx
-            if tc.name in write_tools:
+            elif name in _WRITE_TOOLS:
                 write_count += 1
                 if first_write_idx is None:
                     first_write_idx = idx
-            if tc.name in test_tools and tc.input:
-                cmd = tc.input.get("command", "")
-                if "pytest" in cmd or "test" in cmd.lower():
-                    if first_test_idx is None:
-                        first_test_idx = idx
+            elif first_test_idx is None and name in _TEST_TOOLS and tc.input:
+                if "test" in tc.input.get("command", "").lower():
+                    first_test_idx = idx
             if tc.error:
                 error_count += 1
 
@@ -261,7 +343,9 @@ class ReadabilityMetrics(BaseModel):
     flesch_kincaid_grade: float = 0.0
     word_count: int = 0
     sentence_count: int = 0
-    is_accessible: bool = False  # FRE >= 50
+    is_accessible: bool = False  # FRE >= 50 (Lix < 45 from from_content_fast)
+    lix: float | None = None  # Set by from_content_fast
+    rix: float | None = None  # Set by from_content_fast
 
     @classmethod
     def from_content(cls, content: str) -> "ReadabilityMetrics":
@@ -272,14 +356,24 @@ class ReadabilityMetrics(BaseModel):
         try:
             import textstat
 
-            fre = textstat.flesch_reading_ease(content)
-            fkg = textstat.flesch_kincaid_grade(content)
+            # Count once and apply the Flesch formulas directly: textstat's
+            # per-metric functions would each recount words, sentences and
+            # syllables. Zero counts give 0.0, as in textstat.
             words = textstat.lexicon_count(content, removepunct=True)
             sentences = textstat.sentence_count(content)
-
+            syllables = textstat.syllable_count(content)
+            if words and sentences and syllables:
+                words_per_sentence = words / sentences
+                syllables_per_word = syllables / words
+                fre = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+                fkg = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+            else:
+                fre = fkg = 0.0
+
+            # Rounded like from_contents, so both entry points agree
             return cls(
-                flesch_reading_ease=fre,
-                flesch_kincaid_grade=fkg,
+                flesch_reading_ease=round(fre, 2),
+                flesch_kincaid_grade=round(fkg, 2),
                 word_count=words,
                 sentence_count=sentences,
                 is_accessible=fre >= 50,
@@ -295,6 +389,86 @@ class ReadabilityMetrics(BaseModel):
                 is_accessible=False,
             )
 
+    @classmethod
+    def from_content_fast(cls, content: str) -> "ReadabilityMetrics":
+        """Calculate Lix and Rix readability, without syllable counting.
+
+        Lix and Rix need only word, sentence and long-word (over 6 letters)
+        counts, so this is a single regex pass over the text, much cheaper
+        than textstat's Flesch scores. The Flesch fields are left at 0.0.
+
+        Args:
+            content: Text to score
+
+        Returns:
+            ReadabilityMetrics with lix, rix and counts filled in
+        """
+        words = _WORD_RE.findall(content)
+        word_count = len(words)
+        # Text without terminal punctuation still counts as one sentence
+        sentence_count = len(_SENT_RE.findall(content)) or (1 if word_count else 0)
+        if not word_count:
+            return cls(lix=0.0, rix=0.0)
+
+        long_words = sum(len(w) > 6 for w in words)
+        lix = word_count / sentence_count + 100 * long_words / word_count
+        return cls(
+            word_count=word_count,
+            sentence_count=sentence_count,
+            # Below Lix's "difficult" band, roughly FRE >= 50
+            is_accessible=lix < 45,
+            lix=round(lix, 2),
+            rix=round(long_words / sentence_count, 2),
+        )
+
+    @classmethod
+    def from_contents(cls, contents: list[str]) -> list["ReadabilityMetrics"]:
+        """Calculate readability metrics for many documents at once.
+
+        Uses one-pass regex counting of words, sentences and syllables
+        (vowel groups) and applies the Flesch formulas over numpy arrays.
+        This is much faster than per-document textstat but only approximates
+        its counts, so use it for ranking rather than exact scores.
+
+        Args:
+            contents: Text documents to score
+
+        Returns:
+            ReadabilityMetrics for each document, in input order
+        """
+        if not contents:
+            return []
+
+        n = len(contents)
+        counts = np.array([_word_syllable_counts(c) for c in contents], dtype=np.float64)
+        words, syllables = counts[:, 0], counts[:, 1]
+        sentences = np.fromiter(
+            (len(_SENT_RE.findall(c)) for c in contents), dtype=np.float64, count=n
+        )
+
+        # Text without terminal punctuation still counts as one sentence
+        sentences = np.where((sentences == 0) & (words > 0), 1.0, sentences)
+        words_per_sentence = words / np.maximum(sentences, 1.0)
+        syllables_per_word = syllables / np.maximum(words, 1.0)
+
+        fre = np.where(
+            words > 0, 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 0.0
+        )
+        fkg = np.where(
+            words > 0, 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59, 0.0
+        )
+
+        return [
+            cls(
+                flesch_reading_ease=round(float(fre[i]), 2),
+                flesch_kincaid_grade=round(float(fkg[i]), 2),
+                word_count=int(words[i]),
+                sentence_count=int(sentences[i]),
+                is_accessible=bool(fre[i] >= 50),
+            )
+            for i in range(n)
+        ]
+
 
 class ConfigSnapshot(BaseModel):
     """Snapshot of configuration used for a run."""
@@ -324,7 +498,12 @@ class ExecutionTrace(BaseModel):
     config_snapshot: ConfigSnapshot = Field(default_factory=ConfigSnapshot)
     max_turns: int = 0  # Turn limit for context
     hit_turn_limit: bool = False
-    stderr: str = ""  # Capture stderr from execution
+    stderr: str = ""  # Capture stderr from execution (see EvalResult.spill_outputs)
+
+    @property
+    def stderr_full(self) -> str:
+        """Untruncated stderr, loaded from disk if it was spilled."""
+        return _load_full_output(self.stderr)
 
 
 class CriterionScore(BaseModel):
@@ -347,10 +526,15 @@ class GradeResult(BaseModel):
     reasoning: str = ""
 
     # Enhanced grading context
-    full_output: str = ""  # Untruncated test output or LLM response
+    full_output: str = ""  # Test output or LLM response (see EvalResult.spill_outputs)
     grading_prompt: str = ""  # For LLM grades: the prompt used
     criteria_scores: list[CriterionScore] = Field(default_factory=list)  # Breakdown
 
+    @property
+    def full_output_full(self) -> str:
+        """Untruncated full_output, loaded from disk if it was spilled."""
+        return _load_full_output(self.full_output)
+
 
 class EvalResult(BaseModel):
     """Complete result of an evaluation run."""
@@ -365,6 +549,26 @@ class EvalResult(BaseModel):
     overall_score: float = Field(ge=0.0, le=1.0, default=0.0)
     passed: bool = False
 
+    def spill_outputs(self, spill_dir: Path) -> None:
+        """Move oversized captured outputs out of memory into spill_dir.
+
+        Caps trace.stderr, top-level strings in trace.raw_output and each
+        grade's full_output to MAX_INLINE_OUTPUT_CHARS; the untruncated
+        content stays available via stderr_full / full_output_full.
+
+        Args:
+            spill_dir: Directory for the spilled files
+        """
+        trace = self.trace
+        trace.stderr = _spill_output(trace.stderr, spill_dir)
+        # Only top-level strings (stdout/stderr/result) grow unbounded
+        trace.raw_output = {
+            key: _spill_output(val, spill_dir) if isinstance(val, str) else val
+            for key, val in trace.raw_output.items()
+        }
+        for grade in self.grades:
+            grade.full_output = _spill_output(grade.full_output, spill_dir)
+
     def calculate_overall_score(self, weights: dict[str, float]) -> float:
         """Calculate weighted overall score from individual grades."""
         if not self.grades or not weights:
@@ -0,0 +1,70 @@
+"""Numba-compiled kernels for batch readability scoring.
+
+Numba is optional (see harness.statistics_jit). Without it the kernels are
+plain Python functions with identical results, which are slower than the
+regex counting in ReadabilityMetrics.from_contents, so callers check
+NUMBA_AVAILABLE before choosing them.
+"""
+
+import numpy as np
+
+from harness.statistics_jit import NUMBA_AVAILABLE, njit  # noqa: F401
+
+
+@njit(cache=True)
+def _is_word_byte(b: int) -> bool:
+    """ASCII \\w: letters, digits and underscore."""
+    return (
+        (97 <= b <= 122)  # a-z
+        or (65 <= b <= 90)  # A-Z
+        or (48 <= b <= 57)  # 0-9
+        or b == 95  # _
+    )
+
+
+@njit(cache=True)
+def _is_vowel_byte(b: int) -> bool:
+    """[aeiouy], either case."""
+    b |= 32  # ASCII lowercase
+    return b == 97 or b == 101 or b == 105 or b == 111 or b == 117 or b == 121
+
+
+@njit(cache=True)
+def word_syllable_counts(text: np.ndarray) -> tuple[int, int]:
+    """Count words and approximate syllables in one pass over ASCII bytes.
+
+    Words are maximal runs of \\w characters and each word has at least
+    one syllable, one per run of vowels, matching the regex tokenizers in
+    harness.models for ASCII text.
+
+    Args:
+        text: uint8 array of ASCII-encoded text
+
+    Returns:
+        Tuple of (word count, syllable count)
+    """
+    words = 0
+    syllables = 0
+    word_syllables = 0
+    in_word = False
+    in_vowels = False
+    for i in range(text.shape[0]):
+        b = text[i]
+        if _is_word_byte(b):
+            if not in_word:
+                in_word = True
+                words += 1
+                word_syllables = 0
+            if _is_vowel_byte(b):
+                if not in_vowels:
+                    in_vowels = True
+                    word_syllables += 1
+            else:
+                in_vowels = False
+        elif in_word:
+            syllables += max(1, word_syllables)
+            in_word = False
+            in_vowels = False
+    if in_word:
+        syllables += max(1, word_syllables)
+    return words, syllables
@@ -7,30 +7,143 @@ Features:
 - CLAUDE.md quality metrics
 """
 
-import json
-from collections import defaultdict
+import bisect
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime
+import functools
+import heapq
+from itertools import groupby
+import json
+from math import fabs
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
+import numpy as np
+from pydantic import TypeAdapter
+from rich.console import Console, Group
+from rich.text import Text
 
-from harness.models import CostMetrics, EvalResult
+from harness.constants import DEFAULT_INPUT_COST_PER_1M, DEFAULT_OUTPUT_COST_PER_1M
+from harness.json_io import json_bytes
+from harness.models import EvalResult
 from harness.statistics import (
     ComparisonResult,
     EfficiencyComparison,
     StabilityMetrics,
     StatisticalAnalyzer,
 )
+from harness.statistics_jit import NUMBA_AVAILABLE, stability_jit
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+
+# Serializer for result batches, built once so pydantic-core encodes each
+# batch to JSON bytes in a single call instead of one model_dump per result
+_RESULTS_ADAPTER = TypeAdapter(list[EvalResult])
+_EXPORT_BATCH_SIZE = 256
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+
+class GroupedResults(dict):
+    """Results grouped by key, in sorted key order.
+
+    A plain dict of key -> results that also carries its keys as a frozen,
+    sorted tuple, so callers traversing the same groups repeatedly don't
+    re-sort them.
+    """
+
+    sorted_keys: tuple
+
+    def __init__(self, items: Iterable[tuple[Any, list[EvalResult]]] = ()):
+        super().__init__(items)
+        self.sorted_keys = tuple(self)
+
+
+# Sentinel that compares unequal to every grouping key
+_NO_KEY = object()
+
+
+def _group_results(
+    results: list[EvalResult],
+    keyfn: Callable[[EvalResult], Any],
+) -> GroupedResults:
+    """Group results by a key function, in sorted key order.
+
+    Buckets results in a single pass, creating each group's list on first
+    sight of its key, then sorts only the distinct keys rather than every
+    result. Runs emit results in task/config order, so consecutive results
+    usually share a key; those reuse the previous group without a dict
+    lookup. Order within each group is preserved.
+
+    Args:
+        results: List of evaluation results to group
+        keyfn: Function returning the grouping key for a result
+
+    Returns:
+        GroupedResults mapping keys to result lists, in sorted key order
+    """
+    groups: dict[Any, list[EvalResult]] = {}
+    get_group = groups.get
+    last_key: Any = _NO_KEY
+    group: list[EvalResult] = []
+    for r in results:
+        key = keyfn(r)
+        if key != last_key:
+            last_key = key
+            group = get_group(key)
+            if group is None:
+                group = groups[key] = []
+        group.append(r)
+    return GroupedResults((key, groups[key]) for key in _sort_keys(groups))
+
+
+def _sort_keys(keys: Iterable[Any]) -> list[Any]:
+    """Sort grouping keys, comparing tuple keys as one joined string.
+
+    Sorting (task, config, model) tuples compares element by element; one
+    NUL-joined string per key compares in a single call and orders the same
+    way, since the string fields never contain NUL.
+    """
+    keys = list(keys)
+    if keys and isinstance(keys[0], tuple):
+        keys.sort(key="\0".join)
+    else:
+        keys.sort()
+    return keys
+
+
+def _sorted_keys(grouped: dict) -> Iterable[Any]:
+    """Sorted keys of a grouped dict, using the cached tuple when present."""
+    if isinstance(grouped, GroupedResults):
+        return grouped.sorted_keys
+    return _sort_keys(grouped)
+
+
+_TASK_CONFIG_MODEL_KEY = attrgetter("task_id", "config_name", "model")
+_TASK_CONFIG_KEY = attrgetter("task_id", "config_name")
+_TASK_KEY = attrgetter("task_id")
+
+
+def _merge_sorted_keys(keys_a: Iterable[Any], keys_b: Iterable[Any]) -> list[Any]:
+    """Union two already-sorted key sequences, preserving sorted order.
+
+    Grouped dicts from _group_results iterate in sorted key order, so this
+    linear merge replaces building a set union and re-sorting it. Identical
+    sequences, the usual case when comparing two runs of one suite, are
+    returned without merging.
+    """
+    if isinstance(keys_a, tuple) and keys_a == keys_b:
+        return list(keys_a)
+    return [key for key, _ in groupby(heapq.merge(keys_a, keys_b))]
 
 
 def _group_results_by_key(
     results: list[EvalResult],
     include_model: bool = True,
-) -> dict[tuple, list[EvalResult]]:
+) -> GroupedResults:
     """Group evaluation results by task_id, config_name, and optionally model.
 
     Args:
@@ -38,19 +151,256 @@ def _group_results_by_key(
         include_model: Whether to include model in the grouping key (default: True)
 
     Returns:
-        Dictionary mapping (task_id, config_name[, model]) tuples to result lists
+        GroupedResults mapping (task_id, config_name[, model]) tuples to result lists
     """
-    grouped: dict[tuple, list[EvalResult]] = defaultdict(list)
+    return _group_results(
+        results, _TASK_CONFIG_MODEL_KEY if include_model else _TASK_CONFIG_KEY
+    )
+
+
+class _ResultArrays(NamedTuple):
+    """Column-wise (structure-of-arrays) view of a group of results."""
+
+    scores: np.ndarray  # float64
+    passed: np.ndarray  # bool
+    input_tokens: np.ndarray  # int64
+    output_tokens: np.ndarray  # int64
+    durations: np.ndarray  # float64
+
+
+def _extract_arrays(results: list[EvalResult]) -> _ResultArrays:
+    """Extract the numeric fields used for aggregation in a single pass.
+
+    Args:
+        results: List of evaluation results
+
+    Returns:
+        _ResultArrays with one entry per result
+    """
+    scores: list[float] = []
+    passed: list[bool] = []
+    input_tokens: list[int] = []
+    output_tokens: list[int] = []
+    durations: list[float] = []
+
+    # One pass with the trace/usage attribute chains hoisted into locals;
+    # list appends then a single array conversion beat per-element numpy
+    # item assignment
     for r in results:
-        if include_model:
-            key = (r.task_id, r.config_name, r.model)
+        trace = r.trace
+        usage = trace.usage
+        scores.append(r.overall_score)
+        passed.append(r.passed)
+        input_tokens.append(usage.input_tokens)
+        output_tokens.append(usage.output_tokens)
+        durations.append(trace.duration_seconds)
+
+    return _ResultArrays(
+        np.array(scores, dtype=np.float64),
+        np.array(passed, dtype=bool),
+        np.array(input_tokens, dtype=np.int64),
+        np.array(output_tokens, dtype=np.int64),
+        np.array(durations, dtype=np.float64),
+    )
+
+
+# (input, output) USD prices per token; every model is priced the same
+_PRICE_PER_TOKEN = np.array([DEFAULT_INPUT_COST_PER_1M, DEFAULT_OUTPUT_COST_PER_1M]) / 1_000_000
+
+
+# Below this many uncached results, groups are aggregated one at a time;
+# above it, all of them go through one vectorized _compute_metrics_many call
+_BATCH_METRICS_MIN_RESULTS = 256
+
+# Most memoized metric groups a Reporter keeps; the oldest entries are
+# dropped first so long-running processes don't pin every result list
+_METRICS_CACHE_MAX_ENTRIES = 4096
+
+# Most memoized two-sample comparisons a Reporter keeps, least recently
+# used first out; each entry holds both result lists alive
+_COMPARISON_CACHE_MAX_ENTRIES = 32
+
+# Section rule and header template shared by the console views
+_SEPARATOR = "=" * 60
+_STAT_COMPARISON_HEADER = "\n[bold]STATISTICAL COMPARISON: {a} vs {b}[/bold]"
+
+# Column layouts for the summary tables
+_TASK_TABLE_COLUMNS = ("Config", "Model", "Pass Rate", "Avg Score", "Tokens", "Duration")
+_REGRESSION_TABLE_COLUMNS = ("Task", "Config", "Baseline", "Current", "Delta", "Tok Δ%", "Dur Δ%")
+# Statistical comparison summary; {a}/{b} are filled with the set labels
+_SUMMARY_TABLE_COLUMNS = ("Metric", "{a}", "{b}", "Delta")
+
+
+def _buffered(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Run a Reporter print method inside the console's buffer.
+
+    Rich defers writes while the console is entered, so a report made of
+    many console.print calls reaches the terminal, file or CI log as one
+    write and flush instead of one per line.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "Reporter", *args: Any, **kwargs: Any) -> Any:
+        with self.console:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _make_table(columns: tuple[str, ...] | list[str]) -> "Table":
+    """Create a results table with the standard header style and given columns."""
+    # Imported lazily: rich.table (and its layout helpers) is only needed
+    # by commands that render tables
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold cyan")
+    for column in columns:
+        table.add_column(column)
+    return table
+
+
+def _make_summary_table(label_a: str, label_b: str) -> "Table":
+    """Create the statistical comparison summary table for two labelled sets."""
+    return _make_table([c.format(a=label_a, b=label_b) for c in _SUMMARY_TABLE_COLUMNS])
+
+
+def _fmt_thousands(value: float) -> str:
+    """Format a number rounded to an int with comma grouping (same as ',.0f').
+
+    Grouping an int is cheaper than the float ',.0f' path, and round() uses
+    the same half-to-even rule.
+    """
+    return f"{round(value):,}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _rate_label(rate: float) -> str:
+    """Format a rate as a whole percentage.
+
+    Cached because report rows draw from the few rates that small run
+    counts can produce, and a lookup is cheaper than formatting.
+    """
+    return f"{rate:.0%}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _pass_rate_label(passed: int, total: int, rate: float) -> str:
+    """Format a "passed/total (rate%)" cell, cached like _rate_label."""
+    return f"{passed}/{total} ({rate:.0%})"
+
+
+def _coalesce_lines(pieces: list[Any]) -> list[Any]:
+    """Join each run of consecutive markup strings into one string.
+
+    Rich renders every item of a Group separately, so one newline-joined
+    string per run renders faster than one item per line. Panels, Text and
+    other renderables stay separate items between the runs.
+    """
+    coalesced: list[Any] = []
+    for is_str, run in groupby(pieces, key=lambda piece: isinstance(piece, str)):
+        if is_str:
+            coalesced.append("\n".join(run))
         else:
-            key = (r.task_id, r.config_name)
-        grouped[key].append(r)
-    return grouped
+            coalesced.extend(run)
+    return coalesced
+
+
+def _preview(text: str, limit: int, suffix: str = "...") -> str:
+    """Truncate text to limit characters, appending suffix only if truncated."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + suffix
+
+
+def _delta_pct(base: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Percentage change from base to current; NaN where base is not positive."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(base > 0, (current - base) / base * 100, np.nan)
+
+
+# Bucket edges for efficiency deltas: < -10%, [-10%, +10%], > +10%
+_DELTA_BUCKET_EDGES = np.array([-10.0, np.nextafter(10.0, np.inf)])
+_DELTA_BUCKET_NA = 3
+
+# (format, style) per bucket for token/duration deltas, where an increase is bad
+_EFFICIENCY_DELTA_TEMPLATES: tuple[tuple[str, str | None], ...] = (
+    ("{:.0f}%", "green"),
+    ("{:+.0f}%", None),
+    ("+{:.0f}%", "red"),
+    ("N/A", None),
+)
+
+
+def _delta_bucket(delta_pct: np.ndarray) -> np.ndarray:
+    """Classify percentage deltas: 0 = < -10%, 1 = within ±10%, 2 = > +10%, 3 = N/A (NaN)."""
+    buckets = np.digitize(delta_pct, _DELTA_BUCKET_EDGES)
+    return np.where(np.isnan(delta_pct), _DELTA_BUCKET_NA, buckets)
+
+
+def _efficiency_delta_cell(delta_pct: float, bucket: int) -> Text | str:
+    """Format a token/duration delta cell from its bucket's template."""
+    fmt, style = _EFFICIENCY_DELTA_TEMPLATES[bucket]
+    text = fmt.format(delta_pct)
+    return Text(text, style=style) if style else text
 
 
-@dataclass
+# (style, format) for below / within / above ±threshold in the statistical
+# comparison's efficiency section; formats receive pct and abs=|pct|
+_TOKEN_DELTA_STYLES: tuple[tuple[str, str], ...] = (
+    ("green", "{abs:.1f}% fewer"),
+    ("dim", "{pct:+.1f}%"),
+    ("red", "+{pct:.1f}% more"),
+)
+_DURATION_DELTA_STYLES: tuple[tuple[str, str], ...] = (
+    ("green", "{abs:.1f}% faster"),
+    ("dim", "{pct:+.1f}%"),
+    ("red", "+{pct:.1f}% slower"),
+)
+_COST_DELTA_STYLES: tuple[tuple[str, str], ...] = (
+    ("green", "{pct:+.1f}%"),
+    ("dim", "{pct:+.1f}%"),
+    ("red", "{pct:+.1f}%"),
+)
+
+
+# Markup for each file change action in print_detailed_result
+_FILE_CHANGE_MARKERS = {
+    "created": "[green]+[/]",
+    "modified": "[yellow]~[/]",
+    "deleted": "[red]-[/]",
+}
+
+# Significance markers for p < 0.01, p < 0.05, and otherwise
+_SIG_BOUNDS = (0.01, 0.05)
+_SIG_MARKERS = ("**", "*", "")
+
+
+def _sig_for(p_value: float | None) -> str:
+    """Significance marker for a p-value ("" when missing or p >= 0.05)."""
+    if p_value is None:
+        return ""
+    return _SIG_MARKERS[bisect.bisect_right(_SIG_BOUNDS, p_value)]
+
+
+def _p_value_label(p_value: float | None) -> str:
+    """Label like "p=0.004**" for a p-value, or "p=N/A" when missing."""
+    if p_value is None:
+        return "p=N/A"
+    return f"p={p_value:.3f}{_SIG_MARKERS[bisect.bisect_right(_SIG_BOUNDS, p_value)]}"
+
+
+def _classify_delta(
+    pct: float, threshold: float, styles: tuple[tuple[str, str], ...]
+) -> tuple[str, str]:
+    """Pick (style, text) for a percentage delta from a 3-entry style table.
+
+    Changes within ±threshold (inclusive) and NaN use the middle entry.
+    """
+    style, fmt = styles[1 - (pct < -threshold) + (pct > threshold)]
+    return style, fmt.format(pct=pct, abs=fabs(pct))
+
+
+@dataclass(slots=True)
 class AggregatedMetrics:
     """Aggregated metrics for a group of results."""
 
@@ -67,6 +417,32 @@ class AggregatedMetrics:
     stability: StabilityMetrics | None = None
 
 
+# k values reported for pass@k
+_PASS_AT_K = (1, 3, 5)
+
+# Shared result for empty groups (e.g. keys missing from one side of a diff);
+# treat as read-only
+_EMPTY_METRICS = AggregatedMetrics(
+    total_runs=0,
+    passed=0,
+    failed=0,
+    pass_rate=0,
+    avg_score=0,
+    avg_tokens=0,
+    avg_duration=0,
+    avg_cost=0,
+    pass_at_k=dict.fromkeys(_PASS_AT_K, 0.0),
+    stability=None,
+)
+
+
+def _metric_array(metrics: list[AggregatedMetrics | None], field: str) -> np.ndarray:
+    """Collect one AggregatedMetrics field into a float array (0 where missing)."""
+    return np.array(
+        [getattr(m, field) if m else 0.0 for m in metrics], dtype=np.float64
+    )
+
+
 class Reporter:
     """Generates reports from evaluation results."""
 
@@ -77,7 +453,14 @@ class Reporter:
             console: Rich console for output (default: new Console)
         """
         self.console = console or Console()
-
+        # id(results) -> (results, len(results), metrics); holding the list
+        # keeps its id from being reused while the entry is alive
+        self._metrics_cache: dict[int, tuple[list[EvalResult], int, AggregatedMetrics]] = {}
+        # (analysis, id(a), id(b)) -> (a, len(a), b, len(b), result), same
+        # identity + length validation as _metrics_cache
+        self._comparison_cache: dict[tuple[str, int, int], tuple[Any, ...]] = {}
+
+    @_buffered
     def print_summary(self, results: list[EvalResult]) -> None:
         """Print summary table of results.
 
@@ -88,85 +471,208 @@ class Reporter:
             self.console.print("[yellow]No results to display[/yellow]")
             return
 
-        # Group by task
-        by_task = defaultdict(list)
-        for r in results:
-            by_task[r.task_id].append(r)
+        # Group by task + config + model once; sorted keys keep each task's
+        # rows contiguous, and all groups are aggregated in one batch
+        grouped = _group_results_by_key(results)
+        all_metrics = dict(
+            zip(grouped.sorted_keys, self._calculate_metrics_many(list(grouped.values())))
+        )
 
         self.console.print()
         self.console.print(
             f"[bold]EVAL RESULTS: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/bold]"
         )
-        self.console.print("=" * 60)
+        self.console.print(_SEPARATOR)
 
-        for task_id, task_results in sorted(by_task.items()):
-            self._print_task_table(task_id, task_results)
+        for task_id, keys in groupby(grouped.sorted_keys, itemgetter(0)):
+            self._print_task_table(
+                task_id, [(config, model, all_metrics[(task_id, config, model)]) for _, config, model in keys]
+            )
 
-    def _print_task_table(self, task_id: str, results: list[EvalResult]) -> None:
-        """Print table for a single task."""
+    def _print_task_table(
+        self, task_id: str, rows: list[tuple[str, str, AggregatedMetrics]]
+    ) -> None:
+        """Print table for a single task from (config, model, metrics) rows."""
         self.console.print(f"\n[bold]Task: {task_id}[/bold]")
 
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Config")
-        table.add_column("Model")
-        table.add_column("Pass Rate")
-        table.add_column("Avg Score")
-        table.add_column("Tokens")
-        table.add_column("Duration")
-
-        # Group by config and model
-        by_config_model = defaultdict(list)
-        for r in results:
-            key = (r.config_name, r.model)
-            by_config_model[key].append(r)
+        table = _make_table(_TASK_TABLE_COLUMNS)
 
-        for (config, model), group in sorted(by_config_model.items()):
-            metrics = self._calculate_metrics(group)
-
-            pass_rate_str = f"{metrics.passed}/{metrics.total_runs} ({metrics.pass_rate:.0%})"
+        for config, model, metrics in rows:
+            pass_rate_str = _pass_rate_label(metrics.passed, metrics.total_runs, metrics.pass_rate)
             avg_score_str = f"{metrics.avg_score:.2f}"
             tokens_str = f"{metrics.avg_tokens:,}"
             duration_str = f"{metrics.avg_duration:.1f}s"
 
             # Color coding
             if metrics.pass_rate >= 0.9:
-                pass_rate_str = f"[green]{pass_rate_str}[/green]"
+                pass_rate_cell = Text(pass_rate_str, style="green")
             elif metrics.pass_rate >= 0.5:
-                pass_rate_str = f"[yellow]{pass_rate_str}[/yellow]"
+                pass_rate_cell = Text(pass_rate_str, style="yellow")
             else:
-                pass_rate_str = f"[red]{pass_rate_str}[/red]"
+                pass_rate_cell = Text(pass_rate_str, style="red")
 
-            table.add_row(config, model, pass_rate_str, avg_score_str, tokens_str, duration_str)
+            table.add_row(config, model, pass_rate_cell, avg_score_str, tokens_str, duration_str)
 
         self.console.print(table)
 
     def _calculate_metrics(self, results: list[EvalResult]) -> AggregatedMetrics:
-        """Calculate aggregated metrics for a group of results."""
+        """Calculate aggregated metrics for a group of results.
+
+        Results are memoized per list object, so callers that pass the same
+        group more than once (e.g. regression printing then checking) only
+        pay for the aggregation and statistics once.
+        """
+        if not results:
+            return _EMPTY_METRICS
+
+        cached = self._metrics_cache.get(id(results))
+        if cached is not None and cached[0] is results and cached[1] == len(results):
+            return cached[2]
+
+        metrics = self._compute_metrics(results)
+        self._store_metrics(results, metrics)
+        return metrics
+
+    def _calculate_metrics_many(
+        self, groups: list[list[EvalResult]]
+    ) -> list[AggregatedMetrics]:
+        """Calculate metrics for many groups, batching the uncached ones.
+
+        Equivalent to calling _calculate_metrics on each group. When the
+        uncached groups hold at least _BATCH_METRICS_MIN_RESULTS results in
+        total they are aggregated together by _compute_metrics_many.
+        """
+        metrics: list[AggregatedMetrics | None] = []
+        missing: list[int] = []
+        for i, group in enumerate(groups):
+            cached = self._metrics_cache.get(id(group)) if group else None
+            if not group:
+                metrics.append(_EMPTY_METRICS)
+            elif cached is not None and cached[0] is group and cached[1] == len(group):
+                metrics.append(cached[2])
+            else:
+                metrics.append(None)
+                missing.append(i)
+
+        if sum(len(groups[i]) for i in missing) >= _BATCH_METRICS_MIN_RESULTS:
+            computed = self._compute_metrics_many([groups[i] for i in missing])
+        else:
+            computed = [self._compute_metrics(groups[i]) for i in missing]
+
+        for i, group_metrics in zip(missing, computed):
+            metrics[i] = group_metrics
+            self._store_metrics(groups[i], group_metrics)
+        return metrics  # type: ignore[return-value]
+
+    def _store_metrics(self, results: list[EvalResult], metrics: AggregatedMetrics) -> None:
+        """Memoize metrics for a group, evicting the oldest entry when full."""
+        cache = self._metrics_cache
+        cache.pop(id(results), None)
+        cache[id(results)] = (results, len(results), metrics)
+        if len(cache) > _METRICS_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest
+            del cache[next(iter(cache))]
+
+    def _compare_cached(
+        self,
+        analysis: Callable[[list[EvalResult], list[EvalResult]], Any],
+        results_a: list[EvalResult],
+        results_b: list[EvalResult],
+    ) -> Any:
+        """Run a two-sample analysis, memoized per pair of result lists.
+
+        Re-rendering the same comparison (e.g. console then export) reuses
+        the earlier Mann-Whitney / efficiency results instead of re-ranking.
+        At most _COMPARISON_CACHE_MAX_ENTRIES are kept, least recently used
+        evicted first.
+        """
+        cache = self._comparison_cache
+        key = (analysis.__name__, id(results_a), id(results_b))
+        cached = cache.pop(key, None)
+        if (
+            cached is not None
+            and cached[0] is results_a
+            and cached[1] == len(results_a)
+            and cached[2] is results_b
+            and cached[3] == len(results_b)
+        ):
+            # Re-inserting moves the entry to the most recently used end
+            cache[key] = cached
+            return cached[4]
+
+        value = analysis(results_a, results_b)
+        cache[key] = (results_a, len(results_a), results_b, len(results_b), value)
+        if len(cache) > _COMPARISON_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest
+            del cache[next(iter(cache))]
+        return value
+
+    def group_results(
+        self,
+        results: list[EvalResult],
+        include_model: bool = True,
+    ) -> GroupedResults:
+        """Group results by task_id, config_name, and optionally model.
+
+        Groups built once can be passed to both print_regression_comparison
+        and check_regression, which then share cached per-group metrics.
+
+        Args:
+            results: List of evaluation results to group
+            include_model: Whether to include model in the grouping key (default: True)
+
+        Returns:
+            GroupedResults mapping (task_id, config_name[, model]) tuples to result lists
+        """
+        return _group_results_by_key(results, include_model)
+
+    def clear_metrics_cache(self) -> None:
+        """Drop memoized metrics and comparisons (e.g. after mutating result lists in place)."""
+        self._metrics_cache.clear()
+        self._comparison_cache.clear()
+
+    def _compute_metrics(self, results: list[EvalResult]) -> AggregatedMetrics:
+        """Aggregate metrics for a group of results (uncached)."""
         total = len(results)
-        passed = sum(1 for r in results if r.passed)
+        arrays = _extract_arrays(results)
+        passed = int(arrays.passed.sum())
 
-        avg_score = sum(r.overall_score for r in results) / total if total else 0
+        avg_score = float(arrays.scores.mean()) if total else 0
         avg_tokens = (
-            int(sum(r.trace.usage.total_tokens for r in results) / total) if total else 0
-        )
-        avg_duration = (
-            sum(r.trace.duration_seconds for r in results) / total if total else 0
+            int((arrays.input_tokens.sum() + arrays.output_tokens.sum()) / total) if total else 0
         )
+        avg_duration = float(arrays.durations.mean()) if total else 0
 
         # Calculate cost from token usage
-        total_cost = sum(
-            CostMetrics.from_usage(r.trace.usage).total_cost_usd
-            for r in results
-        )
-        avg_cost = total_cost / total if total else 0
-
-        # Calculate pass@k using unbiased estimator
-        pass_at_k = {}
-        for k in [1, 3, 5]:
-            pass_at_k[k] = StatisticalAnalyzer.pass_at_k_unbiased(results, k)
+        tokens = np.column_stack((arrays.input_tokens, arrays.output_tokens))
+        costs = tokens @ _PRICE_PER_TOKEN
+        avg_cost = float(costs.mean()) if total else 0
+
+        # Unbiased pass@k from the pass count; memoized per (n, c, k), so
+        # groups with the same counts skip the binomials entirely
+        pass_at_k = {
+            k: StatisticalAnalyzer.pass_at_k_from_counts(total, passed, k) for k in _PASS_AT_K
+        }
 
-        # Calculate stability metrics
-        stability = StatisticalAnalyzer.calculate_stability(results) if results else None
+        if NUMBA_AVAILABLE:
+            # Compiled kernel operates directly on the extracted scores
+            stability = None
+            if total:
+                variance, std_dev, cv, min_score, max_score = stability_jit(arrays.scores)
+                stability = StabilityMetrics(
+                    variance=variance,
+                    std_dev=std_dev,
+                    coefficient_of_variation=cv,
+                    min_score=min_score,
+                    max_score=max_score,
+                    score_range=max_score - min_score,
+                )
+        else:
+            # Stability from the extracted scores, so results are only
+            # scanned once
+            stability = (
+                StatisticalAnalyzer.stability_from_scores(arrays.scores) if total else None
+            )
 
         return AggregatedMetrics(
             total_runs=total,
@@ -181,116 +687,187 @@ class Reporter:
             stability=stability,
         )
 
+    def _compute_metrics_many(
+        self, groups: list[list[EvalResult]]
+    ) -> list[AggregatedMetrics]:
+        """Aggregate metrics for many non-empty groups at once (uncached).
+
+        All groups are extracted into one set of column arrays and reduced
+        per group with np.add/minimum/maximum.reduceat over the group start
+        offsets, so the per-group work is a handful of vectorized reductions
+        rather than a pass over each group.
+        """
+        sizes = np.array([len(g) for g in groups], dtype=np.int64)
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        arrays = _extract_arrays([r for group in groups for r in group])
+
+        passed = np.add.reduceat(arrays.passed.astype(np.int64), starts)
+        avg_score = np.add.reduceat(arrays.scores, starts) / sizes
+        token_sums = np.add.reduceat(arrays.input_tokens + arrays.output_tokens, starts)
+        avg_duration = np.add.reduceat(arrays.durations, starts) / sizes
+
+        tokens = np.column_stack((arrays.input_tokens, arrays.output_tokens))
+        costs = tokens @ _PRICE_PER_TOKEN
+        avg_cost = np.add.reduceat(costs, starts) / sizes
+
+        # Sample variance (ddof=1) from deviations about each group's mean
+        deviations = arrays.scores - np.repeat(avg_score, sizes)
+        squared = np.add.reduceat(deviations * deviations, starts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = np.where(sizes > 1, squared / (sizes - 1), 0.0)
+        std_dev = np.sqrt(variance)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cv = np.where(avg_score > 0, std_dev / avg_score, 0.0)
+        min_score = np.minimum.reduceat(arrays.scores, starts)
+        max_score = np.maximum.reduceat(arrays.scores, starts)
+
+        metrics = []
+        for i, total in enumerate(sizes.tolist()):
+            group_passed = int(passed[i])
+            metrics.append(
+                AggregatedMetrics(
+                    total_runs=total,
+                    passed=group_passed,
+                    failed=total - group_passed,
+                    pass_rate=group_passed / total,
+                    avg_score=float(avg_score[i]),
+                    avg_tokens=int(token_sums[i] / total),
+                    avg_duration=float(avg_duration[i]),
+                    avg_cost=float(avg_cost[i]),
+                    pass_at_k={
+                        k: StatisticalAnalyzer.pass_at_k_from_counts(total, group_passed, k)
+                        for k in _PASS_AT_K
+                    },
+                    stability=StabilityMetrics(
+                        variance=float(variance[i]),
+                        std_dev=float(std_dev[i]),
+                        coefficient_of_variation=float(cv[i]),
+                        min_score=float(min_score[i]),
+                        max_score=float(max_score[i]),
+                        score_range=float(max_score[i] - min_score[i]),
+                    ),
+                )
+            )
+        return metrics
+
+    def _pair_metrics(
+        self,
+        grouped_a: dict[tuple, list[EvalResult]],
+        grouped_b: dict[tuple, list[EvalResult]],
+    ) -> tuple[list[tuple], list[AggregatedMetrics | None], list[AggregatedMetrics | None]]:
+        """Aggregate two grouped result sets over the sorted union of their keys.
+
+        Returns:
+            Tuple of (keys, metrics_a, metrics_b), with None in a metrics list
+            where that side has no results for the key
+        """
+        keys_a, keys_b = _sorted_keys(grouped_a), _sorted_keys(grouped_b)
+        keys = _merge_sorted_keys(keys_a, keys_b)
+        if len(keys) == len(keys_a) == len(keys_b):
+            # Same keys on both sides: no missing groups to mark
+            return (
+                keys,
+                self._calculate_metrics_many([grouped_a[key] for key in keys]),
+                self._calculate_metrics_many([grouped_b[key] for key in keys]),
+            )
+
+        # Aggregate only the groups each side has, then align on the union
+        by_key_a = dict(
+            zip(keys_a, self._calculate_metrics_many([grouped_a[key] for key in keys_a]))
+        )
+        by_key_b = dict(
+            zip(keys_b, self._calculate_metrics_many([grouped_b[key] for key in keys_b]))
+        )
+        return keys, list(map(by_key_a.get, keys)), list(map(by_key_b.get, keys))
+
+    @_buffered
     def print_regression_comparison(
         self,
         baseline: list[EvalResult],
         current: list[EvalResult],
+        *,
+        baseline_grouped: dict[tuple, list[EvalResult]] | None = None,
+        current_grouped: dict[tuple, list[EvalResult]] | None = None,
     ) -> None:
         """Print comparison between baseline and current results.
 
         Args:
             baseline: Previous baseline results
             current: Current results to compare
+            baseline_grouped: Precomputed group_results(baseline), if available
+            current_grouped: Precomputed group_results(current), if available
         """
         self.console.print("\n[bold]REGRESSION COMPARISON[/bold]")
-        self.console.print("=" * 60)
+        self.console.print(_SEPARATOR)
 
         # Group by task + config + model
-        baseline_grouped = _group_results_by_key(baseline)
-        current_grouped = _group_results_by_key(current)
-
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Task")
-        table.add_column("Config")
-        table.add_column("Baseline")
-        table.add_column("Current")
-        table.add_column("Delta")
-        table.add_column("Tok Δ%")
-        table.add_column("Dur Δ%")
-
-        all_keys = set(baseline_grouped.keys()) | set(current_grouped.keys())
-
-        regressions = []
-        improvements = []
-        efficiency_regressions = []
+        if baseline_grouped is None:
+            baseline_grouped = _group_results_by_key(baseline)
+        if current_grouped is None:
+            current_grouped = _group_results_by_key(current)
 
-        for key in sorted(all_keys):
-            task_id, config, _ = key
+        keys, baseline_metrics, current_metrics = self._pair_metrics(
+            baseline_grouped, current_grouped
+        )
 
-            baseline_metrics = (
-                self._calculate_metrics(baseline_grouped[key])
-                if key in baseline_grouped
-                else None
-            )
-            current_metrics = (
-                self._calculate_metrics(current_grouped[key])
-                if key in current_grouped
-                else None
-            )
+        # Compute all deltas and their >10% / <-10% buckets in one shot
+        rate_delta = _metric_array(current_metrics, "pass_rate") - _metric_array(
+            baseline_metrics, "pass_rate"
+        )
+        tok_delta = _delta_pct(
+            _metric_array(baseline_metrics, "avg_tokens"),
+            _metric_array(current_metrics, "avg_tokens"),
+        )
+        dur_delta = _delta_pct(
+            _metric_array(baseline_metrics, "avg_duration"),
+            _metric_array(current_metrics, "avg_duration"),
+        )
+        tok_bucket = _delta_bucket(tok_delta)
+        dur_bucket = _delta_bucket(dur_delta)
 
-            baseline_rate = baseline_metrics.pass_rate if baseline_metrics else 0
-            current_rate = current_metrics.pass_rate if current_metrics else 0
-            delta = current_rate - baseline_rate
+        table = _make_table(_REGRESSION_TABLE_COLUMNS)
 
-            baseline_str = f"{baseline_rate:.0%}" if baseline_metrics else "N/A"
-            current_str = f"{current_rate:.0%}" if current_metrics else "N/A"
+        for i, (task_id, config, _) in enumerate(keys):
+            delta = rate_delta[i]
+            baseline_str = _rate_label(baseline_metrics[i].pass_rate) if baseline_metrics[i] else "N/A"
+            current_str = _rate_label(current_metrics[i].pass_rate) if current_metrics[i] else "N/A"
 
             if delta > 0:
-                delta_str = f"[green]+{delta:.0%}[/green]"
-                improvements.append((key, delta))
+                delta_str = Text(f"+{delta:.0%}", style="green")
             elif delta < 0:
-                delta_str = f"[red]{delta:.0%}[/red]"
-                regressions.append((key, delta))
+                delta_str = Text(f"{delta:.0%}", style="red")
             else:
                 delta_str = "0%"
 
-            # Calculate token and duration deltas
-            baseline_tokens = baseline_metrics.avg_tokens if baseline_metrics else 0
-            current_tokens = current_metrics.avg_tokens if current_metrics else 0
-            baseline_dur = baseline_metrics.avg_duration if baseline_metrics else 0
-            current_dur = current_metrics.avg_duration if current_metrics else 0
-
-            if baseline_tokens > 0:
-                tok_delta_pct = (current_tokens - baseline_tokens) / baseline_tokens * 100
-                if tok_delta_pct > 10:
-                    tok_str = f"[red]+{tok_delta_pct:.0f}%[/red]"
-                    efficiency_regressions.append((key, "tokens", tok_delta_pct))
-                elif tok_delta_pct < -10:
-                    tok_str = f"[green]{tok_delta_pct:.0f}%[/green]"
-                else:
-                    tok_str = f"{tok_delta_pct:+.0f}%"
-            else:
-                tok_str = "N/A"
-
-            if baseline_dur > 0:
-                dur_delta_pct = (current_dur - baseline_dur) / baseline_dur * 100
-                if dur_delta_pct > 10:
-                    dur_str = f"[red]+{dur_delta_pct:.0f}%[/red]"
-                    efficiency_regressions.append((key, "duration", dur_delta_pct))
-                elif dur_delta_pct < -10:
-                    dur_str = f"[green]{dur_delta_pct:.0f}%[/green]"
-                else:
-                    dur_str = f"{dur_delta_pct:+.0f}%"
-            else:
-                dur_str = "N/A"
-
-            table.add_row(task_id, config, baseline_str, current_str, delta_str, tok_str, dur_str)
+            table.add_row(
+                task_id,
+                config,
+                baseline_str,
+                current_str,
+                delta_str,
+                _efficiency_delta_cell(tok_delta[i], tok_bucket[i]),
+                _efficiency_delta_cell(dur_delta[i], dur_bucket[i]),
+            )
 
         self.console.print(table)
 
+        regressions = int((rate_delta < 0).sum())
+        improvements = int((rate_delta > 0).sum())
+        efficiency_regressions = int((tok_bucket == 2).sum() + (dur_bucket == 2).sum())
+
         # Summary
         self.console.print()
         if regressions:
             self.console.print(
-                f"[red]Regressions: {len(regressions)} task(s) got worse[/red]"
+                f"[red]Regressions: {regressions} task(s) got worse[/red]"
             )
         if improvements:
             self.console.print(
-                f"[green]Improvements: {len(improvements)} task(s) got better[/green]"
+                f"[green]Improvements: {improvements} task(s) got better[/green]"
             )
         if efficiency_regressions:
             self.console.print(
-                f"[yellow]Efficiency regressions: {len(efficiency_regressions)} metric(s) increased >10%[/yellow]"
+                f"[yellow]Efficiency regressions: {efficiency_regressions} metric(s) increased >10%[/yellow]"
             )
         if not regressions and not improvements:
             self.console.print("[yellow]No significant changes detected[/yellow]")
@@ -302,88 +879,94 @@ class Reporter:
             result: Result to display
             verbose: Whether to show full output (default: False)
         """
-        self.console.print(f"\n[bold]Task: {result.task_id}[/bold]")
-        self.console.print(f"Config: {result.config_name}")
-        self.console.print(f"Model: {result.model}")
-        self.console.print(f"Run: {result.run_index}")
-        self.console.print(f"Passed: {'[green]Yes[/green]' if result.passed else '[red]No[/red]'}")
-        self.console.print(f"Overall Score: {result.overall_score:.2f}")
-        self.console.print()
+        # Imported lazily: rich.syntax pulls in pygments, which only the
+        # detailed/explain views need
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
+        trace = result.trace
+        usage = trace.usage
+
+        # Collected and printed as one Group so the console renders once
+        pieces: list[Any] = [
+            f"\n[bold]Task: {result.task_id}[/bold]",
+            f"Config: {result.config_name}",
+            f"Model: {result.model}",
+            f"Run: {result.run_index}",
+            f"Passed: {'[green]Yes[/green]' if result.passed else '[red]No[/red]'}",
+            f"Overall Score: {result.overall_score:.2f}",
+            "",
+        ]
 
         # Assertion results with pass/fail icons
         if result.grades:
-            self.console.print("[bold]Assertions:[/bold]")
+            pieces.append("[bold]Assertions:[/bold]")
             for grade in result.grades:
                 icon = "✓" if grade.passed else "✗"
                 color = "green" if grade.passed else "red"
                 name = grade.assertion_name or grade.assertion_id
-                self.console.print(
-                    f"  [{color}]{icon}[/] {name}: {grade.score:.2f}"
-                )
+                pieces.append(f"  [{color}]{icon}[/] {name}: {grade.score:.2f}")
 
                 # Show details for failed assertions or in verbose mode
                 if not grade.passed or verbose:
                     if grade.details:
-                        details = grade.details[:200] + "..." if len(grade.details) > 200 else grade.details
-                        self.console.print(f"    [dim]{details}[/dim]")
+                        pieces.append(f"    [dim]{_preview(grade.details, 200)}[/dim]")
 
                     # Show full output in verbose mode
                     if verbose and grade.full_output:
-                        self.console.print()
-                        self.console.print(
+                        pieces.append("")
+                        pieces.append(
                             Panel(
-                                grade.full_output[:1000] + ("..." if len(grade.full_output) > 1000 else ""),
+                                _preview(grade.full_output, 1000),
                                 title=f"Full Output: {name}",
                                 border_style="dim",
                             )
                         )
 
-            self.console.print()
+            pieces.append("")
 
         # File changes
-        if result.trace.file_changes:
-            self.console.print("[bold]File Changes:[/bold]")
-            for fc in result.trace.file_changes:
-                if fc.action == "created":
-                    self.console.print(f"  [green]+[/] {fc.path} [dim](created)[/dim]")
-                elif fc.action == "modified":
-                    self.console.print(f"  [yellow]~[/] {fc.path} [dim](modified)[/dim]")
-                elif fc.action == "deleted":
-                    self.console.print(f"  [red]-[/] {fc.path} [dim](deleted)[/dim]")
+        if trace.file_changes:
+            pieces.append("[bold]File Changes:[/bold]")
+            for fc in trace.file_changes:
+                marker = _FILE_CHANGE_MARKERS.get(fc.action)
+                if marker is not None:
+                    pieces.append(f"  {marker} {fc.path} [dim]({fc.action})[/dim]")
 
                 # Show diff in verbose mode
                 if verbose and fc.diff:
-                    self.console.print()
-                    self.console.print(
+                    pieces.append("")
+                    pieces.append(
                         Syntax(fc.diff[:2000], "diff", theme="monokai", line_numbers=False)
                     )
 
-            self.console.print()
+            pieces.append("")
 
         # Tool call timeline
-        if result.trace.tool_calls:
-            self.console.print("[bold]Tool Calls:[/bold]")
-            for tc in result.trace.tool_calls:
+        if trace.tool_calls:
+            pieces.append("[bold]Tool Calls:[/bold]")
+            for tc in trace.tool_calls:
                 status = "[red]error[/red]" if tc.error else "[green]ok[/green]"
-                self.console.print(f"  {tc.name} {status}")
+                pieces.append(f"  {tc.name} {status}")
 
                 # Show error details
                 if tc.error and verbose:
-                    self.console.print(f"    [dim red]{tc.error[:200]}[/dim red]")
+                    pieces.append(f"    [dim red]{tc.error[:200]}[/dim red]")
 
-            self.console.print()
+            pieces.append("")
 
         # Execution metrics
-        self.console.print("[bold]Execution Metrics[/bold]")
-        self.console.print(f"Duration: {result.trace.duration_seconds:.1f}s")
-        self.console.print(f"Turns: {result.trace.num_turns}", end="")
-        if result.trace.hit_turn_limit:
-            self.console.print(" [yellow](hit limit)[/yellow]")
-        else:
-            self.console.print()
-        self.console.print(f"Input Tokens: {result.trace.usage.input_tokens:,}")
-        self.console.print(f"Output Tokens: {result.trace.usage.output_tokens:,}")
-        self.console.print(f"Tool Calls: {len(result.trace.tool_calls)}")
+        hit_limit = " [yellow](hit limit)[/yellow]" if trace.hit_turn_limit else ""
+        pieces.extend([
+            "[bold]Execution Metrics[/bold]",
+            f"Duration: {trace.duration_seconds:.1f}s",
+            f"Turns: {trace.num_turns}{hit_limit}",
+            f"Input Tokens: {usage.input_tokens:,}",
+            f"Output Tokens: {usage.output_tokens:,}",
+            f"Tool Calls: {len(trace.tool_calls)}",
+        ])
+
+        self.console.print(Group(*_coalesce_lines(pieces)))
 
     def print_analysis(
         self,
@@ -409,41 +992,42 @@ class Reporter:
             self.console.print("[yellow]No results match the filter criteria[/yellow]")
             return
 
-        self.console.print(f"\n[bold]ANALYSIS: {len(filtered)} results[/bold]")
-        self.console.print("=" * 60)
+        # Plain markup lines, joined and printed once at the end
+        lines = [f"\n[bold]ANALYSIS: {len(filtered)} results[/bold]", _SEPARATOR]
 
         # Group by task
-        by_task: dict[str, list[EvalResult]] = {}
-        for r in filtered:
-            by_task.setdefault(r.task_id, []).append(r)
+        by_task = _group_results(filtered, _TASK_KEY)
 
-        for task_id, task_results in sorted(by_task.items()):
+        for task_id, task_results in by_task.items():
             metrics = self._calculate_metrics(task_results)
             status = "[green]PASSING[/green]" if metrics.pass_rate >= 0.7 else "[red]FAILING[/red]"
 
-            self.console.print(f"\n[bold]{task_id}[/bold] {status}")
-            self.console.print(f"  Pass Rate: {metrics.pass_rate:.0%} ({metrics.passed}/{metrics.total_runs})")
-            self.console.print(f"  Avg Score: {metrics.avg_score:.2f}")
+            lines.append(f"\n[bold]{task_id}[/bold] {status}")
+            lines.append(f"  Pass Rate: {_rate_label(metrics.pass_rate)} ({metrics.passed}/{metrics.total_runs})")
+            lines.append(f"  Avg Score: {metrics.avg_score:.2f}")
 
-            # Show assertion breakdown
-            assertion_stats: dict[str, dict] = {}
+            # Show assertion breakdown; one [passed, total] pair per assertion
+            # keeps the tally to a single lookup per grade
+            stats: dict[str, list[int]] = {}
+            get_stats = stats.get
             for r in task_results:
                 for g in r.grades:
                     name = g.assertion_name or g.assertion_id
-                    if name not in assertion_stats:
-                        assertion_stats[name] = {"passed": 0, "total": 0}
-                    assertion_stats[name]["total"] += 1
-                    if g.passed:
-                        assertion_stats[name]["passed"] += 1
-
-            self.console.print("  [dim]Assertion breakdown:[/dim]")
-            for name, stats in assertion_stats.items():
-                rate = stats["passed"] / stats["total"] if stats["total"] > 0 else 0
+                    counts = get_stats(name)
+                    if counts is None:
+                        counts = stats[name] = [0, 0]
+                    counts[0] += g.passed
+                    counts[1] += 1
+
+            lines.append("  [dim]Assertion breakdown:[/dim]")
+            for name, (passed, total) in stats.items():
+                rate = passed / total
                 color = "green" if rate >= 0.7 else "yellow" if rate >= 0.5 else "red"
-                self.console.print(
-                    f"    [{color}]{name}[/{color}]: {stats['passed']}/{stats['total']} ({rate:.0%})"
-                )
+                lines.append(f"    [{color}]{name}[/{color}]: {passed}/{total} ({rate:.0%})")
+
+        self.console.print("\n".join(lines))
 
+    @_buffered
     def print_diff(
         self,
         results_a: list[EvalResult],
@@ -460,68 +1044,48 @@ class Reporter:
             label_b: Label for second set
         """
         self.console.print(f"\n[bold]DIFF: {label_a} vs {label_b}[/bold]")
-        self.console.print("=" * 60)
+        self.console.print(_SEPARATOR)
 
         # Group by task + config (no model)
         grouped_a = _group_results_by_key(results_a, include_model=False)
         grouped_b = _group_results_by_key(results_b, include_model=False)
 
-        all_keys = set(grouped_a.keys()) | set(grouped_b.keys())
-
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Task")
-        table.add_column("Config")
-        table.add_column(f"{label_a} Rate")
-        table.add_column(f"{label_b} Rate")
-        table.add_column("Delta")
-        table.add_column(f"{label_a} Tok")
-        table.add_column(f"{label_b} Tok")
-        table.add_column("Tok Δ%")
-        table.add_column("Winner")
-
-        for key in sorted(all_keys):
-            task_id, config = key
-
-            metrics_a = self._calculate_metrics(grouped_a.get(key, []))
-            metrics_b = self._calculate_metrics(grouped_b.get(key, []))
-
-            rate_a = metrics_a.pass_rate if grouped_a.get(key) else 0
-            rate_b = metrics_b.pass_rate if grouped_b.get(key) else 0
-            delta = rate_b - rate_a
-
-            rate_a_str = f"{rate_a:.0%}" if grouped_a.get(key) else "N/A"
-            rate_b_str = f"{rate_b:.0%}" if grouped_b.get(key) else "N/A"
-
-            # Token comparison
-            tokens_a = metrics_a.avg_tokens if grouped_a.get(key) else 0
-            tokens_b = metrics_b.avg_tokens if grouped_b.get(key) else 0
-            tokens_a_str = f"{tokens_a:,}" if grouped_a.get(key) else "N/A"
-            tokens_b_str = f"{tokens_b:,}" if grouped_b.get(key) else "N/A"
-
-            if tokens_a > 0:
-                tok_delta_pct = (tokens_b - tokens_a) / tokens_a * 100
-                if tok_delta_pct > 10:
-                    tok_delta_str = f"[red]+{tok_delta_pct:.0f}%[/red]"
-                elif tok_delta_pct < -10:
-                    tok_delta_str = f"[green]{tok_delta_pct:.0f}%[/green]"
-                else:
-                    tok_delta_str = f"{tok_delta_pct:+.0f}%"
-            else:
-                tok_delta_str = "N/A"
+        # Missing sides contribute zeros, matching the N/A cells below
+        keys, present_a, present_b = self._pair_metrics(grouped_a, grouped_b)
+
+        rate_delta = _metric_array(present_b, "pass_rate") - _metric_array(present_a, "pass_rate")
+        tokens_a = _metric_array(present_a, "avg_tokens")
+        tok_delta = _delta_pct(tokens_a, _metric_array(present_b, "avg_tokens"))
+        tok_bucket = _delta_bucket(tok_delta)
+
+        table = _make_table([
+            "Task", "Config", f"{label_a} Rate", f"{label_b} Rate", "Delta",
+            f"{label_a} Tok", f"{label_b} Tok", "Tok Δ%", "Winner",
+        ])
+
+        for i, (task_id, config) in enumerate(keys):
+            a, b = present_a[i], present_b[i]
+            delta = rate_delta[i]
+
+            rate_a_str = _rate_label(a.pass_rate) if a else "N/A"
+            rate_b_str = _rate_label(b.pass_rate) if b else "N/A"
+            tokens_a_str = f"{a.avg_tokens:,}" if a else "N/A"
+            tokens_b_str = f"{b.avg_tokens:,}" if b else "N/A"
 
             if delta > 0.05:
-                delta_str = f"[green]+{delta:.0%}[/green]"
-                winner = f"[green]{label_b}[/green]"
+                delta_str = Text(f"+{delta:.0%}", style="green")
+                winner = Text(label_b, style="green")
             elif delta < -0.05:
-                delta_str = f"[red]{delta:.0%}[/red]"
-                winner = f"[green]{label_a}[/green]"
+                delta_str = Text(f"{delta:.0%}", style="red")
+                winner = Text(label_a, style="green")
             else:
                 delta_str = f"{delta:.0%}"
-                winner = "[dim]tie[/dim]"
+                winner = Text("tie", style="dim")
 
             table.add_row(
                 task_id, config, rate_a_str, rate_b_str, delta_str,
-                tokens_a_str, tokens_b_str, tok_delta_str, winner
+                tokens_a_str, tokens_b_str,
+                _efficiency_delta_cell(tok_delta[i], tok_bucket[i]), winner,
             )
 
         self.console.print(table)
@@ -532,81 +1096,87 @@ class Reporter:
         Args:
             result: Result to explain in detail
         """
-        self.console.print(f"\n[bold]DEEP DIVE: {result.task_id}[/bold]")
-        self.console.print("=" * 60)
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
+        trace = result.trace
+        usage = trace.usage
+
+        # Collected and printed as one Group so the console renders once
+        pieces: list[Any] = [
+            f"\n[bold]DEEP DIVE: {result.task_id}[/bold]",
+            _SEPARATOR,
+        ]
 
         # Config used
-        self.console.print("\n[bold]Configuration[/bold]")
-        self.console.print(f"  Config: {result.config_name}")
-        self.console.print(f"  Model: {result.model}")
-        self.console.print(f"  Max Turns: {result.trace.max_turns}")
-        if result.trace.config_snapshot.claude_md:
-            self.console.print(
-                f"  CLAUDE.md Preview: {result.trace.config_snapshot.claude_md[:100]}..."
-            )
+        pieces.append("\n[bold]Configuration[/bold]")
+        pieces.append(f"  Config: {result.config_name}")
+        pieces.append(f"  Model: {result.model}")
+        pieces.append(f"  Max Turns: {trace.max_turns}")
+        claude_md = trace.config_snapshot.claude_md
+        if claude_md:
+            pieces.append(f"  CLAUDE.md Preview: {_preview(claude_md, 100)}")
 
         # Prompt sent
-        if result.trace.claude_prompt:
-            self.console.print("\n[bold]Prompt Sent[/bold]")
-            self.console.print(
+        if trace.claude_prompt:
+            pieces.append("\n[bold]Prompt Sent[/bold]")
+            pieces.append(
                 Panel(
-                    result.trace.claude_prompt[:2000] + ("..." if len(result.trace.claude_prompt) > 2000 else ""),
+                    _preview(trace.claude_prompt, 2000),
                     border_style="blue",
                 )
             )
 
         # Claude's response
-        if result.trace.claude_response:
-            self.console.print("\n[bold]Claude's Response[/bold]")
-            self.console.print(
+        if trace.claude_response:
+            pieces.append("\n[bold]Claude's Response[/bold]")
+            pieces.append(
                 Panel(
-                    result.trace.claude_response[:3000] + ("..." if len(result.trace.claude_response) > 3000 else ""),
+                    _preview(trace.claude_response, 3000),
                     border_style="green",
                 )
             )
 
         # File changes with full diffs
-        if result.trace.file_changes:
-            self.console.print("\n[bold]File Changes (Full Diffs)[/bold]")
-            for fc in result.trace.file_changes:
-                self.console.print(f"\n  [bold]{fc.action.upper()}:[/bold] {fc.path}")
+        if trace.file_changes:
+            pieces.append("\n[bold]File Changes (Full Diffs)[/bold]")
+            for fc in trace.file_changes:
+                pieces.append(f"\n  [bold]{fc.action.upper()}:[/bold] {fc.path}")
                 if fc.diff:
-                    self.console.print(
+                    pieces.append(
                         Syntax(fc.diff, "diff", theme="monokai", line_numbers=False)
                     )
                 elif fc.content_after:
                     # Show first part of created file
-                    preview = fc.content_after[:1000]
-                    if len(fc.content_after) > 1000:
-                        preview += "\n... (truncated)"
-                    self.console.print(
+                    preview = _preview(fc.content_after, 1000, suffix="\n... (truncated)")
+                    pieces.append(
                         Panel(preview, title="New File Content", border_style="green")
                     )
 
         # Full grading details
-        self.console.print("\n[bold]Grading Details[/bold]")
+        pieces.append("\n[bold]Grading Details[/bold]")
         for grade in result.grades:
             name = grade.assertion_name or grade.assertion_id
             icon = "✓" if grade.passed else "✗"
             color = "green" if grade.passed else "red"
 
-            self.console.print(f"\n  [{color}]{icon} {name}[/{color}] (score: {grade.score:.2f})")
+            pieces.append(f"\n  [{color}]{icon} {name}[/{color}] (score: {grade.score:.2f})")
 
             if grade.reasoning:
-                self.console.print(f"    [dim]Reasoning: {grade.reasoning}[/dim]")
+                pieces.append(f"    [dim]Reasoning: {grade.reasoning}[/dim]")
 
             # Show criteria breakdown for LLM grades
             if grade.criteria_scores:
-                self.console.print("    [dim]Criteria Breakdown:[/dim]")
+                pieces.append("    [dim]Criteria Breakdown:[/dim]")
                 for cs in grade.criteria_scores:
-                    self.console.print(f"      - {cs.criterion}: {cs.score:.2f}")
+                    pieces.append(f"      - {cs.criterion}: {cs.score:.2f}")
                     if cs.reasoning:
-                        self.console.print(f"        [dim]{cs.reasoning}[/dim]")
+                        pieces.append(f"        [dim]{cs.reasoning}[/dim]")
 
             # Show full output
             if grade.full_output:
-                self.console.print("\n    [bold]Full Output:[/bold]")
-                self.console.print(
+                pieces.append("\n    [bold]Full Output:[/bold]")
+                pieces.append(
                     Panel(
                         grade.full_output,
                         border_style="dim",
@@ -615,39 +1185,65 @@ class Reporter:
 
             # Show grading prompt for LLM grades
             if grade.grading_prompt:
-                self.console.print("\n    [bold]Grading Prompt Used:[/bold]")
-                self.console.print(
+                pieces.append("\n    [bold]Grading Prompt Used:[/bold]")
+                pieces.append(
                     Panel(
-                        grade.grading_prompt[:3000] + ("..." if len(grade.grading_prompt) > 3000 else ""),
+                        _preview(grade.grading_prompt, 3000),
                         border_style="dim cyan",
                     )
                 )
 
         # Execution summary
-        self.console.print("\n[bold]Execution Summary[/bold]")
-        self.console.print(f"  Duration: {result.trace.duration_seconds:.1f}s")
-        self.console.print(f"  Turns: {result.trace.num_turns}/{result.trace.max_turns}")
-        self.console.print(f"  Hit Turn Limit: {'Yes' if result.trace.hit_turn_limit else 'No'}")
-        self.console.print(f"  Total Tokens: {result.trace.usage.total_tokens:,}")
-        self.console.print(f"  Tool Calls: {len(result.trace.tool_calls)}")
+        pieces.append("\n[bold]Execution Summary[/bold]")
+        pieces.append(f"  Duration: {trace.duration_seconds:.1f}s")
+        pieces.append(f"  Turns: {trace.num_turns}/{trace.max_turns}")
+        pieces.append(f"  Hit Turn Limit: {'Yes' if trace.hit_turn_limit else 'No'}")
+        pieces.append(f"  Total Tokens: {usage.total_tokens:,}")
+        pieces.append(f"  Tool Calls: {len(trace.tool_calls)}")
+
+        if trace.is_error:
+            pieces.append(f"\n  [red]EXECUTION ERROR:[/red] {trace.result}")
 
-        if result.trace.is_error:
-            self.console.print(f"\n  [red]EXECUTION ERROR:[/red] {result.trace.result}")
+        self.console.print(Group(*_coalesce_lines(pieces)))
 
-    def export_json(self, results: list[EvalResult], path: Path) -> None:
+    def export_json(
+        self, results: list[EvalResult], path: Path, indent: int | None = None
+    ) -> None:
         """Export results to JSON file.
 
         Args:
             results: Results to export
             path: Output path
+            indent: Pretty-print with this indent. Compact output (the default)
+                is streamed in batches; indented output is built in memory.
         """
-        data = {
+        header = {
             "timestamp": datetime.now().isoformat(),
             "num_results": len(results),
             "summary": self._generate_summary_dict(results),
-            "results": [r.model_dump(mode="json") for r in results],
         }
-        path.write_text(json.dumps(data, indent=2, default=str))
+        if indent is not None:
+            header["results"] = _RESULTS_ADAPTER.dump_python(results, mode="json")
+            path.write_text(json.dumps(header, indent=indent, default=str) + "\n")
+            self.console.print(f"[green]Results exported to {path}[/green]")
+            return
+
+        # Stream fixed-size batches serialized straight to bytes by
+        # pydantic-core, so peak memory is bounded by one batch and no
+        # intermediate dicts are built for the results. This stays serial:
+        # the serializer holds the GIL, so threads don't overlap it, and
+        # pickling results to worker processes costs several times more
+        # than serializing them here.
+        with path.open("wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(json_bytes(header)[:-1])
+            f.write(b',"results":[')
+            for start in range(0, len(results), _EXPORT_BATCH_SIZE):
+                if start:
+                    f.write(b",")
+                f.write(b"\n")
+                # Strip the enclosing brackets so batches splice into one array
+                f.write(_RESULTS_ADAPTER.dump_json(results[start : start + _EXPORT_BATCH_SIZE])[1:-1])
+            f.write(b"\n]}\n")
         self.console.print(f"[green]Results exported to {path}[/green]")
 
     def _generate_summary_dict(self, results: list[EvalResult]) -> dict:
@@ -674,88 +1270,85 @@ class Reporter:
         current: list[EvalResult],
         threshold: float = 0.05,
         require_significance: bool = True,
+        *,
+        baseline_grouped: dict[tuple, list[EvalResult]] | None = None,
+        current_grouped: dict[tuple, list[EvalResult]] | None = None,
+        full_report: bool = True,
     ) -> tuple[bool, dict]:
         """Check for regressions between baseline and current results.
 
         Uses statistical significance testing (Mann-Whitney U) to reduce
         false positives from random variance.
 
+        Passing the same precomputed groups used for print_regression_comparison
+        skips regrouping and lets per-group metrics come from the cache.
+
+        With full_report=False only the pass/fail answer is computed: the
+        check stops at the first regression and the returned dict holds just
+        has_regressions, threshold and require_significance.
+
         Args:
             baseline: Previous baseline results
             current: Current results to compare
             threshold: Maximum acceptable drop in pass rate (default: 5%)
             require_significance: Require p < 0.05 for regression (default: True)
+            baseline_grouped: Precomputed group_results(baseline), if available
+            current_grouped: Precomputed group_results(current), if available
+            full_report: Build per-group comparison details (default: True)
 
         Returns:
             Tuple of (has_regressions, comparison_data)
         """
 
         # Group by task + config + model
-        baseline_grouped = _group_results_by_key(baseline)
-        current_grouped = _group_results_by_key(current)
+        if baseline_grouped is None:
+            baseline_grouped = _group_results_by_key(baseline)
+        if current_grouped is None:
+            current_grouped = _group_results_by_key(current)
+
+        if not full_report:
+            has_regressions = self._has_regression(
+                baseline_grouped, current_grouped, threshold, require_significance
+            )
+            return has_regressions, {
+                "has_regressions": has_regressions,
+                "threshold": threshold,
+                "require_significance": require_significance,
+            }
 
         regressions = []
         improvements = []
         all_comparisons = []
 
-        all_keys = set(baseline_grouped.keys()) | set(current_grouped.keys())
-
-        for key in sorted(all_keys):
-            task_id, config, model = key
-
-            baseline_results = baseline_grouped.get(key, [])
-            current_results = current_grouped.get(key, [])
+        keys, baseline_metrics, current_metrics = self._pair_metrics(
+            baseline_grouped, current_grouped
+        )
 
-            baseline_metrics = (
-                self._calculate_metrics(baseline_results)
-                if baseline_results
-                else None
+        # Significance tests for every key present on both sides, ranked
+        # together in one vectorized batch
+        paired = [
+            key for key in baseline_grouped.keys() & current_grouped.keys()
+            if baseline_grouped[key] and current_grouped[key]
+        ]
+        stat_comparisons = dict(
+            zip(
+                paired,
+                StatisticalAnalyzer.compare_configs_batch(
+                    [(baseline_grouped[key], current_grouped[key]) for key in paired]
+                ),
             )
-            current_metrics = (
-                self._calculate_metrics(current_results)
-                if current_results
-                else None
-            )
-
-            baseline_rate = baseline_metrics.pass_rate if baseline_metrics else 0
-            current_rate = current_metrics.pass_rate if current_metrics else 0
-            delta = current_rate - baseline_rate
-
-            # Run statistical comparison if both have results
-            stat_comparison = None
-            if baseline_results and current_results:
-                stat_comparison = StatisticalAnalyzer.compare_configs(
-                    baseline_results, current_results
-                )
-
-            comparison = {
-                "task_id": task_id,
-                "config": config,
-                "model": model,
-                "baseline_pass_rate": baseline_rate,
-                "current_pass_rate": current_rate,
-                "delta": delta,
-            }
-
-            # Add statistical details if available
-            if stat_comparison:
-                comparison["p_value"] = stat_comparison.p_value
-                comparison["effect_size"] = stat_comparison.effect_size
-                comparison["effect_magnitude"] = stat_comparison.effect_magnitude
-                comparison["is_significant"] = stat_comparison.is_significant
-                comparison["recommendation"] = stat_comparison.recommendation
+        )
 
+        for key, key_baseline, key_current in zip(keys, baseline_metrics, current_metrics):
+            comparison, is_regression, is_improvement = self._compare_group(
+                key,
+                key_baseline,
+                key_current,
+                stat_comparisons.get(key),
+                threshold,
+                require_significance,
+            )
             all_comparisons.append(comparison)
-
-            # Check for regression with optional significance requirement
-            is_regression = delta < -threshold
-            if require_significance and stat_comparison:
-                is_regression = is_regression and stat_comparison.is_significant
-
-            is_improvement = delta > threshold
-            if require_significance and stat_comparison:
-                is_improvement = is_improvement and stat_comparison.is_significant
-
             if is_regression:
                 regressions.append(comparison)
             elif is_improvement:
@@ -774,6 +1367,90 @@ class Reporter:
             "comparisons": all_comparisons,
         }
 
+    def _has_regression(
+        self,
+        baseline_grouped: dict[tuple, list[EvalResult]],
+        current_grouped: dict[tuple, list[EvalResult]],
+        threshold: float,
+        require_significance: bool,
+    ) -> bool:
+        """Whether any group regresses, using the same rule as _compare_group.
+
+        Pass rates for all groups come from one batched aggregation, and the
+        significance test only runs for groups whose drop exceeds threshold,
+        in key order, until one is confirmed.
+        """
+        keys, baseline_metrics, current_metrics = self._pair_metrics(
+            baseline_grouped, current_grouped
+        )
+        rate_delta = _metric_array(current_metrics, "pass_rate") - _metric_array(
+            baseline_metrics, "pass_rate"
+        )
+        for i in np.flatnonzero(rate_delta < -threshold):
+            key = keys[i]
+            baseline_results = baseline_grouped.get(key)
+            current_results = current_grouped.get(key)
+            # Groups missing a side have no significance test to consult
+            if not (require_significance and baseline_results and current_results):
+                return True
+            if self._compare_cached(
+                StatisticalAnalyzer.compare_configs, baseline_results, current_results
+            ).is_significant:
+                return True
+        return False
+
+    def _compare_group(
+        self,
+        key: tuple,
+        baseline_metrics: AggregatedMetrics | None,
+        current_metrics: AggregatedMetrics | None,
+        stat_comparison: ComparisonResult | None,
+        threshold: float,
+        require_significance: bool,
+    ) -> tuple[dict, bool, bool]:
+        """Compare one (task, config, model) group for check_regression.
+
+        The metrics are None for a side with no results, and stat_comparison
+        is the group's precomputed significance test, or None when either
+        side has no results.
+
+        Returns:
+            Tuple of (comparison dict, is_regression, is_improvement)
+        """
+        task_id, config, model = key
+
+        baseline_rate = baseline_metrics.pass_rate if baseline_metrics else 0
+        current_rate = current_metrics.pass_rate if current_metrics else 0
+        delta = current_rate - baseline_rate
+
+        comparison = {
+            "task_id": task_id,
+            "config": config,
+            "model": model,
+            "baseline_pass_rate": baseline_rate,
+            "current_pass_rate": current_rate,
+            "delta": delta,
+        }
+
+        # Add statistical details if available
+        if stat_comparison:
+            comparison["p_value"] = stat_comparison.p_value
+            comparison["effect_size"] = stat_comparison.effect_size
+            comparison["effect_magnitude"] = stat_comparison.effect_magnitude
+            comparison["is_significant"] = stat_comparison.is_significant
+            comparison["recommendation"] = stat_comparison.recommendation
+
+        # Check for regression with optional significance requirement
+        is_regression = delta < -threshold
+        if require_significance and stat_comparison:
+            is_regression = is_regression and stat_comparison.is_significant
+
+        is_improvement = delta > threshold
+        if require_significance and stat_comparison:
+            is_improvement = is_improvement and stat_comparison.is_significant
+
+        return comparison, is_regression, is_improvement
+
     def print_statistical_comparison(
         self,
         results_a: list[EvalResult],
@@ -794,128 +1471,172 @@ class Reporter:
             show_cost: Include cost comparison (default: False)
 
         Returns:
-            Tuple of (ComparisonResult, EfficiencyComparison or None)
+            Tuple of (ComparisonResult, EfficiencyComparison or None). With
+            fewer than StatisticalAnalyzer.MIN_SAMPLES_FOR_TEST runs on either
+            side the score test is skipped and the comparison has a NaN
+            p-value; efficiency is still compared when requested.
         """
-        comparison = StatisticalAnalyzer.compare_configs(results_a, results_b)
-
-        self.console.print(f"\n[bold]STATISTICAL COMPARISON: {label_a} vs {label_b}[/bold]")
-        self.console.print("=" * 60)
-
-        # Summary table
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("Metric")
-        table.add_column(label_a)
-        table.add_column(label_b)
-        table.add_column("Delta")
-
-        table.add_row(
-            "Mean Score",
-            f"{comparison.mean_a:.3f}",
-            f"{comparison.mean_b:.3f}",
-            f"{comparison.delta:+.3f}",
-        )
-        table.add_row(
-            "Sample Size",
-            str(comparison.n_a),
-            str(comparison.n_b),
-            "",
-        )
-        self.console.print(table)
+        # Collected and printed as one Group so the console renders once
+        pieces: list[Any] = [
+            _STAT_COMPARISON_HEADER.format(a=label_a, b=label_b),
+            _SEPARATOR,
+        ]
+
+        min_n = min(len(results_a), len(results_b))
+        if min_n < StatisticalAnalyzer.MIN_SAMPLES_FOR_TEST:
+            comparison = StatisticalAnalyzer.insufficient_samples(results_a, results_b)
+            pieces.extend([
+                f"[yellow]Insufficient sample size (n={min_n}); "
+                "statistical tests skipped.[/yellow]",
+                f"  Mean Score: {comparison.mean_a:.3f} → {comparison.mean_b:.3f} "
+                f"({comparison.delta:+.3f})",
+            ])
+        else:
+            comparison = self._compare_cached(
+                StatisticalAnalyzer.compare_configs, results_a, results_b
+            )
 
-        # Statistical test results
-        self.console.print("\n[bold]Statistical Test (Mann-Whitney U)[/bold]")
-        sig_color = "green" if comparison.is_significant else "yellow"
-        self.console.print(f"  U-statistic: {comparison.statistic:.2f}")
-        self.console.print(f"  p-value: {comparison.p_value:.4f}")
-        self.console.print(
-            f"  Significant: [{sig_color}]{'Yes' if comparison.is_significant else 'No'}[/{sig_color}] (alpha=0.05)"
-        )
+            # Summary table
+            table = _make_summary_table(label_a, label_b)
 
-        # Effect size
-        self.console.print("\n[bold]Effect Size (Cohen's d)[/bold]")
-        self.console.print(f"  Effect size: {comparison.effect_size:.3f}")
-        self.console.print(f"  Magnitude: {comparison.effect_magnitude}")
+            table.add_row(
+                "Mean Score",
+                f"{comparison.mean_a:.3f}",
+                f"{comparison.mean_b:.3f}",
+                f"{comparison.delta:+.3f}",
+            )
+            table.add_row(
+                "Sample Size",
+                str(comparison.n_a),
+                str(comparison.n_b),
+                "",
+            )
+            pieces.append(table)
+
+            # Statistical test results
+            sig_color = "green" if comparison.is_significant else "yellow"
+            pieces.extend([
+                "\n[bold]Statistical Test (Mann-Whitney U)[/bold]",
+                f"  U-statistic: {comparison.statistic:.2f}",
+                f"  p-value: {comparison.p_value:.4f}",
+                f"  Significant: [{sig_color}]{'Yes' if comparison.is_significant else 'No'}[/{sig_color}] (alpha=0.05)",
+            ])
+
+            # Effect size
+            pieces.extend([
+                "\n[bold]Effect Size (Cohen's d)[/bold]",
+                f"  Effect size: {comparison.effect_size:.3f}",
+                f"  Magnitude: {comparison.effect_magnitude}",
+            ])
 
         # Efficiency analysis
         efficiency: EfficiencyComparison | None = None
         if show_efficiency:
-            efficiency = StatisticalAnalyzer.compare_efficiency(results_a, results_b)
-            self._print_efficiency_comparison(efficiency, label_a, label_b, show_cost)
+            efficiency = self._compare_cached(
+                StatisticalAnalyzer.compare_efficiency, results_a, results_b
+            )
+            pieces.extend(
+                self._efficiency_comparison_lines(efficiency, label_a, label_b, show_cost)
+            )
 
         # Recommendation
-        self.console.print("\n[bold]Recommendation[/bold]")
-        self.console.print(f"  {comparison.recommendation}")
+        pieces.extend(["\n[bold]Recommendation[/bold]", f"  {comparison.recommendation}"])
         if efficiency:
-            self.console.print(f"  {efficiency.recommendation}")
+            pieces.append(f"  {efficiency.recommendation}")
+
+        self.console.print(Group(*_coalesce_lines(pieces)))
 
         return comparison, efficiency
 
-    def _print_efficiency_comparison(
+    def print_quick_comparison(
+        self,
+        results_a: list[EvalResult],
+        results_b: list[EvalResult],
+        label_a: str = "Baseline",
+        label_b: str = "Current",
+    ) -> tuple[float, float]:
+        """Print only the mean score delta between two result sets.
+
+        A cheap alternative to print_statistical_comparison for summary
+        views: no significance test, effect size or efficiency analysis.
+
+        Args:
+            results_a: First result set
+            results_b: Second result set
+            label_a: Label for first set
+            label_b: Label for second set
+
+        Returns:
+            Tuple of (mean_a, mean_b), 0.0 for an empty set
+        """
+        scores_a = np.fromiter((r.overall_score for r in results_a), float, len(results_a))
+        scores_b = np.fromiter((r.overall_score for r in results_b), float, len(results_b))
+        mean_a = float(scores_a.mean()) if len(scores_a) else 0.0
+        mean_b = float(scores_b.mean()) if len(scores_b) else 0.0
+        delta = mean_b - mean_a
+        style = "green" if delta > 0 else "red" if delta < 0 else "dim"
+
+        self.console.print(
+            Text.assemble(
+                f"{label_a} → {label_b}: {mean_a:.3f} → {mean_b:.3f} (",
+                (f"{delta:+.3f}", style),
+                f", n={len(scores_a)}/{len(scores_b)})",
+            )
+        )
+        return mean_a, mean_b
+
+    def _efficiency_comparison_lines(
         self,
         efficiency: EfficiencyComparison,
         label_a: str,  # noqa: ARG002
         label_b: str,  # noqa: ARG002
         show_cost: bool = False,
-    ) -> None:
-        """Print efficiency comparison section."""
+    ) -> list[Any]:
+        """Build the renderables for the efficiency comparison section."""
         # label_a and label_b reserved for future use in table headers
-        self.console.print("\n[bold]Efficiency Analysis[/bold]")
+        lines: list[Any] = ["\n[bold]Efficiency Analysis[/bold]"]
 
         # Tokens
-        tok_delta_pct = efficiency.tokens_delta_pct
-        tok_p = efficiency.tokens_p_value
-        tok_sig = "*" if tok_p is not None and tok_p < 0.05 else ""
-        tok_sig += "*" if tok_p is not None and tok_p < 0.01 else ""
-
-        if tok_delta_pct < -10:
-            tok_color = "green"
-            tok_direction = f"{abs(tok_delta_pct):.1f}% fewer"
-        elif tok_delta_pct > 10:
-            tok_color = "red"
-            tok_direction = f"+{tok_delta_pct:.1f}% more"
-        else:
-            tok_color = "dim"
-            tok_direction = f"{tok_delta_pct:+.1f}%"
+        tok_color, tok_direction = _classify_delta(
+            efficiency.tokens_delta_pct, 10, _TOKEN_DELTA_STYLES
+        )
 
-        tok_p_str = f"p={tok_p:.3f}{tok_sig}" if tok_p is not None else "p=N/A"
-        self.console.print(
-            f"  Tokens:   {efficiency.tokens_a_mean:,.0f} → {efficiency.tokens_b_mean:,.0f} "
-            f"([{tok_color}]{tok_direction}[/{tok_color}], {tok_p_str})"
+        # Styled segments are assembled directly rather than parsed from markup
+        lines.append(
+            Text.assemble(
+                f"  Tokens:   {_fmt_thousands(efficiency.tokens_a_mean)} → "
+                f"{_fmt_thousands(efficiency.tokens_b_mean)} (",
+                (tok_direction, tok_color),
+                f", {_p_value_label(efficiency.tokens_p_value)})",
+            )
         )
 
         # Duration
-        dur_delta_pct = efficiency.duration_delta_pct
-        dur_p = efficiency.duration_p_value
-        dur_sig = "*" if dur_p is not None and dur_p < 0.05 else ""
-        dur_sig += "*" if dur_p is not None and dur_p < 0.01 else ""
-
-        if dur_delta_pct < -10:
-            dur_color = "green"
-            dur_direction = f"{abs(dur_delta_pct):.1f}% faster"
-        elif dur_delta_pct > 10:
-            dur_color = "red"
-            dur_direction = f"+{dur_delta_pct:.1f}% slower"
-        else:
-            dur_color = "dim"
-            dur_direction = f"{dur_delta_pct:+.1f}%"
+        dur_color, dur_direction = _classify_delta(
+            efficiency.duration_delta_pct, 10, _DURATION_DELTA_STYLES
+        )
 
-        dur_p_str = f"p={dur_p:.3f}{dur_sig}" if dur_p is not None else "p=N/A"
-        self.console.print(
-            f"  Duration: {efficiency.duration_a_mean:.1f}s → {efficiency.duration_b_mean:.1f}s "
-            f"([{dur_color}]{dur_direction}[/{dur_color}], {dur_p_str})"
+        lines.append(
+            Text.assemble(
+                f"  Duration: {efficiency.duration_a_mean:.1f}s → {efficiency.duration_b_mean:.1f}s (",
+                (dur_direction, dur_color),
+                f", {_p_value_label(efficiency.duration_p_value)})",
+            )
         )
 
         # Cost (optional)
         if show_cost:
             cost_delta_pct = efficiency.cost_delta_pct
-            if cost_delta_pct < -5:
-                cost_color = "green"
-            elif cost_delta_pct > 5:
-                cost_color = "red"
-            else:
-                cost_color = "dim"
+            cost_color, cost_direction = _classify_delta(
+                cost_delta_pct, 5, _COST_DELTA_STYLES
+            )
 
-            self.console.print(
-                f"  Cost:     ${efficiency.cost_a_mean:.4f} → ${efficiency.cost_b_mean:.4f} "
-                f"([{cost_color}]{cost_delta_pct:+.1f}%[/{cost_color}])"
+            lines.append(
+                Text.assemble(
+                    f"  Cost:     ${efficiency.cost_a_mean:.4f} → ${efficiency.cost_b_mean:.4f} (",
+                    (cost_direction, cost_color),
+                    ")",
+                )
             )
+
+        return lines
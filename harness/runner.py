@@ -1,29 +1,59 @@
 """Main evaluation runner orchestrating the test matrix."""
 
-import hashlib
-import json
+import asyncio
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, ExitStack
 from datetime import datetime
+import functools
+import hashlib
+from itertools import islice
+import os
 from pathlib import Path
+import threading
+from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml; use the pure-Python loader
+    from yaml import SafeLoader as _YamlLoader
+
 from harness.executor import ClaudeExecutor, Executor
 from harness.graders.composite_grader import CompositeGrader
-from harness.isolator import EnvironmentIsolator
+from harness.isolator import EnvironmentIsolator, IsolatedEnv
+from harness.json_io import json_bytes, json_loads
 from harness.models import (
     AssertionType,
-    CodeAssertion,
-    CodeCheckType,
     Config,
     ConfigSnapshot,
     EvalResult,
-    LLMAssertion,
     Task,
-    TaskCategory,
-    TaskDifficulty,
 )
 
 
+_ASSERTION_TYPES = frozenset(t.value for t in AssertionType)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; mtime_ns and size only key the cache."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_yaml(path: Path) -> Any:
+    """Safely load a YAML file, memoized while its mtime and size are unchanged.
+
+    Long-running sessions reload the same task and config files repeatedly;
+    a stat per file replaces a parse. The returned data is shared between
+    callers and must not be modified.
+    """
+    st = path.stat()
+    return _parse_yaml(str(path), st.st_mtime_ns, st.st_size)
+
+
 class EvalRunner:
     """Orchestrates evaluation runs across tasks, configs, and models."""
 
@@ -36,6 +66,7 @@ class EvalRunner:
         use_container: bool = False,
         preserve_artifacts: bool = False,
         artifacts_dir: Path | None = None,
+        reuse_environments: bool = False,
     ):
         """Initialize the runner.
 
@@ -47,8 +78,12 @@ class EvalRunner:
             use_container: Whether to run evaluations in Docker containers
             preserve_artifacts: Whether to preserve full artifacts from each run
             artifacts_dir: Directory to store artifacts (default: evals/artifacts)
+            reuse_environments: In sequential matrix runs, reset one environment
+                in place between repeated runs of a task/config instead of
+                copying the fixture for every run (concurrent runs reject it)
         """
         self.use_container = use_container
+        self.reuse_environments = reuse_environments
         self.preserve_artifacts = preserve_artifacts
         self.artifacts_dir = artifacts_dir or Path("evals/artifacts")
 
@@ -69,11 +104,17 @@ class EvalRunner:
         if preserve_artifacts:
             self.artifacts_dir.mkdir(parents=True, exist_ok=True)
 
+        # fixture path -> snapshot of a fresh copy
+        self._snapshot_cache: dict[Path, dict[str, str]] = {}
+        self._snapshot_lock = threading.Lock()
+
     def run_single(
         self,
         task: Task,
         config: Config,
         run_index: int = 0,
+        config_snapshot: ConfigSnapshot | None = None,
+        env: IsolatedEnv | None = None,
     ) -> EvalResult:
         """Run a single task with a single config.
 
@@ -81,19 +122,20 @@ class EvalRunner:
             task: Task to evaluate
             config: Configuration to use
             run_index: Index of this run (for repeated runs)
+            config_snapshot: Snapshot of config to record on the trace, if
+                already built (shared across repeated runs of a config)
+            env: Fresh environment to run in; the caller keeps ownership. By
+                default a new environment is created and cleaned up.
 
         Returns:
             EvalResult with scores and trace
         """
-        # Create isolated environment
-        with self.isolator.create_environment(
-            fixture_path=task.fixture_path,
-            claude_md=config.claude_md,
-            skills_path=config.skills_path,
-            agents_md=config.agents_md,
-        ) as env:
+        with ExitStack() as stack:
+            if env is None:
+                # Create isolated environment
+                env = stack.enter_context(self._create_environment(task, config))
             # Snapshot files before execution
-            before_state = self.isolator.snapshot_files(env.path)
+            before_state = self._fixture_snapshot(task, env.path)
 
             # Execute the prompt
             trace = self.executor.run(
@@ -106,12 +148,7 @@ class EvalRunner:
             # Capture file changes
             trace.file_changes = self.isolator.diff_files(before_state, env.path)
             trace.claude_prompt = task.prompt
-            trace.config_snapshot = ConfigSnapshot(
-                model=config.model,
-                claude_md=config.claude_md[:200] if config.claude_md else None,
-                skills_path=str(config.skills_path) if config.skills_path else None,
-                max_turns=config.max_turns,
-            )
+            trace.config_snapshot = config_snapshot or self._config_snapshot(config)
             trace.max_turns = config.max_turns
             trace.hit_turn_limit = trace.num_turns >= config.max_turns
 
@@ -148,8 +185,61 @@ class EvalRunner:
                     claude_output=trace.raw_output,
                 )
 
+            # Keep oversized outputs out of memory and the results files
+            result.spill_outputs(self.artifacts_dir / "outputs")
             return result
 
+    def _create_environment(self, task: Task, config: Config) -> IsolatedEnv:
+        """Create a fresh isolated environment for task under config."""
+        return self.isolator.create_environment(
+            fixture_path=task.fixture_path,
+            claude_md=config.claude_md,
+            skills_path=config.skills_path,
+            agents_md=config.agents_md,
+        )
+
+    @staticmethod
+    def _config_snapshot(config: Config) -> ConfigSnapshot:
+        """Build the ConfigSnapshot recorded on each run's trace."""
+        return ConfigSnapshot(
+            model=config.model,
+            claude_md=config.claude_md[:200] if config.claude_md else None,
+            skills_path=str(config.skills_path) if config.skills_path else None,
+            max_turns=config.max_turns,
+        )
+
+    def _fixture_snapshot(self, task: Task, env_path: Path) -> dict[str, str]:
+        """Snapshot a freshly created environment, cached per task fixture.
+
+        Tracked source files in a new environment come only from the fixture
+        (CLAUDE.md and agents.md aren't tracked, and skills live outside the
+        project dir), so every run of a task starts from the same snapshot.
+        A cached entry is reused while the stats of the files it recorded
+        still match the new environment (copytree preserves mtimes), so an
+        edit anywhere in the fixture takes a fresh snapshot. The returned
+        dict is shared between runs and must not be modified.
+
+        Args:
+            task: Task whose fixture was copied into env_path
+            env_path: Path to the new evaluation environment
+
+        Returns:
+            Dict mapping relative path to file content
+        """
+        fixture = task.fixture_path
+        if fixture is None or not fixture.exists():
+            return self.isolator.snapshot_files(env_path)
+
+        with self._snapshot_lock:
+            cached = self._snapshot_cache.get(fixture)
+        if cached is not None and self.isolator.snapshot_is_current(cached, env_path):
+            return cached
+
+        snapshot = self.isolator.snapshot_files(env_path)
+        with self._snapshot_lock:
+            self._snapshot_cache[fixture] = snapshot
+        return snapshot
+
     def _generate_run_id(
         self,
         task: Task,
@@ -172,14 +262,52 @@ class EvalRunner:
         short_hash = hashlib.md5(content.encode()).hexdigest()[:8]
         return f"eval_{timestamp}_{short_hash}"
 
+    @staticmethod
+    def _iter_matrix(
+        tasks: list[Task],
+        configs: list[Config],
+        models: list[str] | None,
+        runs_per_combo: int,
+        limit: int | None,
+    ) -> Iterator[tuple[Task, Config, str, int, Config, ConfigSnapshot]]:
+        """Yield (task, config, model, run_index, config_with_model, snapshot) in matrix order.
+
+        config_with_model is a copy of config with its model overridden;
+        runs of the same combination share it. snapshot is its ConfigSnapshot,
+        built once per (config, model) and shared across tasks and runs.
+        Stops after limit runs.
+        """
+        snapshots: dict[tuple[int, str], ConfigSnapshot] = {}
+
+        def combinations() -> Iterator[tuple[Task, Config, str, int, Config, ConfigSnapshot]]:
+            for task in tasks:
+                for config_idx, config in enumerate(configs):
+                    for model in models or [config.model]:
+                        # Create config variant with this model
+                        config_with_model = config.model_copy()
+                        config_with_model.model = model
+                        snapshot = snapshots.get((config_idx, model))
+                        if snapshot is None:
+                            snapshot = EvalRunner._config_snapshot(config_with_model)
+                            snapshots[config_idx, model] = snapshot
+                        for run_idx in range(runs_per_combo):
+                            yield task, config, model, run_idx, config_with_model, snapshot
+
+        if limit is None:
+            return combinations()
+        return islice(combinations(), max(limit, 0))
+
     def run_matrix(
         self,
         tasks: list[Task],
         configs: list[Config],
         models: list[str] | None = None,
         runs_per_combo: int = 3,
-        callback=None,
+        callback: Callable | None = None,
         limit: int | None = None,
+        concurrency: int = 1,
+        stream_to: Path | None = None,
+        per_model_concurrency: int | None = None,
     ) -> list[EvalResult]:
         """Run full evaluation matrix.
 
@@ -190,103 +318,255 @@ class EvalRunner:
             runs_per_combo: Number of runs per combination
             callback: Optional callback(task, config, model, run, result) for progress
             limit: Optional limit on total number of runs (for quick testing)
+            concurrency: Number of runs to execute at once (default: 1, sequential)
+            stream_to: Optional JSONL file each result is appended to as soon
+                as it completes, so partial results survive an interrupted run
+                (see iter_results)
+            per_model_concurrency: Optional cap on concurrent runs per model,
+                when concurrency > 1 (default: no per-model cap)
 
         Returns:
-            List of all EvalResults
+            List of all EvalResults, in matrix order
+
+        Raises:
+            ValueError: If reuse_environments is set and concurrency > 1
         """
+        if concurrency > 1:
+            return asyncio.run(
+                self.arun_matrix(
+                    tasks, configs, models, runs_per_combo, callback, limit, concurrency,
+                    stream_to, per_model_concurrency,
+                )
+            )
+
         results = []
-        run_count = 0
+        with ExitStack() as stack:
+            stream = stack.enter_context(stream_to.open("ab")) if stream_to else None
+            # (task, config_with_model) the reused environment was built for;
+            # holding the objects keeps the identity check sound
+            env_owner: tuple[Task, Config] | None = None
+            env = None
+            stack.callback(lambda: env and env.cleanup())
+            for task, config, model, run_idx, config_with_model, snapshot in self._iter_matrix(
+                tasks, configs, models, runs_per_combo, limit
+            ):
+                if self.reuse_environments:
+                    if env_owner and env_owner[0] is task and env_owner[1] is config_with_model:
+                        self.isolator.reset_environment(
+                            env,
+                            fixture_path=task.fixture_path,
+                            claude_md=config_with_model.claude_md,
+                            skills_path=config_with_model.skills_path,
+                            agents_md=config_with_model.agents_md,
+                        )
+                    else:
+                        if env:
+                            env.cleanup()
+                        env = self._create_environment(task, config_with_model)
+                        env_owner = (task, config_with_model)
+
+                result = self.run_single(task, config_with_model, run_idx, snapshot, env)
+                results.append(result)
+                if stream:
+                    self._stream_result(stream, result)
+
+                if callback:
+                    callback(task, config, model, run_idx, result)
 
-        for task in tasks:
-            for config in configs:
-                models_to_test = models or [config.model]
+        return results
 
-                for model in models_to_test:
-                    # Create config variant with this model
-                    config_with_model = config.model_copy()
-                    config_with_model.model = model
+    async def arun_matrix(
+        self,
+        tasks: list[Task],
+        configs: list[Config],
+        models: list[str] | None = None,
+        runs_per_combo: int = 3,
+        callback: Callable | None = None,
+        limit: int | None = None,
+        concurrency: int = 8,
+        stream_to: Path | None = None,
+        per_model_concurrency: int | None = None,
+    ) -> list[EvalResult]:
+        """Run full evaluation matrix with up to `concurrency` runs in flight.
+
+        Each run_single call blocks on the executor subprocess and grader
+        API calls, so runs are dispatched to worker threads and overlap
+        their waiting. A semaphore bounds how many are in flight overall, and
+        optionally one semaphore per model bounds each model separately, since
+        providers rate-limit each model independently.
+
+        Args:
+            tasks: List of tasks to evaluate
+            configs: List of configs to test
+            models: List of models (overrides config.model if provided)
+            runs_per_combo: Number of runs per combination
+            callback: Optional callback(task, config, model, run, result), called
+                as each run completes (so not necessarily in matrix order)
+            limit: Optional limit on total number of runs (for quick testing)
+            concurrency: Maximum number of runs executing at once (default: 8)
+            stream_to: Optional JSONL file each result is appended to as soon
+                as it completes (in completion order)
+            per_model_concurrency: Optional maximum number of runs executing at
+                once for any single model (default: only the overall limit)
 
-                    for run_idx in range(runs_per_combo):
-                        # Check limit before running
-                        if limit is not None and run_count >= limit:
-                            return results
+        Returns:
+            List of all EvalResults, in matrix order regardless of completion order
 
-                        result = self.run_single(task, config_with_model, run_idx)
-                        results.append(result)
-                        run_count += 1
+        Raises:
+            ValueError: If reuse_environments is set, since concurrent runs
+                each need their own environment
+        """
+        if self.reuse_environments:
+            raise ValueError(
+                "reuse_environments only applies to sequential runs (concurrency=1)"
+            )
+        combos = list(self._iter_matrix(tasks, configs, models, runs_per_combo, limit))
+        results: list[EvalResult | None] = [None] * len(combos)
+        semaphore = asyncio.Semaphore(concurrency)
+        # Created here, inside the running loop, so they're never bound to a
+        # different event loop across arun_matrix calls
+        model_semaphores: dict[str, asyncio.Semaphore] = {}
+        loop = asyncio.get_running_loop()
+
+        with ExitStack() as stack:
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=concurrency))
+            stream = stack.enter_context(stream_to.open("ab")) if stream_to else None
+
+            async def run_one(i: int) -> None:
+                task, config, model, run_idx, config_with_model, snapshot = combos[i]
+                async with AsyncExitStack() as limits:
+                    # Wait for the model's slot first so a run blocked on its
+                    # model doesn't hold one of the overall slots
+                    if per_model_concurrency:
+                        if model not in model_semaphores:
+                            model_semaphores[model] = asyncio.Semaphore(per_model_concurrency)
+                        await limits.enter_async_context(model_semaphores[model])
+                    await limits.enter_async_context(semaphore)
+                    result = await loop.run_in_executor(
+                        pool,
+                        functools.partial(
+                            self.run_single, task, config_with_model, run_idx, snapshot
+                        ),
+                    )
+                # Indexed store keeps matrix order independent of completion order
+                results[i] = result
+                if stream:
+                    # Runs on the event loop thread, so writes never interleave
+                    self._stream_result(stream, result)
+                if callback:
+                    callback(task, config, model, run_idx, result)
 
-                        if callback:
-                            callback(task, config, model, run_idx, result)
+            await asyncio.gather(*(run_one(i) for i in range(len(combos))))
 
         return results
 
+    @staticmethod
+    def _stream_result(stream, result: EvalResult) -> None:
+        """Append one result to an open JSONL stream and force it to disk."""
+        stream.write(json_bytes(result.model_dump(mode="json")) + b"\n")
+        stream.flush()
+        os.fsync(stream.fileno())
+
     def save_results(
         self,
         results: list[EvalResult],
         filename: str | None = None,
-        save_debug: bool = True,
+        save_debug: bool = False,
     ) -> Path:
         """Save results to JSON file.
 
         Args:
             results: Results to save
             filename: Optional filename (default: timestamped)
-            save_debug: Whether to save detailed debug log (default: True)
+            save_debug: Whether to also write a detailed .debug.jsonl log
+                (default: False)
 
         Returns:
             Path to saved file
         """
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"results_{timestamp}.json"
+            filename = f"results_{now:%Y%m%d_%H%M%S}.json"
 
         output_path = self.results_dir / filename
+        header = {"timestamp": now.isoformat(), "num_results": len(results)}
+
+        # Stream one result per line so only a single result's dump is held
+        # at a time. Each result is dumped once: the summary line is written
+        # first, then the same dict is extended for the debug log.
+        with ExitStack() as stack:
+            out = stack.enter_context(output_path.open("wb"))
+            debug = None
+            if save_debug:
+                # JSON Lines: a header with the execution summary, then one
+                # result per line, so single records can be read without
+                # parsing the whole log (see load_debug_result)
+                debug_path = output_path.with_suffix(".debug.jsonl")
+                debug = stack.enter_context(debug_path.open("wb"))
+                summary = self._build_execution_summary(results)
+                debug.write(json_bytes({**header, "execution_summary": summary}) + b"\n")
+
+            out.write(json_bytes(header)[:-1] + b', "results": [\n')
+            for i, r in enumerate(results):
+                data = r.model_dump(mode="json")
+                out.write((b",\n" if i else b"") + json_bytes(data))
+                if debug:
+                    debug_data = self._full_result_dump(r, data)
+                    debug.write(json_bytes(debug_data) + b"\n")
+            out.write(b"\n]}\n")
 
-        # Convert to JSON-serializable format (summary data)
-        data = {
-            "timestamp": datetime.now().isoformat(),
-            "num_results": len(results),
-            "results": [r.model_dump(mode="json") for r in results],
-        }
+        return output_path
 
-        output_path.write_text(json.dumps(data, indent=2, default=str))
+    @staticmethod
+    def load_debug_result(path: Path, index: int) -> dict:
+        """Load one result from a .debug.jsonl log without parsing the rest.
 
-        # Save detailed debug log
-        if save_debug:
-            debug_path = output_path.with_suffix(".debug.json")
-            debug_data = {
-                "timestamp": datetime.now().isoformat(),
-                "num_results": len(results),
-                "results": [self._full_result_dump(r) for r in results],
-                "execution_summary": self._build_execution_summary(results),
-            }
-            debug_path.write_text(json.dumps(debug_data, indent=2, default=str))
+        Args:
+            path: Path to a debug log written by save_results
+            index: Index of the result, in the same order as the results file
 
-        return output_path
+        Returns:
+            Dict with the result's debug information
 
-    def _full_result_dump(self, result: EvalResult) -> dict:
+        Raises:
+            IndexError: If the log has no result at index
+        """
+        if index < 0:
+            raise IndexError(f"No result {index} in {path}")
+        with path.open("rb") as f:
+            # Line 0 is the header
+            line = next(islice(f, index + 1, None), None)
+        if line is None:
+            raise IndexError(f"No result {index} in {path}")
+        return json_loads(line)
+
+    def _full_result_dump(self, result: EvalResult, data: dict | None = None) -> dict:
         """Create full result dump with all debug information.
 
         Args:
             result: EvalResult to dump
+            data: result.model_dump(mode="json") if already computed; it is
+                extended in place rather than copied
 
         Returns:
             Dict with complete debug information
         """
-        data = result.model_dump(mode="json")
-
-        # Add enhanced trace data
-        data["trace"]["file_changes_summary"] = [
-            {"path": fc.path, "action": fc.action}
-            for fc in result.trace.file_changes
+        if data is None:
+            data = result.model_dump(mode="json")
+
+        # Add enhanced trace data, projected from the already-serialized
+        # trace so timestamps aren't formatted a second time
+        trace = data["trace"]
+        trace["file_changes_summary"] = [
+            {"path": fc["path"], "action": fc["action"]} for fc in trace["file_changes"]
         ]
-        data["trace"]["tool_call_timeline"] = [
+        trace["tool_call_timeline"] = [
             {
-                "name": tc.name,
-                "had_error": tc.error is not None,
-                "timestamp": tc.timestamp.isoformat() if tc.timestamp else None,
+                "name": tc["name"],
+                "had_error": tc["error"] is not None,
+                "timestamp": tc["timestamp"],
             }
-            for tc in result.trace.tool_calls
+            for tc in trace["tool_calls"]
         ]
 
         # Add grading details
@@ -315,33 +595,62 @@ class EvalRunner:
         Returns:
             Summary dict
         """
-        total_files_changed = sum(len(r.trace.file_changes) for r in results)
-        total_tool_calls = sum(len(r.trace.tool_calls) for r in results)
-        hit_turn_limit_count = sum(1 for r in results if r.trace.hit_turn_limit)
+        # One pass over results rather than one per field
+        total_passed = total_files_changed = total_tool_calls = hit_turn_limit_count = 0
+        task_ids = set()
+        config_names = set()
+        for r in results:
+            trace = r.trace
+            total_passed += r.passed
+            total_files_changed += len(trace.file_changes)
+            total_tool_calls += len(trace.tool_calls)
+            hit_turn_limit_count += trace.hit_turn_limit
+            task_ids.add(r.task_id)
+            config_names.add(r.config_name)
 
         return {
             "total_results": len(results),
-            "total_passed": sum(1 for r in results if r.passed),
-            "total_failed": sum(1 for r in results if not r.passed),
+            "total_passed": total_passed,
+            "total_failed": len(results) - total_passed,
             "total_files_changed": total_files_changed,
             "total_tool_calls": total_tool_calls,
             "hit_turn_limit_count": hit_turn_limit_count,
-            "unique_tasks": len(set(r.task_id for r in results)),
-            "unique_configs": len(set(r.config_name for r in results)),
+            "unique_tasks": len(task_ids),
+            "unique_configs": len(config_names),
         }
 
     def load_results(self, path: Path) -> list[EvalResult]:
         """Load results from JSON file.
 
         Args:
-            path: Path to results file
+            path: Path to results file, or a .jsonl stream written by
+                run_matrix(stream_to=...)
 
         Returns:
             List of EvalResults
         """
-        data = json.loads(path.read_text())
+        if path.suffix == ".jsonl":
+            return list(self.iter_results(path))
+        data = json_loads(path.read_bytes())
         return [EvalResult.model_validate(r) for r in data["results"]]
 
+    @staticmethod
+    def iter_results(path: Path) -> Iterator[EvalResult]:
+        """Lazily load results from a JSONL stream written by run_matrix.
+
+        Args:
+            path: Path to a .jsonl file written via run_matrix(stream_to=...)
+
+        Yields:
+            EvalResults in the order they were written
+        """
+        with path.open("rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Incomplete trailing record from an interrupted run
+                if line.strip():
+                    yield EvalResult.model_validate_json(line)
+
     @staticmethod
     def load_task(path: Path) -> Task:
         """Load a task from YAML file.
@@ -352,45 +661,19 @@ class EvalRunner:
         Returns:
             Parsed Task object
         """
-        with open(path) as f:
-            data = yaml.safe_load(f)
-
-        # Parse assertions
-        assertions = []
-        for a in data.get("assertions", []):
-            if a["type"] == "code":
-                assertions.append(
-                    CodeAssertion(
-                        type=AssertionType.CODE,
-                        check=CodeCheckType(a["check"]),
-                        command=a.get("command"),
-                        file=a.get("file"),
-                        pattern=a.get("pattern"),
-                    )
-                )
-            elif a["type"] == "llm":
-                assertions.append(
-                    LLMAssertion(
-                        type=AssertionType.LLM,
-                        rubric=a["rubric"],
-                    )
-                )
+        data = _load_yaml(path)
+
+        # Unknown assertion types are skipped; the rest are dispatched on
+        # "type" by Task's discriminated union during validation
+        assertions = [a for a in data.get("assertions", []) if a["type"] in _ASSERTION_TYPES]
 
         # Resolve fixture path relative to task file
         fixture_path = None
         if "fixture_path" in data:
             fixture_path = path.parent / data["fixture_path"]
 
-        return Task(
-            id=data["id"],
-            category=TaskCategory(data["category"]),
-            description=data["description"],
-            difficulty=TaskDifficulty(data.get("difficulty", "medium")),
-            prompt=data["prompt"],
-            assertions=assertions,
-            scoring=data.get("scoring", {}),
-            fixture_path=fixture_path,
-            timeout_seconds=data.get("timeout_seconds", 300),
+        return Task.model_validate(
+            {**data, "assertions": assertions, "fixture_path": fixture_path}
         )
 
     @staticmethod
@@ -403,8 +686,7 @@ class EvalRunner:
         Returns:
             Parsed Config object
         """
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(path)
 
         return Config(
             name=data["name"],
@@ -426,13 +708,7 @@ class EvalRunner:
         Returns:
             List of Task objects
         """
-        tasks = []
-        for path in Path(".").glob(pattern):
-            try:
-                tasks.append(self.load_task(path))
-            except Exception as e:
-                print(f"Warning: Failed to load task {path}: {e}")
-        return tasks
+        return self._load_from_glob(pattern, self.load_task, "task")
 
     def load_configs_from_glob(self, pattern: str) -> list[Config]:
         """Load all configs matching a glob pattern.
@@ -443,10 +719,33 @@ class EvalRunner:
         Returns:
             List of Config objects
         """
-        configs = []
-        for path in Path(".").glob(pattern):
+        return self._load_from_glob(pattern, self.load_config, "config")
+
+    @staticmethod
+    def _load_from_glob(pattern: str, loader: Callable[[Path], Any], kind: str) -> list:
+        """Load every file matching pattern on a thread pool, in glob order.
+
+        Files are independent, so reads overlap across threads. Files that
+        fail to load are reported with a warning (in glob order) and skipped.
+        """
+
+        def load(path: Path) -> tuple[Any, Exception | None]:
             try:
-                configs.append(self.load_config(path))
+                return loader(path), None
             except Exception as e:
-                print(f"Warning: Failed to load config {path}: {e}")
-        return configs
+                return None, e
+
+        paths = list(Path(".").glob(pattern))
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+                outcomes = list(pool.map(load, paths))
+        else:
+            outcomes = [load(path) for path in paths]
+
+        loaded = []
+        for path, (item, error) in zip(paths, outcomes):
+            if error is not None:
+                print(f"Warning: Failed to load {kind} {path}: {error}")
+            else:
+                loaded.append(item)
+        return loaded
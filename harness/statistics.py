@@ -8,18 +8,28 @@ including:
 - Unbiased pass@k estimator (Chen et al. 2021)
 """
 
+import bisect
+import copy
+from collections.abc import Sequence
 from dataclasses import dataclass
-from math import comb, sqrt
-from typing import TYPE_CHECKING
+from enum import StrEnum
+import functools
+from math import ceil, fsum, prod, sqrt
+from operator import attrgetter
+from typing import TYPE_CHECKING, Protocol
 
-from scipy import stats
 import numpy as np
 
+from harness.constants import DEFAULT_INPUT_COST_PER_1M, DEFAULT_OUTPUT_COST_PER_1M
+
+# scipy.stats is imported inside the methods that run tests: it takes ~0.4s
+# to load, and report paths that only aggregate metrics never need it
+
 if TYPE_CHECKING:
     from harness.models import EvalResult
 
 
-@dataclass
+@dataclass(slots=True)
 class StabilityMetrics:
     """Metrics for result stability/variance."""
 
@@ -31,7 +41,7 @@ class StabilityMetrics:
     score_range: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EfficiencyComparison:
     """Token and timing comparison between configs."""
 
@@ -55,8 +65,37 @@ class EfficiencyComparison:
 
     recommendation: str
 
+    cost_p_value: float | None = None  # Mann-Whitney on costs
+
+
+class EffectMagnitude(StrEnum):
+    """Cohen's d magnitude labels, in increasing order.
+
+    Members compare and serialize as their plain string values.
+    """
+
+    NEGLIGIBLE = "negligible"
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
 
-@dataclass
+
+# Recommendation wording for a significant difference, per magnitude:
+# (lead, suffix after the direction, verdict). The messages themselves are
+# f-strings, which format faster than str.format on stored templates.
+_SIGNIFICANT_WORDING = {
+    EffectMagnitude.NEGLIGIBLE: (
+        "Statistically significant but negligible", "", "The practical difference is minimal."
+    ),
+    EffectMagnitude.SMALL: (
+        "Statistically significant small", "", "Consider whether this is practically meaningful."
+    ),
+    EffectMagnitude.MEDIUM: ("Significant medium", " detected", "This is a meaningful difference."),
+    EffectMagnitude.LARGE: ("Significant large", " detected", "This is a substantial difference."),
+}
+
+
+@dataclass(slots=True)
 class ComparisonResult:
     """Result of statistical comparison between two configurations."""
 
@@ -73,7 +112,7 @@ class ComparisonResult:
 
     # Effect size
     effect_size: float  # Cohen's d
-    effect_magnitude: str  # "negligible", "small", "medium", "large"
+    effect_magnitude: EffectMagnitude
 
     # Practical interpretation
     delta: float  # mean_b - mean_a
@@ -81,7 +120,7 @@ class ComparisonResult:
     recommendation: str  # Human-readable recommendation
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerAnalysisResult:
     """Result of power analysis for sample size determination."""
 
@@ -93,6 +132,150 @@ class PowerAnalysisResult:
     notes: str
 
 
+class SupportsScore(Protocol):
+    """A scored run, e.g. an EvalResult.
+
+    Score-only analyses (comparisons, pass@k, stability) read just these
+    two fields, so lightweight records can stand in for full results.
+    """
+
+    @property
+    def overall_score(self) -> float: ...
+
+    @property
+    def passed(self) -> bool: ...
+
+
+_get_score = attrgetter("overall_score")
+_get_passed = attrgetter("passed")
+
+
+def _score_array(results: Sequence[SupportsScore]) -> np.ndarray:
+    """Extract overall scores as a float64 array, filled in a single pass."""
+    return np.fromiter(map(_get_score, results), dtype=np.float64, count=len(results))
+
+
+def _efficiency_arrays(
+    results: list["EvalResult"],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Extract (total tokens, durations, costs) columns from results.
+
+    Reads each result once, then prices all runs together at the default
+    per-token rates.
+    """
+    input_tokens = []
+    output_tokens = []
+    durations = []
+    for r in results:
+        trace = r.trace
+        usage = trace.usage
+        input_tokens.append(usage.input_tokens)
+        output_tokens.append(usage.output_tokens)
+        durations.append(trace.duration_seconds)
+
+    io_tokens = np.column_stack(
+        (np.array(input_tokens, dtype=np.int64), np.array(output_tokens, dtype=np.int64))
+    )
+    per_1m = np.array([DEFAULT_INPUT_COST_PER_1M, DEFAULT_OUTPUT_COST_PER_1M])
+    costs = (io_tokens * per_1m).sum(axis=1) / 1_000_000
+
+    return io_tokens.sum(axis=1), np.array(durations, dtype=np.float64), costs
+
+
+@functools.lru_cache(maxsize=32)
+def _z(p: float) -> float:
+    """Standard normal quantile, memoized for repeated alpha/power values."""
+    from scipy import stats
+
+    return float(stats.norm.ppf(p))
+
+
+@functools.lru_cache(maxsize=256)
+def _sample_size(
+    baseline_rate: float, min_effect: float, power: float, alpha: float
+) -> tuple[int, str]:
+    """minimum_sample_size's (sample size, notes), memoized per parameter set.
+
+    baseline_rate must be strictly between 0 and 1.
+    """
+    # Expected rate under alternative hypothesis
+    alt_rate = baseline_rate + min_effect
+    if alt_rate >= 1:
+        alt_rate = 0.99
+    if alt_rate <= 0:
+        alt_rate = 0.01
+
+    # Pooled proportion
+    p_pooled = (baseline_rate + alt_rate) / 2
+
+    # Z-scores for alpha and power
+    z_alpha = _z(1 - alpha / 2)  # Two-tailed
+    z_power = _z(power)
+
+    # Sample size formula for comparing two proportions
+    numerator = (
+        z_alpha * sqrt(2 * p_pooled * (1 - p_pooled))
+        + z_power * sqrt(
+            baseline_rate * (1 - baseline_rate)
+            + alt_rate * (1 - alt_rate)
+        )
+    ) ** 2
+    denominator = (baseline_rate - alt_rate) ** 2
+
+    if denominator == 0:
+        n = 30
+        notes = "Effect size is 0. Using minimum sample size of 30."
+    else:
+        n = ceil(numerator / denominator)
+        n = max(n, 5)  # Minimum 5 samples
+        notes = f"Sample size provides {power:.0%} power to detect {min_effect:.0%} change."
+    return n, notes
+
+
+# Below this many samples, a group's mean and variance are cheaper as plain
+# Python reductions than through numpy's per-call dispatch (measured
+# crossover is around 90 samples).
+_PY_REDUCE_MAX_N = 90
+
+
+def _mean_var(scores: np.ndarray) -> tuple[float, float]:
+    """Mean and sample variance (ddof=1) of a group of at least 2 scores."""
+    n = len(scores)
+    if n >= _PY_REDUCE_MAX_N:
+        return float(scores.mean()), float(scores.var(ddof=1))
+    values = scores.tolist()
+    mean = fsum(values) / n
+    return mean, fsum([(x - mean) ** 2 for x in values]) / (n - 1)
+
+
+# Up to this many factors, pass@k's product is cheaper as a Python loop
+# than as a numpy array (measured crossover is around 64-100).
+_PY_PRODUCT_MAX_K = 64
+
+
+@functools.lru_cache(maxsize=256)
+def _compare_sorted_scores(sorted_a: bytes, sorted_b: bytes, alpha: float) -> "ComparisonResult":
+    """compare_configs memoized on the raw bytes of each sorted score array.
+
+    The cached result is shared; callers hand out copies.
+    """
+    return StatisticalAnalyzer._compare_score_arrays(
+        np.frombuffer(sorted_a), np.frombuffer(sorted_b), alpha
+    )
+
+
+# Above this many samples per side the Mann-Whitney normal approximation
+# is used directly, without scipy's "auto" method probe. scipy's "auto"
+# picks the asymptotic method for exactly these sizes (both sides > 8), so
+# p-values are unchanged; smaller untied samples still get exact p-values.
+_ASYMPTOTIC_MIN_N = 8
+
+
+def _mwu_method(n_a: int, n_b: int) -> str:
+    """Pick the scipy.stats.mannwhitneyu method for the given sample sizes."""
+    return "asymptotic" if min(n_a, n_b) > _ASYMPTOTIC_MIN_N else "auto"
+
+
 class StatisticalAnalyzer:
     """Statistical analysis utilities for evaluation results."""
 
@@ -100,6 +283,12 @@ class StatisticalAnalyzer:
     EFFECT_NEGLIGIBLE = 0.2
     EFFECT_SMALL = 0.5
     EFFECT_MEDIUM = 0.8
+    EFFECT_THRESHOLDS = (EFFECT_NEGLIGIBLE, EFFECT_SMALL, EFFECT_MEDIUM)
+    # Magnitude labels below/between/above the thresholds, in order
+    EFFECT_MAGNITUDES = tuple(EffectMagnitude)
+
+    # Minimum runs per group for a meaningful Mann-Whitney comparison
+    MIN_SAMPLES_FOR_TEST = 5
 
     @staticmethod
     def minimum_sample_size(
@@ -132,37 +321,7 @@ class StatisticalAnalyzer:
                 notes="Invalid baseline rate. Using minimum sample size of 30.",
             )
 
-        # Expected rate under alternative hypothesis
-        alt_rate = baseline_rate + min_effect
-        if alt_rate >= 1:
-            alt_rate = 0.99
-        if alt_rate <= 0:
-            alt_rate = 0.01
-
-        # Pooled proportion
-        p_pooled = (baseline_rate + alt_rate) / 2
-
-        # Z-scores for alpha and power
-        z_alpha = stats.norm.ppf(1 - alpha / 2)  # Two-tailed
-        z_power = stats.norm.ppf(power)
-
-        # Sample size formula for comparing two proportions
-        numerator = (
-            z_alpha * sqrt(2 * p_pooled * (1 - p_pooled))
-            + z_power * sqrt(
-                baseline_rate * (1 - baseline_rate)
-                + alt_rate * (1 - alt_rate)
-            )
-        ) ** 2
-        denominator = (baseline_rate - alt_rate) ** 2
-
-        if denominator == 0:
-            n = 30
-            notes = "Effect size is 0. Using minimum sample size of 30."
-        else:
-            n = int(np.ceil(numerator / denominator))
-            n = max(n, 5)  # Minimum 5 samples
-            notes = f"Sample size provides {power:.0%} power to detect {min_effect:.0%} change."
+        n, notes = _sample_size(baseline_rate, min_effect, power, alpha)
 
         return PowerAnalysisResult(
             baseline_rate=baseline_rate,
@@ -175,8 +334,8 @@ class StatisticalAnalyzer:
 
     @staticmethod
     def compare_configs(
-        results_a: list["EvalResult"],
-        results_b: list["EvalResult"],
+        results_a: Sequence[SupportsScore],
+        results_b: Sequence[SupportsScore],
         alpha: float = 0.05,
     ) -> ComparisonResult:
         """Compare two sets of results using Mann-Whitney U test.
@@ -192,55 +351,297 @@ class StatisticalAnalyzer:
         Returns:
             ComparisonResult with test statistics and interpretation
         """
-        # Extract scores
-        scores_a = np.array([r.overall_score for r in results_a])
-        scores_b = np.array([r.overall_score for r in results_b])
+        return StatisticalAnalyzer.compare_configs_arrays(
+            _score_array(results_a), _score_array(results_b), alpha
+        )
+
+    @staticmethod
+    def compare_configs_arrays(
+        scores_a: np.ndarray,
+        scores_b: np.ndarray,
+        alpha: float = 0.05,
+    ) -> ComparisonResult:
+        """compare_configs on already extracted overall scores.
+
+        Lets callers that compare the same groups repeatedly extract each
+        group's scores once.
 
+        Args:
+            scores_a: Overall scores from first configuration
+            scores_b: Overall scores from second configuration
+            alpha: Significance level for hypothesis test
+
+        Returns:
+            ComparisonResult with test statistics and interpretation
+        """
+        # The test, means and variances don't depend on order, so sorted
+        # scores make a canonical cache key: re-rendered comparisons, and
+        # groups with identical scores, share one result
+        scores_a = np.sort(np.asarray(scores_a, dtype=np.float64))
+        scores_b = np.sort(np.asarray(scores_b, dtype=np.float64))
+        return copy.copy(_compare_sorted_scores(scores_a.tobytes(), scores_b.tobytes(), alpha))
+
+    @staticmethod
+    def _compare_score_arrays(
+        scores_a: np.ndarray,
+        scores_b: np.ndarray,
+        alpha: float,
+    ) -> ComparisonResult:
+        """compare_configs on already extracted score arrays (uncached)."""
         n_a, n_b = len(scores_a), len(scores_b)
-        mean_a, mean_b = np.mean(scores_a), np.mean(scores_b)
-        delta = mean_b - mean_a
 
-        # Handle edge cases
+        # Handle edge cases (an empty group's mean is NaN, as from np.mean)
         if n_a < 2 or n_b < 2:
+            mean_a = float(scores_a.mean()) if n_a else float("nan")
+            mean_b = float(scores_b.mean()) if n_b else float("nan")
             return ComparisonResult(
-                mean_a=float(mean_a),
-                mean_b=float(mean_b),
+                mean_a=mean_a,
+                mean_b=mean_b,
                 n_a=n_a,
                 n_b=n_b,
                 statistic=0.0,
                 p_value=1.0,
                 is_significant=False,
                 effect_size=0.0,
-                effect_magnitude="negligible",
-                delta=float(delta),
+                effect_magnitude=EffectMagnitude.NEGLIGIBLE,
+                delta=mean_b - mean_a,
                 relative_change=0.0,
                 recommendation="Insufficient samples for statistical comparison (need at least 2 per group).",
             )
 
+        # Every score equal on both sides (e.g. all-pass vs all-pass): the
+        # test can only give U = n_a*n_b/2 and p = 1, so skip it
+        first = scores_a[0]
+        if (scores_a == first).all() and (scores_b == first).all():
+            return StatisticalAnalyzer._comparison_from_test(
+                scores_a, scores_b, n_a * n_b / 2, 1.0, alpha
+            )
+
+        from scipy import stats
+
         # Mann-Whitney U test
         statistic, p_value = stats.mannwhitneyu(
-            scores_a, scores_b, alternative="two-sided"
+            scores_a, scores_b, alternative="two-sided", method=_mwu_method(n_a, n_b)
         )
 
-        # Cohen's d effect size
-        pooled_std = np.sqrt(
-            ((n_a - 1) * np.var(scores_a, ddof=1) + (n_b - 1) * np.var(scores_b, ddof=1))
-            / (n_a + n_b - 2)
+        return StatisticalAnalyzer._comparison_from_test(
+            scores_a, scores_b, float(statistic), float(p_value), alpha
         )
+
+    @staticmethod
+    def effect_magnitude(effect_size: float) -> EffectMagnitude:
+        """Interpret a Cohen's d value as negligible/small/medium/large.
+
+        Each threshold is the inclusive lower bound of the next label.
+        """
+        return StatisticalAnalyzer.EFFECT_MAGNITUDES[
+            bisect.bisect_right(StatisticalAnalyzer.EFFECT_THRESHOLDS, abs(effect_size))
+        ]
+
+    @staticmethod
+    def insufficient_samples(
+        results_a: Sequence[SupportsScore],
+        results_b: Sequence[SupportsScore],
+    ) -> ComparisonResult:
+        """Describe a comparison too small to test, without running the test.
+
+        Means and deltas are filled in; the p-value is NaN and the result is
+        never significant.
+
+        Args:
+            results_a: Results from first configuration
+            results_b: Results from second configuration
+
+        Returns:
+            ComparisonResult with statistic 0 and p_value NaN
+        """
+        n_a, n_b = len(results_a), len(results_b)
+        mean_a = sum(r.overall_score for r in results_a) / n_a if n_a else 0.0
+        mean_b = sum(r.overall_score for r in results_b) / n_b if n_b else 0.0
+        delta = mean_b - mean_a
+
+        return ComparisonResult(
+            mean_a=mean_a,
+            mean_b=mean_b,
+            n_a=n_a,
+            n_b=n_b,
+            statistic=0.0,
+            p_value=float("nan"),
+            is_significant=False,
+            effect_size=0.0,
+            effect_magnitude=EffectMagnitude.NEGLIGIBLE,
+            delta=delta,
+            relative_change=(delta / mean_a * 100) if mean_a > 0 else 0.0,
+            recommendation=StatisticalAnalyzer._generate_recommendation(
+                delta=delta,
+                p_value=float("nan"),
+                effect_magnitude=EffectMagnitude.NEGLIGIBLE,
+                is_significant=False,
+                n_a=n_a,
+                n_b=n_b,
+            ),
+        )
+
+    @staticmethod
+    def compare_configs_batch(
+        pairs: list[tuple[Sequence[SupportsScore], Sequence[SupportsScore]]],
+        alpha: float = 0.05,
+    ) -> list[ComparisonResult]:
+        """Compare many (results_a, results_b) pairs in one vectorized pass.
+
+        Equivalent to calling compare_configs on each pair, but the
+        Mann-Whitney ranks and tie corrections for all pairs are computed
+        together (see mann_whitney_batch).
+
+        Args:
+            pairs: List of (results_a, results_b) tuples to compare
+            alpha: Significance level for hypothesis tests
+
+        Returns:
+            List of ComparisonResult, one per pair in input order
+        """
+        return StatisticalAnalyzer.compare_configs_batch_arrays(
+            [(_score_array(results_a), _score_array(results_b)) for results_a, results_b in pairs],
+            alpha,
+        )
+
+    @staticmethod
+    def compare_configs_batch_arrays(
+        score_pairs: list[tuple[np.ndarray, np.ndarray]],
+        alpha: float = 0.05,
+    ) -> list[ComparisonResult]:
+        """compare_configs_batch on already extracted overall scores.
+
+        Args:
+            score_pairs: List of (scores_a, scores_b) array tuples to compare
+            alpha: Significance level for hypothesis tests
+
+        Returns:
+            List of ComparisonResult, one per pair in input order
+        """
+        scores = [
+            (np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+            for a, b in score_pairs
+        ]
+
+        # Pairs too small to test go through compare_configs' edge-case path
+        testable = [i for i, (a, b) in enumerate(scores) if len(a) >= 2 and len(b) >= 2]
+        u_stats, p_values = StatisticalAnalyzer.mann_whitney_batch(
+            [scores[i] for i in testable]
+        )
+        tested = dict(zip(testable, zip(u_stats.tolist(), p_values.tolist())))
+
+        comparisons = []
+        for i, (a, b) in enumerate(scores):
+            if i in tested:
+                statistic, p_value = tested[i]
+                comparisons.append(
+                    StatisticalAnalyzer._comparison_from_test(a, b, statistic, p_value, alpha)
+                )
+            else:
+                comparisons.append(StatisticalAnalyzer.compare_configs_arrays(a, b, alpha))
+        return comparisons
+
+    @staticmethod
+    def mann_whitney_batch(
+        samples: list[tuple[np.ndarray, np.ndarray]],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Two-sided Mann-Whitney U tests for many sample pairs at once.
+
+        All pairs are ranked with a single lexsort keyed on (pair, value),
+        giving average ranks and tie counts per pair without a Python loop.
+        p-values use the tie-corrected normal approximation with continuity
+        correction; pairs where scipy's "auto" method would choose the exact
+        distribution (either side <= 8 and no ties) defer to
+        scipy.stats.mannwhitneyu so results match compare_configs.
+
+        Args:
+            samples: List of (a, b) score arrays, each side non-empty
+
+        Returns:
+            Tuple of (U statistics for a, p-values), one entry per pair
+        """
+        from scipy import stats
+
+        if not samples:
+            return np.empty(0), np.empty(0)
+
+        n_a = np.array([len(a) for a, _ in samples])
+        n_b = np.array([len(b) for _, b in samples])
+        n = n_a + n_b
+        pair = np.repeat(np.arange(len(samples)), n)
+        values = np.concatenate([np.concatenate((a, b)) for a, b in samples])
+        from_a = np.concatenate(
+            [np.arange(size) < size_a for size, size_a in zip(n, n_a)]
+        )
+
+        order = np.lexsort((values, pair))
+        sorted_values = values[order]
+        sorted_pair = pair[order]
+
+        # Tie blocks: runs of equal values within the same pair
+        starts = np.flatnonzero(
+            np.r_[True, (sorted_values[1:] != sorted_values[:-1]) | (sorted_pair[1:] != sorted_pair[:-1])]
+        )
+        counts = np.diff(np.r_[starts, len(values)])
+        pair_offset = np.r_[0, np.cumsum(n)[:-1]]
+        # Average 1-based rank of each block, relative to its pair
+        block_rank = starts - pair_offset[sorted_pair[starts]] + (counts + 1) / 2
+
+        ranks = np.empty(len(values))
+        ranks[order] = np.repeat(block_rank, counts)
+
+        rank_sum_a = np.bincount(pair[from_a], weights=ranks[from_a], minlength=len(samples))
+        u_a = rank_sum_a - n_a * (n_a + 1) / 2
+        u = np.maximum(u_a, n_a * n_b - u_a)
+
+        block_pair = sorted_pair[starts]
+        tie_term = np.bincount(block_pair, weights=counts**3 - counts, minlength=len(samples))
+        has_ties = np.bincount(block_pair, weights=counts > 1, minlength=len(samples)) > 0
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sigma = np.sqrt(n_a * n_b / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+            z = (u - n_a * n_b / 2 - 0.5) / sigma
+        p_values = np.clip(2 * stats.norm.sf(z), 0.0, 1.0)
+
+        exact = ~has_ties & ((n_a <= 8) | (n_b <= 8))
+        for i in np.flatnonzero(exact):
+            p_values[i] = stats.mannwhitneyu(*samples[i], alternative="two-sided").pvalue
+
+        return u_a, p_values
+
+    @staticmethod
+    def _comparison_from_test(
+        scores_a: np.ndarray,
+        scores_b: np.ndarray,
+        statistic: float,
+        p_value: float,
+        alpha: float,
+    ) -> ComparisonResult:
+        """Build a ComparisonResult from scores and a Mann-Whitney result."""
+        n_a, n_b = len(scores_a), len(scores_b)
+        mean_a, var_a = _mean_var(scores_a)
+        mean_b, var_b = _mean_var(scores_b)
+        if not (var_a or var_b) and mean_a != mean_b:
+            # Two constant groups with different values. For parity with
+            # earlier releases their moments come from numpy, whose rounding
+            # noise leaves a tiny pooled std and so a huge ("large") effect
+            # size; this is deliberate, not a numerical safeguard. Constant
+            # groups with equal values keep the exact moments: no effect.
+            mean_a, var_a = float(scores_a.mean()), float(scores_a.var(ddof=1))
+            mean_b, var_b = float(scores_b.mean()), float(scores_b.var(ddof=1))
+        delta = mean_b - mean_a
+
+        # Cohen's d effect size, from the n-weighted pooled variance; the
+        # combination is done on Python floats, with fsum so a tiny-variance
+        # group isn't lost next to one many orders of magnitude larger
+        pooled_std = sqrt(fsum(((n_a - 1) * var_a, (n_b - 1) * var_b)) / (n_a + n_b - 2))
         if pooled_std > 0:
             effect_size = abs(delta) / pooled_std
         else:
             effect_size = 0.0
 
-        # Interpret effect size
-        if effect_size < StatisticalAnalyzer.EFFECT_NEGLIGIBLE:
-            effect_magnitude = "negligible"
-        elif effect_size < StatisticalAnalyzer.EFFECT_SMALL:
-            effect_magnitude = "small"
-        elif effect_size < StatisticalAnalyzer.EFFECT_MEDIUM:
-            effect_magnitude = "medium"
-        else:
-            effect_magnitude = "large"
+        effect_magnitude = StatisticalAnalyzer.effect_magnitude(effect_size)
 
         # Statistical significance
         is_significant = p_value < alpha
@@ -291,31 +692,19 @@ class StatisticalAnalyzer:
         Returns:
             EfficiencyComparison with efficiency metrics and statistical tests
         """
-        from harness.models import CostMetrics
-
         # Extract token counts, durations, and costs
-        tokens_a = np.array([r.trace.usage.total_tokens for r in results_a])
-        tokens_b = np.array([r.trace.usage.total_tokens for r in results_b])
-
-        durations_a = np.array([r.trace.duration_seconds for r in results_a])
-        durations_b = np.array([r.trace.duration_seconds for r in results_b])
-
-        costs_a = np.array([
-            CostMetrics.from_usage(r.trace.usage).total_cost_usd
-            for r in results_a
-        ])
-        costs_b = np.array([
-            CostMetrics.from_usage(r.trace.usage).total_cost_usd
-            for r in results_b
-        ])
-
-        # Calculate means
-        tokens_a_mean = float(np.mean(tokens_a)) if len(tokens_a) > 0 else 0.0
-        tokens_b_mean = float(np.mean(tokens_b)) if len(tokens_b) > 0 else 0.0
-        duration_a_mean = float(np.mean(durations_a)) if len(durations_a) > 0 else 0.0
-        duration_b_mean = float(np.mean(durations_b)) if len(durations_b) > 0 else 0.0
-        cost_a_mean = float(np.mean(costs_a)) if len(costs_a) > 0 else 0.0
-        cost_b_mean = float(np.mean(costs_b)) if len(costs_b) > 0 else 0.0
+        tokens_a, durations_a, costs_a = _efficiency_arrays(results_a)
+        tokens_b, durations_b, costs_b = _efficiency_arrays(results_b)
+
+        n_a, n_b = len(results_a), len(results_b)
+
+        # Calculate means (0.0 for an empty group, rather than NaN)
+        tokens_a_mean = float(tokens_a.mean()) if n_a else 0.0
+        tokens_b_mean = float(tokens_b.mean()) if n_b else 0.0
+        duration_a_mean = float(durations_a.mean()) if n_a else 0.0
+        duration_b_mean = float(durations_b.mean()) if n_b else 0.0
+        cost_a_mean = float(costs_a.mean()) if n_a else 0.0
+        cost_b_mean = float(costs_b.mean()) if n_b else 0.0
 
         # Calculate deltas
         tokens_delta = tokens_b_mean - tokens_a_mean
@@ -327,24 +716,18 @@ class StatisticalAnalyzer:
         cost_delta = cost_b_mean - cost_a_mean
         cost_delta_pct = (cost_delta / cost_a_mean * 100) if cost_a_mean > 0 else 0.0
 
-        # Perform Mann-Whitney U tests if sufficient samples
+        # Perform Mann-Whitney U tests if sufficient samples. All three
+        # metrics are ranked together by mann_whitney_batch, which gives
+        # scipy's p-values without its per-call validation and dispatch.
         tokens_p_value: float | None = None
         duration_p_value: float | None = None
+        cost_p_value: float | None = None
 
-        if len(tokens_a) >= 2 and len(tokens_b) >= 2:
-            try:
-                _, tokens_p_value = stats.mannwhitneyu(
-                    tokens_a, tokens_b, alternative="two-sided"
-                )
-            except ValueError:
-                tokens_p_value = None
-
-            try:
-                _, duration_p_value = stats.mannwhitneyu(
-                    durations_a, durations_b, alternative="two-sided"
-                )
-            except ValueError:
-                duration_p_value = None
+        if n_a >= 2 and n_b >= 2:
+            _, p_values = StatisticalAnalyzer.mann_whitney_batch(
+                [(tokens_a, tokens_b), (durations_a, durations_b), (costs_a, costs_b)]
+            )
+            tokens_p_value, duration_p_value, cost_p_value = p_values.tolist()
 
         # Generate recommendation
         recommendation = StatisticalAnalyzer._generate_efficiency_recommendation(
@@ -352,8 +735,8 @@ class StatisticalAnalyzer:
             duration_delta_pct=duration_delta_pct,
             tokens_p_value=tokens_p_value,
             duration_p_value=duration_p_value,
-            n_a=len(results_a),
-            n_b=len(results_b),
+            n_a=n_a,
+            n_b=n_b,
         )
 
         return EfficiencyComparison(
@@ -372,6 +755,7 @@ class StatisticalAnalyzer:
             tokens_p_value=tokens_p_value,
             duration_p_value=duration_p_value,
             recommendation=recommendation,
+            cost_p_value=cost_p_value,
         )
 
     @staticmethod
@@ -423,7 +807,7 @@ class StatisticalAnalyzer:
     def _generate_recommendation(
         delta: float,
         p_value: float,
-        effect_magnitude: str,
+        effect_magnitude: EffectMagnitude,
         is_significant: bool,
         n_a: int,
         n_b: int,
@@ -431,52 +815,27 @@ class StatisticalAnalyzer:
         """Generate human-readable recommendation from comparison."""
         min_n = min(n_a, n_b)
 
-        if min_n < 5:
+        if min_n < StatisticalAnalyzer.MIN_SAMPLES_FOR_TEST:
             return (
                 f"Sample size too small (n={min_n}). "
-                "Collect at least 5 runs per configuration for reliable comparison."
+                f"Collect at least {StatisticalAnalyzer.MIN_SAMPLES_FOR_TEST} runs "
+                "per configuration for reliable comparison."
             )
 
         if not is_significant:
-            if min_n < 10:
-                return (
-                    f"No significant difference detected (p={p_value:.3f}). "
-                    "Consider increasing sample size for more statistical power."
-                )
-            return (
-                f"No significant difference detected (p={p_value:.3f}). "
-                "The configurations appear equivalent."
+            advice = (
+                "Consider increasing sample size for more statistical power."
+                if min_n < 10
+                else "The configurations appear equivalent."
             )
+            return f"No significant difference detected (p={p_value:.3f}). {advice}"
 
         direction = "improvement" if delta > 0 else "regression"
-
-        if effect_magnitude == "negligible":
-            return (
-                f"Statistically significant but negligible {direction} "
-                f"(p={p_value:.3f}, d={effect_magnitude}). "
-                "The practical difference is minimal."
-            )
-        elif effect_magnitude == "small":
-            return (
-                f"Statistically significant small {direction} "
-                f"(p={p_value:.3f}, d={effect_magnitude}). "
-                "Consider whether this is practically meaningful."
-            )
-        elif effect_magnitude == "medium":
-            return (
-                f"Significant medium {direction} detected "
-                f"(p={p_value:.3f}, d={effect_magnitude}). "
-                "This is a meaningful difference."
-            )
-        else:  # large
-            return (
-                f"Significant large {direction} detected "
-                f"(p={p_value:.3f}, d={effect_magnitude}). "
-                "This is a substantial difference."
-            )
+        lead, detected, verdict = _SIGNIFICANT_WORDING[effect_magnitude]
+        return f"{lead} {direction}{detected} (p={p_value:.3f}, d={effect_magnitude}). {verdict}"
 
     @staticmethod
-    def pass_at_k_unbiased(results: list["EvalResult"], k: int) -> float:
+    def pass_at_k_unbiased(results: Sequence[SupportsScore], k: int) -> float:
         """Calculate unbiased pass@k estimator.
 
         Uses the estimator from Chen et al. 2021 "Evaluating Large Language
@@ -493,9 +852,27 @@ class StatisticalAnalyzer:
         Returns:
             Unbiased pass@k probability (0-1)
         """
-        n = len(results)
-        c = sum(1 for r in results if r.passed)
+        return StatisticalAnalyzer.pass_at_k_from_counts(
+            len(results), sum(map(_get_passed, results)), k
+        )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def pass_at_k_from_counts(n: int, c: int, k: int) -> float:
+        """Unbiased pass@k from precomputed sample and pass counts.
+
+        Same estimator as pass_at_k_unbiased, for callers that already
+        know n and c and would otherwise rescan the results per k. Memoized,
+        since groups in a sweep repeat the same (n, c) counts.
+
+        Args:
+            n: Total number of samples
+            c: Number of passing samples
+            k: Number of samples to consider
+
+        Returns:
+            Unbiased pass@k probability (0-1)
+        """
         if n == 0:
             return 0.0
 
@@ -511,20 +888,30 @@ class StatisticalAnalyzer:
             # None passed
             return 0.0
 
-        # Unbiased estimator: 1 - C(n-c, k) / C(n, k)
-        # Using comb() for numerical stability
-        try:
-            numerator = comb(n - c, k)
-            denominator = comb(n, k)
-            if denominator == 0:
-                return 0.0
-            return 1.0 - (numerator / denominator)
-        except (ValueError, OverflowError):
-            # Fallback for numerical issues
+        if n - c < k:
+            # Every k-subset contains a pass: C(n-c, k) is 0 (this covers
+            # k == n whenever anything passed)
+            return 1.0
+
+        if k == 1:
+            # 1 - (n-c)/n: the plain pass rate
             return c / n
 
+        # Unbiased estimator: 1 - C(n-c, k) / C(n, k), in a product form so
+        # it stays in floats (no bignum binomials, no overflow). The ratio
+        # is both prod_{i=n-k+1..n} (1 - c/i) and, as in Chen et al.'s
+        # reference code, prod_{i=n-c+1..n} (1 - k/i); take the shorter.
+        # A log-gamma form would be O(1), but its lgamma(n+1) differences
+        # cancel badly for large n and small k (~1e-5 relative error at
+        # n=1e6, k=3). Short products are cheaper in plain Python than as
+        # a numpy array.
+        m, r = (c, k) if c < k else (k, c)
+        if m <= _PY_PRODUCT_MAX_K:
+            return 1.0 - prod([1.0 - r / i for i in range(n - m + 1, n + 1)])
+        return 1.0 - float(np.prod(1.0 - r / np.arange(n - m + 1, n + 1)))
+
     @staticmethod
-    def calculate_stability(results: list["EvalResult"]) -> StabilityMetrics:
+    def calculate_stability(results: Sequence[SupportsScore]) -> StabilityMetrics:
         """Calculate stability metrics for a set of results.
 
         Args:
@@ -543,16 +930,34 @@ class StatisticalAnalyzer:
                 score_range=0.0,
             )
 
-        scores = [r.overall_score for r in results]
-        mean = np.mean(scores)
-        variance = float(np.var(scores, ddof=1)) if len(scores) > 1 else 0.0
-        std_dev = float(np.sqrt(variance))
+        return StatisticalAnalyzer.stability_from_scores(_score_array(results))
 
-        # Coefficient of variation (handle zero mean)
-        cv = float(std_dev / mean) if mean > 0 else 0.0
+    @staticmethod
+    def stability_from_scores(scores: np.ndarray) -> StabilityMetrics:
+        """Calculate stability metrics from an already extracted score array.
 
-        min_score = float(np.min(scores))
-        max_score = float(np.max(scores))
+        Args:
+            scores: Non-empty float array of per-run scores
+
+        Returns:
+            StabilityMetrics with variance and related measures
+        """
+        # Small groups reduce faster as Python floats (see _mean_var); larger
+        # ones use array methods, which skip np.mean/np.var's dispatch
+        n = len(scores)
+        if n < _PY_REDUCE_MAX_N:
+            values = scores.tolist()
+            mean = fsum(values) / n
+            variance = fsum([(x - mean) ** 2 for x in values]) / (n - 1) if n > 1 else 0.0
+            min_score, max_score = min(values), max(values)
+        else:
+            mean = float(scores.mean())
+            variance = float(scores.var(ddof=1))
+            min_score, max_score = float(scores.min()), float(scores.max())
+        std_dev = sqrt(variance)
+
+        # Coefficient of variation (handle zero mean)
+        cv = std_dev / mean if mean > 0 else 0.0
 
         return StabilityMetrics(
             variance=variance,
@@ -565,10 +970,13 @@ class StatisticalAnalyzer:
 
     @staticmethod
     def is_regression(
-        baseline_results: list["EvalResult"],
-        current_results: list["EvalResult"],
+        baseline_results: Sequence[SupportsScore] | None = None,
+        current_results: Sequence[SupportsScore] | None = None,
         threshold: float = 0.05,
         require_significance: bool = True,
+        *,
+        scores_a: np.ndarray | None = None,
+        scores_b: np.ndarray | None = None,
     ) -> tuple[bool, ComparisonResult]:
         """Check if current results represent a regression from baseline.
 
@@ -577,13 +985,19 @@ class StatisticalAnalyzer:
             current_results: Current evaluation results
             threshold: Minimum pass rate drop to consider a regression
             require_significance: Require statistical significance
+            scores_a: Pre-extracted baseline overall scores, used instead
+                of baseline_results
+            scores_b: Pre-extracted current overall scores, used instead
+                of current_results
 
         Returns:
             Tuple of (is_regression, comparison_result)
         """
-        comparison = StatisticalAnalyzer.compare_configs(
-            baseline_results, current_results
-        )
+        if scores_a is None:
+            scores_a = _score_array(baseline_results)
+        if scores_b is None:
+            scores_b = _score_array(current_results)
+        comparison = StatisticalAnalyzer.compare_configs_arrays(scores_a, scores_b)
 
         # Check for regression
         is_regressed = comparison.delta < -threshold
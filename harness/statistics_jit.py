@@ -0,0 +1,55 @@
+"""Numba-compiled kernel for per-group stability statistics.
+
+Numba is optional. When it is not installed the kernel below is a plain
+Python function with identical results, and NUMBA_AVAILABLE is False so
+callers can prefer the NumPy/SciPy paths in harness.statistics instead.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba not installed
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # noqa: ARG001
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def stability_jit(scores: np.ndarray) -> tuple[float, float, float, float, float]:
+    """Single-pass (Welford) stability statistics over a score array.
+
+    Args:
+        scores: Float array of per-run scores (must be non-empty)
+
+    Returns:
+        Tuple of (variance, std_dev, coefficient_of_variation, min, max),
+        with sample variance (ddof=1) and CV of 0 for non-positive means
+    """
+    n = scores.shape[0]
+    mean = 0.0
+    m2 = 0.0
+    lo = scores[0]
+    hi = scores[0]
+    for i in range(n):
+        x = scores[i]
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+
+    variance = m2 / (n - 1) if n > 1 else 0.0
+    std_dev = math.sqrt(variance)
+    cv = std_dev / mean if mean > 0 else 0.0
+    return variance, std_dev, cv, lo, hi
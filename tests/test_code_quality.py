@@ -199,6 +199,56 @@ class TestCodeGrader:
         assert result.score == 0.0
 
 
+class TestLLMGraderCache:
+    """Tests for LLMGrader grade caching."""
+
+    def _grader(self, tmp_path, cache_grades):
+        from harness.graders.llm_graders import LLMGrader
+
+        grader = LLMGrader(api_key="test", cache_grades=cache_grades)
+        calls = []
+
+        class FakeMessages:
+            def create(self, **kwargs):
+                calls.append(kwargs)
+                text = '{"overall_score": 0.9, "passed": true, "overall_reasoning": "ok"}'
+                return type("Response", (), {"content": [type("Block", (), {"text": text})]})
+
+        grader.client = type("Client", (), {"messages": FakeMessages()})
+        (tmp_path / "app.py").write_text("x = 1\n")
+        return grader, calls
+
+    def test_identical_prompts_graded_once(self, tmp_path):
+        """With caching, a repeated grading prompt reuses the first grade."""
+        from harness.models import ExecutionTrace, LLMAssertion, Task, TaskCategory
+
+        grader, calls = self._grader(tmp_path, cache_grades=True)
+        task = Task(id="t", category=TaskCategory.CODING, description="", prompt="Do it")
+        assertion = LLMAssertion(rubric="Is it good?")
+
+        first = grader.grade(assertion, task, ExecutionTrace(result="done"), tmp_path)
+        first.assertion_id = "llm_0"
+        second = grader.grade(assertion, task, ExecutionTrace(result="done"), tmp_path)
+        grader.grade(assertion, task, ExecutionTrace(result="other"), tmp_path)
+
+        assert len(calls) == 2
+        assert second.score == 0.9
+        assert second.assertion_id != "llm_0"
+
+    def test_no_cache_by_default(self, tmp_path):
+        """Without caching, every grade calls the API."""
+        from harness.models import ExecutionTrace, LLMAssertion, Task, TaskCategory
+
+        grader, calls = self._grader(tmp_path, cache_grades=False)
+        task = Task(id="t", category=TaskCategory.CODING, description="", prompt="Do it")
+        assertion = LLMAssertion(rubric="Is it good?")
+
+        for _ in range(2):
+            grader.grade(assertion, task, ExecutionTrace(result="done"), tmp_path)
+
+        assert len(calls) == 2
+
+
 class TestConfigValidation:
     """Tests for config file validation."""
 
@@ -0,0 +1,56 @@
+"""Tests for environment isolation and file diffing."""
+
+import os
+
+from harness.isolator import EnvironmentIsolator, FileSnapshot
+
+
+class TestDiffFiles:
+    """Tests for snapshot_files and diff_files."""
+
+    def test_created_modified_deleted(self, tmp_path):
+        """Diff reports each kind of change against the snapshot."""
+        (tmp_path / "keep.py").write_text("a = 1\n")
+        (tmp_path / "edit.py").write_text("b = 1\n")
+        (tmp_path / "gone.py").write_text("c = 1\n")
+        isolator = EnvironmentIsolator(base_dir=tmp_path)
+        before = isolator.snapshot_files(tmp_path)
+
+        (tmp_path / "edit.py").write_text("b = 22\n")
+        (tmp_path / "gone.py").unlink()
+        (tmp_path / "new.py").write_text("d = 1\n")
+        changes = {c.path: c for c in isolator.diff_files(before, tmp_path)}
+
+        assert isinstance(before, FileSnapshot)
+        assert set(before.stats) == {"keep.py", "edit.py", "gone.py"}
+        assert {path: c.action for path, c in changes.items()} == {
+            "edit.py": "modified",
+            "gone.py": "deleted",
+            "new.py": "created",
+        }
+        assert "+b = 22" in changes["edit.py"].diff
+
+    def test_fast_mode_trusts_unchanged_stat(self, tmp_path):
+        """An edit that keeps size and mtime is only caught with fast=False."""
+        path = tmp_path / "app.py"
+        path.write_text("x = 1\n")
+        isolator = EnvironmentIsolator(base_dir=tmp_path)
+        before = isolator.snapshot_files(tmp_path)
+        st = path.stat()
+
+        path.write_text("x = 2\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert isolator.diff_files(before, tmp_path) == []
+        assert [c.action for c in isolator.diff_files(before, tmp_path, fast=False)] == [
+            "modified"
+        ]
+
+    def test_plain_dict_snapshot(self, tmp_path):
+        """A snapshot without stats falls back to comparing content."""
+        (tmp_path / "app.py").write_text("x = 2\n")
+        isolator = EnvironmentIsolator(base_dir=tmp_path)
+
+        changes = isolator.diff_files({"app.py": "x = 1\n"}, tmp_path)
+
+        assert [c.action for c in changes] == ["modified"]
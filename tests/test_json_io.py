@@ -0,0 +1,40 @@
+"""Tests for the results JSON helpers."""
+
+import pytest
+
+from harness import json_io
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if json_io.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+    return request.param
+
+
+class TestJsonBytes:
+    """Tests for json_bytes and json_loads."""
+
+    def test_compact_output(self, backend):
+        """Both paths write the same compact, UTF-8 bytes."""
+        data = {"task": "a", "scores": [0.5, 1], "note": "café", "ok": True, "none": None}
+
+        assert json_io.json_bytes(data) == (
+            '{"task":"a","scores":[0.5,1],"note":"café","ok":true,"none":null}'.encode()
+        )
+
+    def test_non_finite_floats_become_null(self, backend):
+        """NaN and infinities are written as null rather than invalid JSON."""
+        data = {"p_value": float("nan"), "range": (float("inf"), -float("inf"))}
+
+        assert json_io.json_bytes(data) == b'{"p_value":null,"range":[null,null]}'
+
+    def test_round_trip(self, backend):
+        """json_loads reads back what json_bytes wrote."""
+        data = {"results": [{"id": 1, "tags": ["x", "y"]}], "count": 1}
+
+        assert json_io.json_loads(json_io.json_bytes(data)) == data
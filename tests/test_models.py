@@ -1,11 +1,18 @@
 """Tests for the enhanced models."""
 
+import numpy as np
 import pytest
 from datetime import datetime
 
+from harness import models
+from harness.constants import MAX_INLINE_OUTPUT_CHARS
+from harness.readability_jit import word_syllable_counts
 from harness.models import (
     CodeCheckType,
     CostMetrics,
+    EvalResult,
+    ExecutionTrace,
+    GradeResult,
     LLMAssertion,
     ReadabilityMetrics,
     Task,
@@ -188,3 +195,110 @@ class TestReadabilityMetrics:
         """Handle empty content."""
         metrics = ReadabilityMetrics.from_content("")
         assert metrics.word_count == 0
+
+    def test_single_and_batch_agree(self, monkeypatch):
+        """Given the same counts, from_content and from_contents score identically."""
+        import textstat
+
+        text = "Run the comprehensive tests carefully. Fix the bug. Ship it today."
+        words, syllables = models._word_syllable_counts(text)
+        monkeypatch.setattr(textstat, "lexicon_count", lambda content, removepunct=True: words)
+        monkeypatch.setattr(textstat, "sentence_count", lambda content: len(models._SENT_RE.findall(content)))
+        monkeypatch.setattr(textstat, "syllable_count", lambda content: syllables)
+
+        single = ReadabilityMetrics.from_content(text)
+
+        assert ReadabilityMetrics.from_contents([text])[0] == single
+        assert single.flesch_reading_ease == round(single.flesch_reading_ease, 2)
+
+    def test_from_contents_batch(self):
+        """Batch scoring returns one result per document in order."""
+        simple = "Run the tests. Fix the bug. Ship it."
+        dense = (
+            "Comprehensive architectural considerations necessitate "
+            "systematic organizational documentation requirements."
+        )
+        metrics = ReadabilityMetrics.from_contents([simple, dense, ""])
+
+        assert len(metrics) == 3
+        assert metrics[0].word_count == 8
+        assert metrics[0].sentence_count == 3
+        assert metrics[0].flesch_reading_ease > metrics[1].flesch_reading_ease
+        assert metrics[0].is_accessible
+        assert metrics[2].word_count == 0
+        assert metrics[2].flesch_reading_ease == 0.0
+
+    def test_from_content_fast(self):
+        """Lix and Rix come from word, sentence and long-word counts."""
+        simple = ReadabilityMetrics.from_content_fast("Run the tests. Fix the bug. Ship it.")
+        dense = ReadabilityMetrics.from_content_fast(
+            "Comprehensive architectural considerations necessitate documentation."
+        )
+
+        assert (simple.word_count, simple.sentence_count) == (8, 3)
+        assert simple.lix == 2.67  # 8 / 3, rounded like from_contents
+        assert simple.rix == 0.0
+        assert simple.is_accessible
+        # 5 words, all long, one sentence: 5 + 100
+        assert dense.lix == 105.0
+        assert dense.rix == 5.0
+        assert not dense.is_accessible
+        assert ReadabilityMetrics.from_content_fast("").word_count == 0
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", "Run the tests. Fix the bug. Ship it.", "rhythm xyz AEIOU queue_y 123 a-b", " end"],
+    )
+    def test_syllable_kernel_matches_regex(self, text):
+        """The compiled counter agrees with the regex tokenizers on ASCII."""
+        words = models._WORD_RE.findall(text)
+        expected = (len(words), sum(max(1, len(models._SYL_RE.findall(w))) for w in words))
+
+        assert word_syllable_counts(np.frombuffer(text.encode("ascii"), dtype=np.uint8)) == expected
+
+    def test_from_contents_empty_list(self):
+        """Empty input yields empty output."""
+        assert ReadabilityMetrics.from_contents([]) == []
+
+
+class TestOutputCapping:
+    """Tests for capping oversized captured outputs."""
+
+    def test_small_output_unchanged(self):
+        """Outputs under the cap are kept as-is."""
+        grade = GradeResult(passed=True, score=1.0, full_output="ok")
+        assert grade.full_output == "ok"
+        assert grade.full_output_full == "ok"
+
+    def test_large_output_spilled(self, tmp_path):
+        """Oversized outputs are truncated and spilled to disk."""
+        big = "x" * (MAX_INLINE_OUTPUT_CHARS * 2)
+        result = EvalResult(
+            task_id="t",
+            config_name="c",
+            model="m",
+            run_index=0,
+            trace=ExecutionTrace(stderr=big, raw_output={"stdout": big, "code": 1}),
+            grades=[GradeResult(passed=False, score=0.0, full_output=big)],
+        )
+
+        result.spill_outputs(tmp_path / "outputs")
+
+        grade = result.grades[0]
+        assert len(grade.full_output) <= MAX_INLINE_OUTPUT_CHARS
+        assert f"[truncated, see {tmp_path.resolve()}" in grade.full_output
+        assert grade.full_output_full == big
+        assert result.trace.stderr_full == big
+        assert result.trace.raw_output["code"] == 1
+        assert len(list((tmp_path / "outputs").iterdir())) == 1
+
+    def test_loading_never_writes(self, tmp_path, monkeypatch):
+        """Validating large or already-capped values does not touch disk."""
+        monkeypatch.chdir(tmp_path)
+        big = "y" * (MAX_INLINE_OUTPUT_CHARS + 1)
+
+        trace = ExecutionTrace(stderr=big)
+        reloaded = ExecutionTrace.model_validate(trace.model_dump())
+
+        assert reloaded.stderr == big
+        assert list(tmp_path.iterdir()) == []
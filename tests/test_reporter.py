@@ -0,0 +1,694 @@
+"""Tests for the reporter module."""
+
+import json
+
+import numpy as np
+import pytest
+from datetime import datetime
+from rich.console import Console
+from rich.text import Text
+
+from harness import json_io, reporter as reporter_module
+from harness.models import EvalResult, ExecutionTrace, FileChange, GradeResult, TokenUsage
+from harness.reporter import (
+    Reporter,
+    _TOKEN_DELTA_STYLES,
+    _classify_delta,
+    _coalesce_lines,
+    _delta_bucket,
+    _fmt_thousands,
+    _group_results_by_key,
+    _merge_sorted_keys,
+    _p_value_label,
+    _pass_rate_label,
+    _rate_label,
+    _sig_for,
+    _sort_keys,
+)
+
+
+def make_result(
+    score: float,
+    passed: bool,
+    task_id: str = "test_task",
+    config_name: str = "test_config",
+    model: str = "claude-test",
+    input_tokens: int = 100,
+    output_tokens: int = 50,
+    duration_seconds: float = 10.0,
+) -> EvalResult:
+    """Create a minimal EvalResult for testing."""
+    return EvalResult(
+        task_id=task_id,
+        config_name=config_name,
+        model=model,
+        run_index=0,
+        timestamp=datetime.now(),
+        trace=ExecutionTrace(
+            usage=TokenUsage(input_tokens=input_tokens, output_tokens=output_tokens),
+            duration_seconds=duration_seconds,
+        ),
+        overall_score=score,
+        passed=passed,
+    )
+
+
+class TestGrouping:
+    """Tests for result grouping helpers."""
+
+    def test_groups_in_sorted_key_order(self):
+        """Groups are keyed and ordered by (task, config, model)."""
+        results = [
+            make_result(0.1, False, task_id="b"),
+            make_result(0.2, False, task_id="a", config_name="y"),
+            make_result(0.3, True, task_id="a", config_name="x"),
+            make_result(0.4, True, task_id="b"),
+        ]
+        grouped = _group_results_by_key(results)
+
+        assert list(grouped) == [
+            ("a", "x", "claude-test"),
+            ("a", "y", "claude-test"),
+            ("b", "test_config", "claude-test"),
+        ]
+        assert grouped.sorted_keys == tuple(grouped)
+        # Original order is preserved within a group
+        assert [r.overall_score for r in grouped[("b", "test_config", "claude-test")]] == [0.1, 0.4]
+
+    def test_groups_runs_of_equal_keys(self):
+        """Consecutive same-key results and later returns to a key share one group."""
+        results = [
+            make_result(score, True, task_id=task)
+            for score, task in [(0.1, "a"), (0.2, "a"), (0.3, "b"), (0.4, "a")]
+        ]
+        grouped = _group_results_by_key(results, include_model=False)
+
+        assert [r.overall_score for r in grouped[("a", "test_config")]] == [0.1, 0.2, 0.4]
+        assert [r.overall_score for r in grouped[("b", "test_config")]] == [0.3]
+
+    def test_sort_keys_matches_tuple_order(self):
+        """Joined-string sorting orders tuple keys exactly like tuple comparison."""
+        keys = [("a-b", "x", "m"), ("a", "y", "m"), ("a", "x", "m2"), ("a|", "x", "m"), ("a", "x", "m")]
+
+        assert _sort_keys(keys) == sorted(keys)
+        assert _sort_keys(["b", "a"]) == ["a", "b"]
+
+    def test_merge_sorted_keys(self):
+        """Sorted key sequences merge into a sorted, de-duplicated union."""
+        merged = _merge_sorted_keys([("a", "x"), ("c", "x")], [("a", "x"), ("b", "y")])
+
+        assert merged == [("a", "x"), ("b", "y"), ("c", "x")]
+
+    def test_pair_metrics(self):
+        """Keys missing from one side get None metrics; shared keys get both."""
+        grouped_a = _group_results_by_key([make_result(1.0, True, task_id="a")])
+        grouped_b = _group_results_by_key(
+            [make_result(1.0, True, task_id="a"), make_result(0.0, False, task_id="b")]
+        )
+
+        keys, metrics_a, metrics_b = Reporter()._pair_metrics(grouped_a, grouped_b)
+
+        assert [key[0] for key in keys] == ["a", "b"]
+        assert metrics_a[0].passed == 1 and metrics_a[1] is None
+        assert [m.total_runs for m in metrics_b] == [1, 1]
+
+        keys, metrics_a, metrics_b = Reporter()._pair_metrics(grouped_b, grouped_b)
+        assert len(keys) == 2 and None not in metrics_a + metrics_b
+
+
+class TestCalculateMetrics:
+    """Tests for Reporter._calculate_metrics aggregation."""
+
+    def test_aggregates(self):
+        """Averages, pass counts, and cost are computed per group."""
+        results = [
+            make_result(1.0, True, input_tokens=1_000_000, output_tokens=0, duration_seconds=4.0),
+            make_result(0.5, False, input_tokens=0, output_tokens=1_000_000, duration_seconds=2.0),
+        ]
+        metrics = Reporter()._calculate_metrics(results)
+
+        assert metrics.total_runs == 2
+        assert metrics.passed == 1
+        assert metrics.failed == 1
+        assert metrics.pass_rate == pytest.approx(0.5)
+        assert metrics.avg_score == pytest.approx(0.75)
+        assert metrics.avg_tokens == 1_000_000
+        assert metrics.avg_duration == pytest.approx(3.0)
+        # Default prices: $3/1M input, $15/1M output
+        assert metrics.avg_cost == pytest.approx(9.0)
+        assert metrics.pass_at_k[1] == pytest.approx(0.5)
+        assert metrics.stability is not None
+
+    def test_empty_group(self):
+        """Empty groups produce zeroed metrics."""
+        metrics = Reporter()._calculate_metrics([])
+
+        assert metrics.total_runs == 0
+        assert metrics.pass_rate == 0
+        assert metrics.avg_tokens == 0
+        assert metrics.avg_cost == 0
+        assert metrics.stability is None
+        assert metrics.pass_at_k == {1: 0.0, 3: 0.0, 5: 0.0}
+        assert Reporter()._calculate_metrics([]) is metrics
+
+
+class TestBatchedMetrics:
+    """Tests for vectorized aggregation across many groups."""
+
+    def test_batch_matches_per_group(self):
+        """reduceat-based aggregation agrees with the per-group path."""
+        rng = np.random.default_rng(3)
+        groups = [
+            [
+                make_result(
+                    float(rng.random()),
+                    bool(rng.random() > 0.5),
+                    model=str(rng.choice(["claude-test", "claude-opus-4-20250514"])),
+                    input_tokens=int(rng.integers(0, 5000)),
+                    output_tokens=int(rng.integers(0, 5000)),
+                    duration_seconds=float(rng.random() * 60),
+                )
+                for _ in range(size)
+            ]
+            for size in (1, 2, 7, 40)
+        ]
+        reporter = Reporter()
+
+        batched = reporter._compute_metrics_many(groups)
+
+        for group, metrics in zip(groups, batched):
+            expected = reporter._compute_metrics(group)
+            assert metrics.total_runs == expected.total_runs
+            assert metrics.passed == expected.passed
+            assert metrics.avg_tokens == expected.avg_tokens
+            assert metrics.avg_score == pytest.approx(expected.avg_score)
+            assert metrics.avg_duration == pytest.approx(expected.avg_duration)
+            assert metrics.avg_cost == pytest.approx(expected.avg_cost)
+            assert metrics.pass_at_k == pytest.approx(expected.pass_at_k)
+            assert metrics.stability.variance == pytest.approx(expected.stability.variance)
+            assert metrics.stability.coefficient_of_variation == pytest.approx(
+                expected.stability.coefficient_of_variation
+            )
+            assert metrics.stability.score_range == pytest.approx(expected.stability.score_range)
+
+    def test_many_uses_batch_above_threshold(self, monkeypatch):
+        """Large uncached batches take the vectorized path and are cached."""
+        monkeypatch.setattr(reporter_module, "_BATCH_METRICS_MIN_RESULTS", 4)
+        reporter = Reporter()
+        groups = [[make_result(0.5, True)] * 3, [], [make_result(0.9, True)] * 2]
+        monkeypatch.setattr(reporter, "_compute_metrics", None)
+
+        metrics = reporter._calculate_metrics_many(groups)
+
+        assert [m.total_runs for m in metrics] == [3, 0, 2]
+        assert reporter._calculate_metrics(groups[0]) is metrics[0]
+
+
+class TestCheckRegression:
+    """Tests for Reporter.check_regression."""
+
+    def test_detects_regression(self):
+        """A large significant drop is flagged as a regression."""
+        baseline = [make_result(0.9, True) for _ in range(10)]
+        current = [make_result(0.2, False) for _ in range(10)]
+
+        has_regressions, data = Reporter().check_regression(baseline, current)
+
+        assert has_regressions
+        assert data["regression_count"] == 1
+        assert data["comparisons"][0]["task_id"] == "test_task"
+
+    def test_no_regression(self):
+        """Identical result sets are not flagged."""
+        baseline = [make_result(0.9, True) for _ in range(5)]
+        current = [make_result(0.9, True) for _ in range(5)]
+
+        has_regressions, data = Reporter().check_regression(baseline, current)
+
+        assert not has_regressions
+        assert data["improvement_count"] == 0
+
+    @pytest.mark.parametrize("require_significance", [True, False])
+    def test_summary_only_matches_full_report(self, require_significance):
+        """full_report=False gives the same verdict with a minimal dict."""
+        baseline = [make_result(0.9, True, task_id="big") for _ in range(10)]
+        baseline += [make_result(0.9, i < 3, task_id="noisy") for i in range(4)]
+        baseline += [make_result(0.9, True, task_id="dropped")]
+        current = [make_result(0.9, True, task_id="big") for _ in range(10)]
+        current += [make_result(0.9, i < 2, task_id="noisy") for i in range(4)]
+        scenarios = [
+            (baseline, current),
+            (baseline, current + [make_result(0.9, True, task_id="dropped")]),
+        ]
+
+        verdicts = []
+        for base, cur in scenarios:
+            full, _ = Reporter().check_regression(
+                base, cur, require_significance=require_significance
+            )
+            quick, data = Reporter().check_regression(
+                base, cur, require_significance=require_significance, full_report=False
+            )
+            assert quick == full
+            assert data == {
+                "has_regressions": quick,
+                "threshold": 0.05,
+                "require_significance": require_significance,
+            }
+            verdicts.append(quick)
+
+        # The missing group always regresses; the small noisy drop only
+        # counts when significance is not required
+        assert verdicts == [True, not require_significance]
+
+    def test_shared_groups_reuse_metrics(self, monkeypatch):
+        """Precomputed groups let check_regression reuse printed metrics."""
+        baseline = [make_result(0.9, True) for _ in range(3)]
+        current = [make_result(0.8, True) for _ in range(3)]
+        reporter = Reporter(Console(record=True))
+        baseline_grouped = reporter.group_results(baseline)
+        current_grouped = reporter.group_results(current)
+        calls = []
+        compute = reporter._compute_metrics
+        monkeypatch.setattr(reporter, "_compute_metrics", lambda rs: calls.append(rs) or compute(rs))
+
+        reporter.print_regression_comparison(
+            baseline, current,
+            baseline_grouped=baseline_grouped, current_grouped=current_grouped,
+        )
+        reporter.check_regression(
+            baseline, current,
+            baseline_grouped=baseline_grouped, current_grouped=current_grouped,
+        )
+
+        assert len(calls) == 2
+
+    def test_many_keys_in_order(self):
+        """Large key sets are compared in key order through the batched metrics."""
+        baseline = [make_result(0.9, True, task_id=f"t{i:02d}") for i in range(40) for _ in range(3)]
+        current = [make_result(0.2, False, task_id=f"t{i:02d}") for i in range(40) for _ in range(3)]
+
+        _, data = Reporter().check_regression(baseline, current, require_significance=False)
+
+        assert data["regression_count"] == 40
+        assert [c["task_id"] for c in data["comparisons"]] == [f"t{i:02d}" for i in range(40)]
+
+    def test_missing_keys(self):
+        """Keys present on only one side are still compared."""
+        baseline = [make_result(0.9, True, task_id="a")]
+        current = [make_result(0.9, True, task_id="b")]
+
+        _, data = Reporter().check_regression(baseline, current)
+
+        assert [c["task_id"] for c in data["comparisons"]] == ["a", "b"]
+
+
+class TestMetricsCache:
+    """Tests for memoization of _calculate_metrics."""
+
+    def test_same_group_reuses_metrics(self):
+        """Repeated calls with the same list return the cached object."""
+        reporter = Reporter()
+        group = [make_result(0.8, True) for _ in range(3)]
+
+        assert reporter._calculate_metrics(group) is reporter._calculate_metrics(group)
+
+    def test_mutated_group_recomputed(self):
+        """Appending to a group invalidates its cached metrics."""
+        reporter = Reporter()
+        group = [make_result(0.8, True)]
+        first = reporter._calculate_metrics(group)
+
+        group.append(make_result(0.2, False))
+        second = reporter._calculate_metrics(group)
+
+        assert second is not first
+        assert second.total_runs == 2
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """The oldest groups are evicted once the cache is full."""
+        monkeypatch.setattr(reporter_module, "_METRICS_CACHE_MAX_ENTRIES", 2)
+        reporter = Reporter()
+        groups = [[make_result(0.5, True)] for _ in range(3)]
+
+        for group in groups:
+            reporter._calculate_metrics(group)
+
+        assert len(reporter._metrics_cache) == 2
+        assert id(groups[0]) not in reporter._metrics_cache
+
+    def test_statistical_comparison_reused(self, monkeypatch):
+        """Re-rendering the same comparison skips the analyzer."""
+        reporter = Reporter(Console(record=True))
+        results_a = [make_result(0.9, True) for _ in range(5)]
+        results_b = [make_result(0.4, False) for _ in range(5)]
+        calls = []
+        compare = reporter_module.StatisticalAnalyzer.compare_configs
+
+        def counting(a, b):
+            calls.append((a, b))
+            return compare(a, b)
+
+        monkeypatch.setattr(reporter_module.StatisticalAnalyzer, "compare_configs", counting)
+
+        first, _ = reporter.print_statistical_comparison(results_a, results_b)
+        second, _ = reporter.print_statistical_comparison(results_a, results_b)
+        results_b.append(make_result(0.1, False))
+        third, _ = reporter.print_statistical_comparison(results_a, results_b)
+
+        assert first is second
+        assert third.n_b == 6
+        assert len(calls) == 2
+
+    def test_comparison_cache_is_bounded(self, monkeypatch):
+        """The least recently used comparison is evicted once the cache is full."""
+        monkeypatch.setattr(reporter_module, "_COMPARISON_CACHE_MAX_ENTRIES", 2)
+        reporter = Reporter()
+        baseline = [make_result(0.5, True)]
+        groups = [[make_result(0.5, True)] for _ in range(3)]
+
+        def analysis(a, b):
+            return len(a) + len(b)
+
+        reporter._compare_cached(analysis, baseline, groups[0])
+        reporter._compare_cached(analysis, baseline, groups[1])
+        reporter._compare_cached(analysis, baseline, groups[0])  # refreshes groups[0]
+        reporter._compare_cached(analysis, baseline, groups[2])
+
+        assert len(reporter._comparison_cache) == 2
+        assert ("analysis", id(baseline), id(groups[1])) not in reporter._comparison_cache
+        assert ("analysis", id(baseline), id(groups[0])) in reporter._comparison_cache
+
+
+class TestExportJson:
+    """Tests for Reporter.export_json."""
+
+    def test_round_trip(self, tmp_path):
+        """Exported file is valid JSON with summary and all results."""
+        results = [make_result(0.9, True), make_result(0.1, False, task_id="other")]
+        path = tmp_path / "export.json"
+
+        Reporter().export_json(results, path)
+        data = json.loads(path.read_text())
+
+        assert data["num_results"] == 2
+        assert data["summary"]["passed"] == 1
+        assert [r["task_id"] for r in data["results"]] == ["test_task", "other"]
+        assert EvalResult.model_validate(data["results"][0]).overall_score == 0.9
+
+    def test_empty_results(self, tmp_path):
+        """Exporting no results still produces valid JSON."""
+        path = tmp_path / "export.json"
+
+        Reporter().export_json([], path)
+        data = json.loads(path.read_text())
+
+        assert data["results"] == []
+        assert data["summary"] == {}
+
+    def test_spans_batches(self, tmp_path, monkeypatch):
+        """Results split across several batches form a single array."""
+        monkeypatch.setattr(reporter_module, "_EXPORT_BATCH_SIZE", 2)
+        results = [make_result(i / 10, True, task_id=f"t{i}") for i in range(5)]
+        path = tmp_path / "export.json"
+
+        Reporter().export_json(results, path)
+        data = json.loads(path.read_text())
+
+        assert [r["task_id"] for r in data["results"]] == [f"t{i}" for i in range(5)]
+
+    def test_indented(self, tmp_path):
+        """indent= produces pretty-printed JSON with the same content."""
+        results = [make_result(0.9, True), make_result(0.1, False)]
+        compact, pretty = tmp_path / "compact.json", tmp_path / "pretty.json"
+        reporter = Reporter()
+
+        reporter.export_json(results, compact)
+        reporter.export_json(results, pretty, indent=2)
+
+        assert '\n  "num_results": 2,' in pretty.read_text()
+        data_compact, data_pretty = json.loads(compact.read_text()), json.loads(pretty.read_text())
+        assert data_pretty["results"] == data_compact["results"]
+        assert data_pretty["summary"] == data_compact["summary"]
+
+    def test_stdlib_json_fallback(self, tmp_path, monkeypatch):
+        """Export works without orjson installed."""
+        monkeypatch.setattr(json_io, "orjson", None)
+        path = tmp_path / "export.json"
+
+        Reporter().export_json([make_result(0.5, True)], path)
+
+        assert json.loads(path.read_text())["num_results"] == 1
+
+
+class TestPrintAnalysis:
+    """Tests for Reporter.print_analysis output."""
+
+    def test_assertion_breakdown(self):
+        """Per-assertion pass counts are reported across runs."""
+        passing = make_result(1.0, True)
+        passing.grades = [GradeResult(assertion_name="tests_pass", passed=True, score=1.0)]
+        failing = make_result(0.0, False)
+        failing.grades = [GradeResult(assertion_name="tests_pass", passed=False, score=0.0)]
+        console = Console(record=True, width=120)
+
+        Reporter(console).print_analysis([passing, failing])
+
+        assert "tests_pass: 1/2 (50%)" in console.export_text()
+
+    def test_assertion_id_fallback(self):
+        """Unnamed assertions are tallied under their id, in first-seen order."""
+        result = make_result(0.5, True)
+        result.grades = [
+            GradeResult(assertion_id="a2", passed=True, score=1.0),
+            GradeResult(assertion_name="tests_pass", passed=False, score=0.0),
+            GradeResult(assertion_id="a2", passed=False, score=0.0),
+        ]
+        console = Console(record=True, width=120)
+
+        Reporter(console).print_analysis([result])
+
+        text = console.export_text()
+        assert "a2: 1/2 (50%)" in text
+        assert text.index("a2:") < text.index("tests_pass: 0/1 (0%)")
+
+
+class TestBufferedOutput:
+    """Tests for batching multi-line reports into a single write."""
+
+    def test_summary_written_once(self):
+        """print_summary reaches the output file in one write."""
+        writes = []
+
+        class Sink:
+            def write(self, text):
+                writes.append(text)
+
+            def flush(self):
+                pass
+
+        results = [make_result(0.9, True, task_id=f"t{i}") for i in range(3)]
+
+        Reporter(Console(file=Sink(), width=120)).print_summary(results)
+
+        assert len(writes) == 1
+        assert "EVAL RESULTS" in writes[0]
+
+
+class TestComparisonTables:
+    """Tests for rendered regression and diff tables."""
+
+    def test_delta_buckets(self):
+        """Only changes strictly beyond ±10% are flagged; NaN is N/A."""
+        buckets = _delta_bucket(np.array([-10.5, -10.0, 0.0, 10.0, 10.5, np.nan]))
+
+        assert buckets.tolist() == [0, 1, 1, 1, 2, 3]
+
+    @pytest.mark.parametrize(
+        ("pct", "expected"),
+        [
+            (-10.5, ("green", "10.5% fewer")),
+            (-10.0, ("dim", "-10.0%")),
+            (10.0, ("dim", "+10.0%")),
+            (10.5, ("red", "+10.5% more")),
+            (float("nan"), ("dim", "+nan%")),
+        ],
+    )
+    def test_classify_delta(self, pct, expected):
+        """Deltas beyond ±threshold pick the outer styles."""
+        assert _classify_delta(pct, 10, _TOKEN_DELTA_STYLES) == expected
+
+    @pytest.mark.parametrize("value", [0.0, 999.4, 1049.5, 1050.5, 1234567.89, -2500.5])
+    def test_fmt_thousands(self, value):
+        """Thousands formatting matches the ',.0f' format spec."""
+        assert _fmt_thousands(value) == f"{value:,.0f}"
+
+    def test_coalesce_lines(self):
+        """Runs of strings are joined; other renderables split the runs."""
+        text = Text("x")
+
+        assert _coalesce_lines(["a", "", "b", text, "c"]) == ["a\n\nb", text, "c"]
+
+    def test_rate_labels(self):
+        """Cached rate labels match the '.0%' format spec."""
+        assert _rate_label(2 / 3) == "67%"
+        assert _rate_label(0.125) == "12%"
+        assert _pass_rate_label(3, 5, 0.6) == "3/5 (60%)"
+
+    @pytest.mark.parametrize(
+        ("p_value", "marker"),
+        [(0.001, "**"), (0.01, "*"), (0.049, "*"), (0.05, ""), (0.5, ""), (None, "")],
+    )
+    def test_sig_for(self, p_value, marker):
+        """p-values map to **, * or no significance marker."""
+        assert _sig_for(p_value) == marker
+
+    def test_p_value_label(self):
+        """p-value labels carry three decimals and the significance marker."""
+        assert _p_value_label(0.0042) == "p=0.004**"
+        assert _p_value_label(0.03) == "p=0.030*"
+        assert _p_value_label(None) == "p=N/A"
+
+    def _render(self, method, *args, **kwargs) -> str:
+        console = Console(record=True, width=160)
+        getattr(Reporter(console), method)(*args, **kwargs)
+        return console.export_text()
+
+    def test_regression_comparison(self):
+        """Pass-rate and token deltas are shown per key."""
+        baseline = [make_result(0.9, True, input_tokens=100) for _ in range(2)]
+        current = [make_result(0.1, False, input_tokens=200) for _ in range(2)]
+
+        text = self._render("print_regression_comparison", baseline, current)
+
+        assert "-100%" in text
+        assert "+67%" in text  # 150 -> 250 tokens
+        assert "Regressions: 1 task(s) got worse" in text
+
+    def test_diff_winner(self):
+        """The better side is named as the winner."""
+        results_a = [make_result(0.1, False)]
+        results_b = [make_result(0.9, True)]
+
+        text = self._render("print_diff", results_a, results_b, label_a="old", label_b="new")
+
+        row = next(line for line in text.splitlines() if "test_task" in line)
+        assert "+100%" in row
+        assert row.rstrip(" │").endswith("new")
+
+    def test_statistical_comparison_efficiency(self):
+        """Efficiency lines render deltas with their direction."""
+        results_a = [make_result(0.5, True, input_tokens=1000, duration_seconds=10.0) for _ in range(5)]
+        results_b = [make_result(0.5, True, input_tokens=500, duration_seconds=20.0) for _ in range(5)]
+
+        text = self._render(
+            "print_statistical_comparison", results_a, results_b, show_cost=True
+        )
+
+        assert "Tokens:   1,050 → 550 (47.6% fewer" in text
+        assert "Duration: 10.0s → 20.0s (+100.0% slower" in text
+        assert "Cost:     $0.0037 → $0.0022 (-40.0%)" in text
+
+    def test_statistical_comparison_small_samples(self, monkeypatch):
+        """Tiny samples skip the score test but still compare efficiency."""
+        def fail(*_args):
+            raise AssertionError("statistical test should not run")
+
+        monkeypatch.setattr(reporter_module.StatisticalAnalyzer, "compare_configs", fail)
+        console = Console(record=True, width=160)
+
+        comparison, efficiency = Reporter(console).print_statistical_comparison(
+            [make_result(0.5, True) for _ in range(3)],
+            [make_result(0.9, True) for _ in range(5)],
+            show_cost=True,
+        )
+
+        text = console.export_text()
+        assert efficiency is not None
+        assert not comparison.is_significant
+        assert np.isnan(comparison.p_value)
+        assert comparison.delta == pytest.approx(0.4)
+        assert "Insufficient sample size (n=3)" in text
+        assert "Mann-Whitney" not in text
+        assert "Cost:" in text
+
+    def test_quick_comparison(self, monkeypatch):
+        """Quick comparison reports means without running statistical tests."""
+        def fail(*_args):
+            raise AssertionError("statistical test should not run")
+
+        monkeypatch.setattr(reporter_module.StatisticalAnalyzer, "compare_configs", fail)
+
+        text = self._render(
+            "print_quick_comparison",
+            [make_result(0.5, True), make_result(0.7, True)],
+            [make_result(0.9, True)],
+            label_a="old",
+            label_b="new",
+        )
+
+        assert "old → new: 0.600 → 0.900 (+0.300, n=2/1)" in text
+
+    def test_diff_missing_side(self):
+        """Keys missing from one side render as N/A."""
+        text = self._render("print_diff", [make_result(0.5, True)], [])
+
+        assert "N/A" in text
+
+
+class TestDetailViews:
+    """Tests for print_detailed_result and print_explain."""
+
+    def _result(self) -> EvalResult:
+        result = make_result(0.4, False)
+        result.grades = [
+            GradeResult(
+                assertion_name="tests_pass",
+                passed=False,
+                score=0.4,
+                details="x" * 300,
+                full_output="FAILED test_auth",
+            )
+        ]
+        result.trace.file_changes = [
+            FileChange(path="src/auth.py", action="modified", diff="-old\n+new\n")
+        ]
+        result.trace.claude_prompt = "Fix the bug"
+        return result
+
+    def test_detailed_result(self):
+        """Failed assertion details are truncated to a preview."""
+        console = Console(record=True, width=120)
+
+        Reporter(console).print_detailed_result(self._result(), verbose=True)
+        text = console.export_text()
+
+        assert "tests_pass: 0.40" in text
+        assert "x" * 200 + "..." in text.replace("\n", "").replace(" ", "")
+        assert "src/auth.py" in text
+        assert "+new" in text
+
+    def test_explain(self):
+        """Explain view includes prompt, diffs and grading output."""
+        console = Console(record=True, width=120)
+
+        Reporter(console).print_explain(self._result())
+        text = console.export_text()
+
+        assert "Fix the bug" in text
+        assert "MODIFIED: src/auth.py" in text
+        assert "FAILED test_auth" in text
+
+    def test_explain_claude_md_preview(self):
+        """Short CLAUDE.md is shown whole; long ones are cut with an ellipsis."""
+        result = self._result()
+        console = Console(record=True, width=200)
+
+        result.trace.config_snapshot.claude_md = "Use pytest"
+        Reporter(console).print_explain(result)
+        result.trace.config_snapshot.claude_md = "y" * 150
+        Reporter(console).print_explain(result)
+        text = console.export_text()
+
+        assert "CLAUDE.md Preview: Use pytest\n" in text
+        assert "CLAUDE.md Preview: " + "y" * 100 + "...\n" in text
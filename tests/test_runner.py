@@ -0,0 +1,428 @@
+"""Tests for EvalRunner orchestration."""
+
+from collections import Counter
+from datetime import datetime
+import json
+import threading
+import time
+
+import pytest
+
+from harness.executor import Executor
+from harness.isolator import EnvironmentIsolator
+from harness.models import (
+    CodeAssertion,
+    CodeCheckType,
+    Config,
+    ExecutionTrace,
+    FileChange,
+    LLMAssertion,
+    Task,
+    TaskCategory,
+    TaskDifficulty,
+    ToolCall,
+)
+from harness import json_io, runner as runner_module
+from harness.runner import EvalRunner
+
+
+class FakeExecutor(Executor):
+    """Executor that returns an empty trace, optionally after a delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.in_flight_by_model = Counter()
+        self.max_in_flight_by_model = Counter()
+        self._lock = threading.Lock()
+
+    def run(self, prompt, config, working_dir, timeout=300, env_override=None):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.in_flight_by_model[config.model] += 1
+            self.max_in_flight_by_model[config.model] = max(
+                self.max_in_flight_by_model[config.model], self.in_flight_by_model[config.model]
+            )
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+            self.in_flight_by_model[config.model] -= 1
+        return ExecutionTrace(num_turns=1, duration_seconds=self.delay)
+
+
+class FakeGrader:
+    """Grader that passes every run without calling any API."""
+
+    def grade(self, task, trace, working_dir):
+        return [], 1.0, True
+
+
+def make_task(task_id: str = "task") -> Task:
+    """Create a minimal Task for testing."""
+    return Task(id=task_id, category=TaskCategory.CODING, description="", prompt="Do it")
+
+
+@pytest.fixture
+def make_runner(tmp_path):
+    """Build an EvalRunner wired to fakes and temporary directories."""
+
+    def _make(executor: Executor | None = None) -> EvalRunner:
+        return EvalRunner(
+            executor=executor or FakeExecutor(),
+            grader=FakeGrader(),
+            isolator=EnvironmentIsolator(base_dir=tmp_path),
+            results_dir=tmp_path / "results",
+        )
+
+    return _make
+
+
+class TestRunMatrix:
+    """Tests for EvalRunner.run_matrix."""
+
+    def test_matrix_order_and_limit(self, make_runner):
+        """Runs cover tasks x configs x models x runs in order, up to limit."""
+        runner = make_runner()
+        tasks = [make_task("a"), make_task("b")]
+        configs = [Config(name="base")]
+
+        results = runner.run_matrix(tasks, configs, models=["m1", "m2"], runs_per_combo=2)
+        limited = runner.run_matrix(tasks, configs, models=["m1", "m2"], runs_per_combo=2, limit=3)
+
+        assert [(r.task_id, r.model, r.run_index) for r in results] == [
+            (task, model, run) for task in "ab" for model in ("m1", "m2") for run in (0, 1)
+        ]
+        assert len(limited) == 3
+        assert runner.run_matrix(tasks, configs, limit=0) == []
+
+    def test_config_snapshot_shared_per_config_and_model(self, make_runner):
+        """Runs of the same config and model share one ConfigSnapshot."""
+        runner = make_runner()
+        config = Config(name="base", claude_md="x" * 300)
+
+        results = runner.run_matrix(
+            [make_task("a"), make_task("b")], [config], models=["m1", "m2"], runs_per_combo=2
+        )
+
+        snapshots = {r.model: r.trace.config_snapshot for r in results}
+        assert all(r.trace.config_snapshot is snapshots[r.model] for r in results)
+        assert snapshots["m1"].model == "m1"
+        assert len(snapshots["m1"].claude_md) == 200
+
+    def test_concurrent_runs_keep_matrix_order(self, make_runner):
+        """Concurrent runs overlap but results come back in matrix order."""
+        executor = FakeExecutor(delay=0.05)
+        runner = make_runner(executor)
+        tasks = [make_task(f"t{i}") for i in range(4)]
+        seen = []
+
+        results = runner.run_matrix(
+            tasks,
+            [Config(name="base")],
+            runs_per_combo=2,
+            callback=lambda task, config, model, run_idx, result: seen.append(task.id),
+            concurrency=4,
+        )
+
+        assert [(r.task_id, r.run_index) for r in results] == [
+            (f"t{i}", run) for i in range(4) for run in (0, 1)
+        ]
+        assert sorted(seen) == sorted(r.task_id for r in results)
+        assert 1 < executor.max_in_flight <= 4
+
+    def test_per_model_concurrency(self, make_runner):
+        """Each model is capped separately within the overall limit."""
+        executor = FakeExecutor(delay=0.05)
+        runner = make_runner(executor)
+
+        runner.run_matrix(
+            [make_task(f"t{i}") for i in range(3)],
+            [Config(name="base")],
+            models=["m1", "m2"],
+            runs_per_combo=2,
+            concurrency=4,
+            per_model_concurrency=1,
+        )
+
+        assert executor.max_in_flight_by_model == {"m1": 1, "m2": 1}
+        assert executor.max_in_flight == 2
+
+    @pytest.mark.parametrize("concurrency", [1, 2])
+    def test_stream_to(self, make_runner, tmp_path, concurrency):
+        """Each result is appended to the stream as it completes."""
+        runner = make_runner()
+        stream = tmp_path / "partial.jsonl"
+        tasks = [make_task("a"), make_task("b")]
+
+        results = runner.run_matrix(
+            tasks, [Config(name="c")], runs_per_combo=1, concurrency=concurrency,
+            stream_to=stream,
+        )
+
+        assert sorted(runner.load_results(stream), key=lambda r: r.task_id) == results
+
+    def test_iter_results_skips_truncated_record(self, make_runner, tmp_path):
+        """A partially written trailing line from a crash is ignored."""
+        runner = make_runner()
+        stream = tmp_path / "partial.jsonl"
+        runner.run_matrix([make_task("a")], [Config(name="c")], runs_per_combo=2, stream_to=stream)
+        with stream.open("a") as f:
+            f.write('{"task_id": "b", "conf')
+
+        assert [r.run_index for r in runner.iter_results(stream)] == [0, 1]
+
+
+class TestFixtureSnapshot:
+    """Tests for caching the pre-run fixture snapshot."""
+
+    def test_snapshot_reused_across_runs(self, make_runner, tmp_path, monkeypatch):
+        """A fixture is snapshotted once per matrix, and again after it changes."""
+        fixture = tmp_path / "fixture"
+        fixture.mkdir()
+        (fixture / "app.py").write_text("x = 1\n")
+        task = make_task()
+        task.fixture_path = fixture
+        runner = make_runner()
+        calls = []
+        snapshot_files = runner.isolator.snapshot_files
+        monkeypatch.setattr(
+            runner.isolator,
+            "snapshot_files",
+            lambda path, *args: calls.append(path) or snapshot_files(path, *args),
+        )
+
+        runner.run_matrix([task], [Config(name="a"), Config(name="b")], runs_per_combo=2)
+        assert len(calls) == 1
+
+        (fixture / "util.py").write_text("y = 2\n")
+        results = runner.run_matrix([task], [Config(name="a")], runs_per_combo=1)
+        assert len(calls) == 2
+        assert results[0].trace.file_changes == []
+
+    def test_snapshot_refreshed_after_nested_edit(self, make_runner, tmp_path):
+        """Editing a file in a fixture subdirectory invalidates the snapshot."""
+        fixture = tmp_path / "fixture"
+        (fixture / "pkg").mkdir(parents=True)
+        (fixture / "pkg" / "app.py").write_text("x = 1\n")
+        task = make_task()
+        task.fixture_path = fixture
+        runner = make_runner()
+
+        runner.run_matrix([task], [Config(name="a")], runs_per_combo=1)
+        root_mtime = fixture.stat().st_mtime_ns
+        (fixture / "pkg" / "app.py").write_text("x = 100\n")
+        results = runner.run_matrix([task], [Config(name="a")], runs_per_combo=1)
+
+        assert fixture.stat().st_mtime_ns == root_mtime
+        assert results[0].trace.file_changes == []
+
+
+class TestReuseEnvironments:
+    """Tests for resetting one environment across repeated runs."""
+
+    def test_runs_start_from_clean_fixture(self, tmp_path):
+        """Each reused run sees the fixture as if freshly copied."""
+        fixture = tmp_path / "fixture"
+        (fixture / "pkg").mkdir(parents=True)
+        (fixture / "pkg" / "app.py").write_text("x = 1\n")
+        (fixture / "keep.py").write_text("k = 1\n")
+        task = make_task()
+        task.fixture_path = fixture
+        seen = []
+
+        class EditingExecutor(FakeExecutor):
+            def run(self, prompt, config, working_dir, timeout=300, env_override=None):
+                seen.append(
+                    (
+                        working_dir,
+                        sorted(str(p.relative_to(working_dir)) for p in working_dir.rglob("*")),
+                        (working_dir / "pkg" / "app.py").read_text(),
+                        (working_dir / "CLAUDE.md").read_text(),
+                    )
+                )
+                (working_dir / "pkg" / "app.py").write_text("x = 2\n")
+                (working_dir / "keep.py").unlink()
+                (working_dir / "new").mkdir()
+                (working_dir / "new" / "made.py").write_text("m = 1\n")
+                return super().run(prompt, config, working_dir, timeout, env_override)
+
+        runner = EvalRunner(
+            executor=EditingExecutor(),
+            grader=FakeGrader(),
+            isolator=EnvironmentIsolator(base_dir=tmp_path),
+            results_dir=tmp_path / "results",
+            reuse_environments=True,
+        )
+
+        results = runner.run_matrix(
+            [task], [Config(name="c", claude_md="Be careful")], runs_per_combo=3
+        )
+
+        assert len({path for path, *_ in seen}) == 1
+        assert all(tuple(state) == seen[0][1:] for _, *state in seen)
+        assert seen[0][2:] == ("x = 1\n", "Be careful")
+        assert [
+            sorted((c.path, c.action) for c in r.trace.file_changes) for r in results
+        ] == [[("keep.py", "deleted"), ("new/made.py", "created"), ("pkg/app.py", "modified")]] * 3
+        assert not seen[0][0].exists()
+
+    def test_concurrent_runs_rejected(self, tmp_path):
+        """Reuse can't be combined with concurrency, rather than being ignored."""
+        runner = EvalRunner(
+            executor=FakeExecutor(),
+            grader=FakeGrader(),
+            isolator=EnvironmentIsolator(base_dir=tmp_path),
+            results_dir=tmp_path / "results",
+            reuse_environments=True,
+        )
+
+        with pytest.raises(ValueError, match="reuse_environments"):
+            runner.run_matrix([make_task()], [Config(name="c")], runs_per_combo=2, concurrency=2)
+
+
+class TestSaveResults:
+    """Tests for EvalRunner.save_results."""
+
+    def test_summary_file(self, make_runner):
+        """Results round-trip; no debug log unless requested."""
+        runner = make_runner()
+        results = runner.run_matrix(
+            [make_task("a"), make_task("b")], [Config(name="c")], runs_per_combo=1
+        )
+
+        path = runner.save_results(results, "out.json")
+
+        assert runner.load_results(path) == results
+        assert "grading_breakdown" not in json.loads(path.read_text())["results"][0]
+        assert not path.with_suffix(".debug.jsonl").exists()
+
+    def test_debug_log(self, make_runner):
+        """The debug log has a summary header and one result per line."""
+        runner = make_runner()
+        results = runner.run_matrix(
+            [make_task("a"), make_task("b")], [Config(name="c")], runs_per_combo=1
+        )
+
+        path = runner.save_results(results, "out.json", save_debug=True)
+        debug_path = path.with_suffix(".debug.jsonl")
+        header, *rows = debug_path.read_text().splitlines()
+
+        assert json.loads(header)["execution_summary"]["total_passed"] == 2
+        assert len(rows) == 2
+        assert "file_changes_summary" not in json.loads(path.read_text())["results"][0]["trace"]
+        record = runner.load_debug_result(debug_path, 1)
+        assert record["task_id"] == "b"
+        assert record["grading_breakdown"] == []
+        with pytest.raises(IndexError):
+            runner.load_debug_result(debug_path, 2)
+
+    def test_debug_projections(self, make_runner):
+        """Debug summaries are projected from the serialized trace."""
+        runner = make_runner()
+        result = runner.run_matrix([make_task()], [Config(name="c")], runs_per_combo=1)[0]
+        result.trace.file_changes = [FileChange(path="a.py", action="created", content_after="x")]
+        result.trace.tool_calls = [
+            ToolCall(name="Read", timestamp=datetime(2025, 1, 2, 3, 4, 5)),
+            ToolCall(name="Bash", error="exit 1"),
+        ]
+
+        trace = runner._full_result_dump(result)["trace"]
+
+        assert trace["file_changes_summary"] == [{"path": "a.py", "action": "created"}]
+        assert trace["tool_call_timeline"] == [
+            {"name": "Read", "had_error": False, "timestamp": "2025-01-02T03:04:05"},
+            {"name": "Bash", "had_error": True, "timestamp": None},
+        ]
+
+    def test_save_without_orjson(self, make_runner, monkeypatch):
+        """Saving works without orjson installed."""
+        monkeypatch.setattr(json_io, "orjson", None)
+        runner = make_runner()
+        results = runner.run_matrix([make_task("a")], [Config(name="c")], runs_per_combo=1)
+
+        path = runner.save_results(results, "out.json", save_debug=True)
+
+        assert runner.load_results(path) == results
+        assert runner.load_debug_result(path.with_suffix(".debug.jsonl"), 0)["task_id"] == "a"
+
+    def test_empty_results(self, make_runner):
+        """Saving no results still writes valid files."""
+        runner = make_runner()
+
+        path = runner.save_results([], "empty.json", save_debug=True)
+
+        assert json.loads(path.read_text())["results"] == []
+        header = json.loads(path.with_suffix(".debug.jsonl").read_text())
+        assert header["execution_summary"]["total_results"] == 0
+
+
+class TestLoading:
+    """Tests for task and config loading."""
+
+    def test_yaml_parsed_once_until_changed(self, tmp_path, monkeypatch):
+        """Reloading an unchanged file reuses the parse; edits are picked up."""
+        path = tmp_path / "config.yaml"
+        path.write_text("name: base\nmax_turns: 5\n")
+        parses = []
+        load = runner_module.yaml.load
+
+        def counting_load(*args, **kwargs):
+            parses.append(1)
+            return load(*args, **kwargs)
+
+        monkeypatch.setattr(runner_module.yaml, "load", counting_load)
+
+        first = EvalRunner.load_config(path)
+        first.model = "changed"
+        second = EvalRunner.load_config(path)
+        path.write_text("name: base\nmax_turns: 12\n")
+        third = EvalRunner.load_config(path)
+
+        assert len(parses) == 2
+        assert second.model != "changed"
+        assert (second.max_turns, third.max_turns) == (5, 12)
+
+    def test_load_task_assertions(self, tmp_path):
+        """Assertions are dispatched on type; unknown types are skipped."""
+        path = tmp_path / "fix.task.yaml"
+        path.write_text(
+            "id: fix\n"
+            "category: coding\n"
+            "description: Fix it\n"
+            "prompt: Fix the bug\n"
+            "fixture_path: ../fixture\n"
+            "assertions:\n"
+            "  - type: code\n"
+            "    check: file_contains\n"
+            "    file: app.py\n"
+            "    pattern: fixed\n"
+            "  - type: llm\n"
+            "    rubric: Is it clean?\n"
+            "  - type: manual\n"
+            "    note: ignored\n"
+        )
+
+        task = EvalRunner.load_task(path)
+
+        assert [type(a) for a in task.assertions] == [CodeAssertion, LLMAssertion]
+        assert task.assertions[0].check == CodeCheckType.FILE_CONTAINS
+        assert task.assertions[1].rubric == "Is it clean?"
+        assert task.difficulty == TaskDifficulty.MEDIUM
+        assert task.fixture_path == tmp_path / "../fixture"
+
+    def test_glob_loading_order_and_failures(self, tmp_path, monkeypatch, capsys):
+        """Glob loaders keep glob order and skip files that fail to parse."""
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.yaml").write_text(f"name: {name}\n")
+        (tmp_path / "bad.yaml").write_text("description: no name\n")
+        monkeypatch.chdir(tmp_path)
+        globbed = [p.stem for p in tmp_path.glob("*.yaml") if p.stem != "bad"]
+
+        configs = EvalRunner._load_from_glob("*.yaml", EvalRunner.load_config, "config")
+
+        assert [c.name for c in configs] == globbed
+        assert "Failed to load config bad.yaml" in capsys.readouterr().out
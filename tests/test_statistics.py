@@ -1,40 +1,68 @@
 """Tests for the statistics module."""
 
+import functools
+from collections import namedtuple
+import numpy as np
 import pytest
 from datetime import datetime
 
-from harness.models import EvalResult, ExecutionTrace, TokenUsage
+from harness.models import CostMetrics, EvalResult, ExecutionTrace, TokenUsage
 from harness.statistics import (
     ComparisonResult,
+    EffectMagnitude,
     EfficiencyComparison,
     PowerAnalysisResult,
     StabilityMetrics,
     StatisticalAnalyzer,
+    _compare_sorted_scores,
+    _mean_var,
 )
+from harness.statistics_jit import stability_jit
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _warm_scipy():
+    """Import scipy.stats during setup, not inside whichever test runs first.
+
+    The statistics module imports it lazily, so the first test to need it
+    would otherwise absorb the ~0.5s import in its duration.
+    """
+    import scipy.stats  # noqa: F401
+
+
+# Fixed timestamp for test results; no assertion reads it
+_FROZEN_NOW = datetime(2024, 1, 1)
+
+
+@functools.lru_cache(maxsize=None)
 def make_result(
     score: float,
     passed: bool,
     input_tokens: int = 100,
     output_tokens: int = 50,
     duration_seconds: float = 10.0,
+    model: str = "claude-test",
 ) -> EvalResult:
-    """Create a minimal EvalResult for testing."""
-    return EvalResult(
+    """Create a minimal EvalResult for testing.
+
+    Memoized: repeated arguments return the same shared, read-only instance.
+    The inputs are known-valid, so models are built with model_construct,
+    skipping validation.
+    """
+    return EvalResult.model_construct(
         task_id="test_task",
         config_name="test_config",
-        model="claude-test",
+        model=model,
         run_index=0,
-        timestamp=datetime.now(),
-        trace=ExecutionTrace(
+        timestamp=_FROZEN_NOW,
+        trace=ExecutionTrace.model_construct(
             session_id="test",
             result="test result",
-            usage=TokenUsage(input_tokens=input_tokens, output_tokens=output_tokens),
+            usage=TokenUsage.model_construct(input_tokens=input_tokens, output_tokens=output_tokens),
             duration_seconds=duration_seconds,
         ),
-        overall_score=score,
-        passed=passed,
+        overall_score=float(score),
+        passed=bool(passed),
     )
 
 
@@ -80,8 +108,8 @@ class TestCompareConfigs:
 
     def test_identical_results(self):
         """Identical results should show no significant difference."""
-        results_a = [make_result(0.8, True) for _ in range(10)]
-        results_b = [make_result(0.8, True) for _ in range(10)]
+        results_a = [make_result(0.8, True)] * 10
+        results_b = [make_result(0.8, True)] * 10
 
         comparison = StatisticalAnalyzer.compare_configs(results_a, results_b)
 
@@ -89,10 +117,65 @@ class TestCompareConfigs:
         assert comparison.delta == pytest.approx(0.0, abs=0.01)
         assert not comparison.is_significant
 
+    @pytest.mark.filterwarnings("error")
+    def test_insufficient_samples_means(self):
+        """Groups under 2 runs are reported without a test or warnings."""
+        single = StatisticalAnalyzer.compare_configs([make_result(0.4, False)], [make_result(0.9, True)] * 3)
+        empty = StatisticalAnalyzer.compare_configs([], [make_result(0.9, True)])
+
+        assert (single.mean_a, single.mean_b, single.p_value) == (0.4, pytest.approx(0.9), 1.0)
+        assert single.delta == pytest.approx(0.5)
+        assert np.isnan(empty.mean_a) and np.isnan(empty.delta)
+        assert not empty.is_significant
+
+    def test_constant_groups_skip_test(self, monkeypatch):
+        """All-equal scores on both sides match scipy without calling it."""
+        from scipy import stats
+
+        expected = stats.mannwhitneyu([1.0] * 6, [1.0] * 9, alternative="two-sided")
+        monkeypatch.setattr(stats, "mannwhitneyu", lambda *a, **kw: pytest.fail("test not skipped"))
+
+        comparison = StatisticalAnalyzer.compare_configs(
+            [make_result(1.0, True)] * 6, [make_result(1.0, True)] * 9
+        )
+
+        assert comparison.statistic == expected.statistic
+        assert comparison.p_value == expected.pvalue
+        assert comparison.effect_size == 0.0
+        assert not comparison.is_significant
+
+    def test_constant_groups_effect_size_matches_numpy(self):
+        """Zero-variance groups get the same effect size as numpy's moments."""
+        scores_a, scores_b = np.full(20, 0.3), np.full(20, 0.9)
+        pooled_std = np.sqrt((scores_a.var(ddof=1) + scores_b.var(ddof=1)) / 2)
+        delta = scores_b.mean() - scores_a.mean()
+        expected = abs(delta) / pooled_std if pooled_std > 0 else 0.0
+
+        comparison = StatisticalAnalyzer.compare_configs_arrays(scores_a, scores_b)
+
+        assert comparison.effect_size == pytest.approx(expected)
+
+    def test_equal_constant_groups_no_effect(self):
+        """Equal constant groups of different sizes have no effect, despite numpy noise."""
+        comparison = StatisticalAnalyzer.compare_configs_arrays(np.full(10, 0.9), np.full(20, 0.9))
+
+        assert comparison.delta == 0.0
+        assert comparison.effect_size == 0.0
+        assert comparison.effect_magnitude == "negligible"
+
+    def test_small_group_moments_match_numpy(self):
+        """Pure-Python mean and variance agree with numpy for small groups."""
+        scores = np.random.default_rng(3).random(20)
+
+        mean, var = _mean_var(scores)
+
+        assert mean == pytest.approx(scores.mean())
+        assert var == pytest.approx(scores.var(ddof=1))
+
     def test_different_results(self):
         """Clearly different results should show significant difference."""
-        results_a = [make_result(0.3, False) for _ in range(20)]
-        results_b = [make_result(0.9, True) for _ in range(20)]
+        results_a = [make_result(0.3, False)] * 20
+        results_b = [make_result(0.9, True)] * 20
 
         comparison = StatisticalAnalyzer.compare_configs(results_a, results_b)
 
@@ -112,26 +195,150 @@ class TestCompareConfigs:
     def test_effect_size_categories(self):
         """Effect size should be categorized correctly."""
         # Create results with medium difference
-        results_a = [make_result(0.5, False) for _ in range(15)]
-        results_b = [make_result(0.7, True) for _ in range(15)]
+        results_a = [make_result(0.5, False)] * 15
+        results_b = [make_result(0.7, True)] * 15
 
         comparison = StatisticalAnalyzer.compare_configs(results_a, results_b)
 
         assert comparison.effect_magnitude in ["small", "medium", "large"]
 
+    @pytest.mark.parametrize(
+        ("effect_size", "magnitude"),
+        [(0.0, "negligible"), (0.2, "small"), (0.49, "small"), (0.5, "medium"), (0.8, "large"), (-1.0, "large")],
+    )
+    def test_effect_magnitude_thresholds(self, effect_size, magnitude):
+        """Thresholds are inclusive lower bounds of the next magnitude."""
+        assert StatisticalAnalyzer.effect_magnitude(effect_size) == magnitude
+
+    def test_effect_magnitude_is_string_enum(self):
+        """Magnitudes are enum members that still read as their labels."""
+        magnitude = StatisticalAnalyzer.effect_magnitude(0.9)
+
+        assert magnitude is EffectMagnitude.LARGE
+        assert magnitude == "large"
+        assert f"d={magnitude}" == "d=large"
+
+    def test_large_samples_use_asymptotic(self, monkeypatch):
+        """Samples above 8 per side request the normal approximation."""
+        from scipy import stats
+
+        methods = []
+        mannwhitneyu = stats.mannwhitneyu
+
+        def recording(*args, **kwargs):
+            methods.append(kwargs.get("method"))
+            return mannwhitneyu(*args, **kwargs)
+
+        monkeypatch.setattr(stats, "mannwhitneyu", recording)
+        _compare_sorted_scores.cache_clear()
+
+        StatisticalAnalyzer.compare_configs(
+            [make_result(0.5, True)] * 9,
+            [make_result(0.6, True)] * 9,
+        )
+        StatisticalAnalyzer.compare_configs(
+            [make_result(0.5, True)] * 8,
+            [make_result(0.6, True)] * 21,
+        )
+
+        assert methods == ["asymptotic", "auto"]
+
+    def test_accepts_score_records(self):
+        """Score-only analyses take any record with overall_score and passed."""
+        Score = namedtuple("Score", "overall_score passed")
+        scores_a = [0.2, 0.9, 0.4, 0.7, 0.5]
+        scores_b = [0.1, 0.3, 0.6, 0.2]
+
+        from_records = StatisticalAnalyzer.compare_configs(
+            [Score(s, s > 0.5) for s in scores_a], [Score(s, s > 0.5) for s in scores_b]
+        )
+        from_results = StatisticalAnalyzer.compare_configs(
+            [make_result(s, s > 0.5) for s in scores_a], [make_result(s, s > 0.5) for s in scores_b]
+        )
+
+        assert from_records == from_results
+        assert StatisticalAnalyzer.pass_at_k_unbiased([Score(s, s > 0.5) for s in scores_a], 2) > 0
+
+    def test_reordered_inputs_share_cached_result(self):
+        """Comparisons are cached on sorted scores and handed out as copies."""
+        results_a = [make_result(s, s > 0.5) for s in (0.2, 0.9, 0.4, 0.7)]
+        results_b = [make_result(s, s > 0.5) for s in (0.1, 0.3, 0.6)]
+        _compare_sorted_scores.cache_clear()
+
+        first = StatisticalAnalyzer.compare_configs(results_a, results_b)
+        first.recommendation = "mutated"
+        second = StatisticalAnalyzer.compare_configs(results_a[::-1], results_b[::-1])
+
+        assert _compare_sorted_scores.cache_info().hits == 1
+        assert second.recommendation != "mutated"
+        assert second.p_value == first.p_value
+
+    def test_batch_matches_single(self):
+        """Batch comparisons match compare_configs pair by pair."""
+        rng = np.random.default_rng(7)
+        pairs = [
+            # Ties, asymptotic path
+            ([make_result(s, s > 0.5) for s in rng.integers(0, 4, 12) / 3],
+             [make_result(s, s > 0.5) for s in rng.integers(0, 4, 15) / 3]),
+            # Small and tie-free, exact path
+            ([make_result(s, s > 0.5) for s in rng.random(5)],
+             [make_result(s, s > 0.5) for s in rng.random(6)]),
+            # Too small to test
+            ([make_result(0.8, True)], [make_result(0.3, False)]),
+        ]
+
+        batch = StatisticalAnalyzer.compare_configs_batch(pairs)
+
+        assert len(batch) == len(pairs)
+        for (results_a, results_b), result in zip(pairs, batch):
+            single = StatisticalAnalyzer.compare_configs(results_a, results_b)
+            assert result.statistic == pytest.approx(single.statistic)
+            assert result.p_value == pytest.approx(single.p_value)
+            assert result.recommendation == single.recommendation
+
+    def test_batch_arrays_matches_batch(self):
+        """The array-level batch matches the result-list batch."""
+        rng = np.random.default_rng(11)
+        score_pairs = [(rng.random(7), rng.random(9)), (rng.random(1), rng.random(4))]
+        pairs = [
+            ([make_result(s, s > 0.5) for s in a], [make_result(s, s > 0.5) for s in b])
+            for a, b in score_pairs
+        ]
+
+        from_arrays = StatisticalAnalyzer.compare_configs_batch_arrays(score_pairs)
+
+        assert from_arrays == StatisticalAnalyzer.compare_configs_batch(pairs)
+
+    def test_mann_whitney_batch_matches_scipy(self):
+        """Vectorized U and p-values agree with scipy.stats.mannwhitneyu."""
+        from scipy import stats
+
+        rng = np.random.default_rng(0)
+        samples = [
+            (rng.integers(0, 3, n_a).astype(float), rng.random(n_b))
+            for n_a, n_b in [(2, 3), (9, 20), (30, 11), (4, 4)]
+        ]
+
+        u_stats, p_values = StatisticalAnalyzer.mann_whitney_batch(samples)
+
+        for (a, b), u, p in zip(samples, u_stats, p_values):
+            expected = stats.mannwhitneyu(a, b, alternative="two-sided")
+            assert u == pytest.approx(expected.statistic)
+            assert p == pytest.approx(expected.pvalue)
+
 
 class TestPassAtK:
     """Tests for unbiased pass@k estimator."""
 
     def test_all_passed(self):
         """All passing results should give pass@k = 1.0."""
-        results = [make_result(1.0, True) for _ in range(10)]
+        results = [make_result(1.0, True)] * 10
         assert StatisticalAnalyzer.pass_at_k_unbiased(results, k=1) == 1.0
         assert StatisticalAnalyzer.pass_at_k_unbiased(results, k=5) == 1.0
 
     def test_none_passed(self):
         """No passing results should give pass@k = 0.0."""
-        results = [make_result(0.0, False) for _ in range(10)]
+        results = [make_result(0.0, False)] * 10
         assert StatisticalAnalyzer.pass_at_k_unbiased(results, k=1) == 0.0
         assert StatisticalAnalyzer.pass_at_k_unbiased(results, k=5) == 0.0
 
@@ -139,8 +346,8 @@ class TestPassAtK:
         """Partial passing should give correct estimates."""
         # 5 passed out of 10
         results = (
-            [make_result(1.0, True) for _ in range(5)]
-            + [make_result(0.0, False) for _ in range(5)]
+            [make_result(1.0, True)] * 5
+            + [make_result(0.0, False)] * 5
         )
 
         pass_at_1 = StatisticalAnalyzer.pass_at_k_unbiased(results, k=1)
@@ -151,9 +358,14 @@ class TestPassAtK:
         # pass@5 should be higher (more chances to get at least one)
         assert pass_at_5 > pass_at_1
 
+    @pytest.mark.parametrize(("n", "c"), [(10, 3), (7, 6), (1000, 1)])
+    def test_pass_at_1_is_pass_rate(self, n, c):
+        """pass@1 is exactly c/n."""
+        assert StatisticalAnalyzer.pass_at_k_from_counts(n, c, 1) == c / n
+
     def test_k_greater_than_n(self):
         """k > n should fallback to simple estimate."""
-        results = [make_result(1.0, True) for _ in range(3)]
+        results = [make_result(1.0, True)] * 3
         pass_at_10 = StatisticalAnalyzer.pass_at_k_unbiased(results, k=10)
         assert pass_at_10 == 1.0  # All passed
 
@@ -161,13 +373,32 @@ class TestPassAtK:
         """Empty results should return 0."""
         assert StatisticalAnalyzer.pass_at_k_unbiased([], k=1) == 0.0
 
+    def test_from_counts_matches_results(self):
+        """Count-based pass@k agrees with the result-list version."""
+        results = [make_result(1.0, True)] * 3 + [make_result(0.0, False)] * 7
+        for k in (1, 3, 5):
+            assert StatisticalAnalyzer.pass_at_k_from_counts(10, 3, k) == pytest.approx(
+                StatisticalAnalyzer.pass_at_k_unbiased(results, k)
+            )
+
+    @pytest.mark.parametrize(
+        "n,c,k", [(10, 3, 2), (50, 20, 10), (500, 3, 100), (2000, 1500, 600), (5000, 2, 3000)]
+    )
+    def test_product_form_matches_binomials(self, n, c, k):
+        """The float product form equals 1 - C(n-c, k) / C(n, k), even for large n."""
+        from fractions import Fraction
+        from math import comb
+
+        exact = 1 - Fraction(comb(n - c, k), comb(n, k))
+        assert StatisticalAnalyzer.pass_at_k_from_counts(n, c, k) == pytest.approx(float(exact))
+
 
 class TestStabilityMetrics:
     """Tests for stability/variance calculations."""
 
     def test_consistent_results(self):
         """Consistent results should have low variance."""
-        results = [make_result(0.8, True) for _ in range(10)]
+        results = [make_result(0.8, True)] * 10
         stability = StatisticalAnalyzer.calculate_stability(results)
 
         assert isinstance(stability, StabilityMetrics)
@@ -186,6 +417,16 @@ class TestStabilityMetrics:
         assert stability.max_score == 1.0
         assert stability.score_range == 0.8
 
+    @pytest.mark.parametrize("n", [1, 5, 200])
+    def test_matches_numpy(self, n):
+        """Small (pure-Python) and large (numpy) groups agree with numpy."""
+        scores = np.random.default_rng(n).random(n)
+        stability = StatisticalAnalyzer.stability_from_scores(scores)
+
+        assert stability.variance == pytest.approx(scores.var(ddof=1) if n > 1 else 0.0)
+        assert stability.min_score == scores.min()
+        assert stability.max_score == scores.max()
+
     def test_empty_results(self):
         """Empty results should return zeros."""
         stability = StatisticalAnalyzer.calculate_stability([])
@@ -196,40 +437,36 @@ class TestStabilityMetrics:
 class TestIsRegression:
     """Tests for regression detection."""
 
-    def test_clear_regression(self):
-        """Clear regression should be detected."""
-        baseline = [make_result(0.9, True) for _ in range(10)]
-        current = [make_result(0.5, False) for _ in range(10)]
-
-        is_regressed, comparison = StatisticalAnalyzer.is_regression(
-            baseline, current, threshold=0.1
-        )
-
-        assert is_regressed
-        assert comparison.delta < -0.1
-
-    def test_clear_improvement(self):
-        """Improvement should not be flagged as regression."""
-        baseline = [make_result(0.5, False) for _ in range(10)]
-        current = [make_result(0.9, True) for _ in range(10)]
+    @pytest.mark.parametrize(
+        ("baseline_score", "current_score", "threshold", "expected_regressed"),
+        [(0.9, 0.5, 0.1, True), (0.5, 0.9, 0.1, False), (0.7, 0.7, 0.05, False)],
+        ids=["clear_regression", "clear_improvement", "no_change"],
+    )
+    def test_detection(self, baseline_score, current_score, threshold, expected_regressed):
+        """Clear regressions are flagged; improvements and no change are not."""
+        baseline = [make_result(baseline_score, baseline_score > 0.6)] * 10
+        current = [make_result(current_score, current_score > 0.6)] * 10
 
         is_regressed, comparison = StatisticalAnalyzer.is_regression(
-            baseline, current, threshold=0.1
+            baseline, current, threshold=threshold
         )
 
-        assert not is_regressed
-        assert comparison.delta > 0
+        assert is_regressed is expected_regressed
+        assert comparison.delta == pytest.approx(current_score - baseline_score)
 
-    def test_no_change(self):
-        """No change should not be flagged as regression."""
-        baseline = [make_result(0.7, True) for _ in range(10)]
-        current = [make_result(0.7, True) for _ in range(10)]
+    def test_preextracted_scores(self):
+        """Passing score arrays matches passing the results themselves."""
+        baseline = [make_result(s, s > 0.5) for s in (0.9, 0.8, 0.95, 0.85, 0.9)]
+        current = [make_result(s, s > 0.5) for s in (0.4, 0.6, 0.5, 0.45, 0.55)]
 
-        is_regressed, comparison = StatisticalAnalyzer.is_regression(
-            baseline, current, threshold=0.05
+        from_results = StatisticalAnalyzer.is_regression(baseline, current, threshold=0.1)
+        from_arrays = StatisticalAnalyzer.is_regression(
+            threshold=0.1,
+            scores_a=np.array([r.overall_score for r in baseline]),
+            scores_b=np.array([r.overall_score for r in current]),
         )
 
-        assert not is_regressed
+        assert from_arrays == from_results
 
     def test_significance_requirement(self):
         """Regression detection should respect significance requirement."""
@@ -254,12 +491,10 @@ class TestCompareEfficiency:
         """Identical efficiency metrics should show no significant difference."""
         results_a = [
             make_result(0.8, True, input_tokens=1000, output_tokens=500, duration_seconds=10.0)
-            for _ in range(10)
-        ]
+        ] * 10
         results_b = [
             make_result(0.8, True, input_tokens=1000, output_tokens=500, duration_seconds=10.0)
-            for _ in range(10)
-        ]
+        ] * 10
 
         efficiency = StatisticalAnalyzer.compare_efficiency(results_a, results_b)
 
@@ -273,12 +508,10 @@ class TestCompareEfficiency:
         """Config B using fewer tokens should be detected."""
         results_a = [
             make_result(0.8, True, input_tokens=10000, output_tokens=5000, duration_seconds=100.0)
-            for _ in range(10)
-        ]
+        ] * 10
         results_b = [
             make_result(0.8, True, input_tokens=8000, output_tokens=4000, duration_seconds=70.0)
-            for _ in range(10)
-        ]
+        ] * 10
 
         efficiency = StatisticalAnalyzer.compare_efficiency(results_a, results_b)
 
@@ -296,16 +529,40 @@ class TestCompareEfficiency:
         assert efficiency.tokens_p_value is not None
         assert efficiency.duration_p_value is not None
 
+    def test_p_values_match_separate_tests(self):
+        """The stacked test gives the same p-values as one test per metric."""
+        from scipy import stats
+
+        results_a = [
+            make_result(0.8, True, input_tokens=1000 + 37 * i, output_tokens=500, duration_seconds=10.0 + i % 4)
+            for i in range(12)
+        ]
+        results_b = [
+            make_result(0.8, True, input_tokens=1200 + 23 * i, output_tokens=450, duration_seconds=9.0 + i % 3)
+            for i in range(9)
+        ]
+
+        efficiency = StatisticalAnalyzer.compare_efficiency(results_a, results_b)
+
+        def p_value(metric):
+            return stats.mannwhitneyu(
+                [metric(r) for r in results_a], [metric(r) for r in results_b], alternative="two-sided"
+            ).pvalue
+
+        assert efficiency.tokens_p_value == pytest.approx(p_value(lambda r: r.trace.usage.total_tokens))
+        assert efficiency.duration_p_value == pytest.approx(p_value(lambda r: r.trace.duration_seconds))
+        assert efficiency.cost_p_value == pytest.approx(
+            p_value(lambda r: CostMetrics.from_usage(r.trace.usage).total_cost_usd)
+        )
+
     def test_more_tokens_detected(self):
         """Config B using more tokens should be detected as regression."""
         results_a = [
             make_result(0.8, True, input_tokens=5000, output_tokens=2500, duration_seconds=50.0)
-            for _ in range(10)
-        ]
+        ] * 10
         results_b = [
             make_result(0.8, True, input_tokens=7000, output_tokens=3500, duration_seconds=70.0)
-            for _ in range(10)
-        ]
+        ] * 10
 
         efficiency = StatisticalAnalyzer.compare_efficiency(results_a, results_b)
 
@@ -322,12 +579,10 @@ class TestCompareEfficiency:
         """Cost should be calculated from token usage."""
         results_a = [
             make_result(0.8, True, input_tokens=1000000, output_tokens=500000, duration_seconds=100.0)
-            for _ in range(5)
-        ]
+        ] * 5
         results_b = [
             make_result(0.8, True, input_tokens=800000, output_tokens=400000, duration_seconds=80.0)
-            for _ in range(5)
-        ]
+        ] * 5
 
         efficiency = StatisticalAnalyzer.compare_efficiency(results_a, results_b)
 
@@ -339,6 +594,20 @@ class TestCompareEfficiency:
         assert efficiency.cost_delta < 0
         assert efficiency.cost_delta_pct < 0
 
+    def test_cost_uses_default_rates(self):
+        """Every run is priced at the default rates, whatever its model."""
+        opus = make_result(
+            0.8, True, input_tokens=1_000_000, output_tokens=0, model="claude-opus-4-20250514"
+        )
+        unknown = make_result(0.8, True, input_tokens=1_000_000, output_tokens=0)
+
+        efficiency = StatisticalAnalyzer.compare_efficiency([opus, unknown], [unknown])
+
+        # $3 per 1M input tokens for both models
+        assert efficiency.cost_a_mean == pytest.approx(3.0)
+        assert efficiency.cost_b_mean == pytest.approx(3.0)
+        assert efficiency.tokens_a_mean == 1_000_000
+
     def test_insufficient_samples(self):
         """Should handle insufficient samples gracefully."""
         results_a = [make_result(0.8, True)]
@@ -367,12 +636,10 @@ class TestCompareEfficiency:
         """Should handle zero baseline tokens without division error."""
         results_a = [
             make_result(0.8, True, input_tokens=0, output_tokens=0, duration_seconds=10.0)
-            for _ in range(5)
-        ]
+        ] * 5
         results_b = [
             make_result(0.8, True, input_tokens=1000, output_tokens=500, duration_seconds=10.0)
-            for _ in range(5)
-        ]
+        ] * 5
 
         efficiency = StatisticalAnalyzer.compare_efficiency(results_a, results_b)
 
@@ -383,12 +650,10 @@ class TestCompareEfficiency:
         """Recommendation should indicate efficiency improvement."""
         results_a = [
             make_result(0.8, True, input_tokens=10000, output_tokens=5000, duration_seconds=100.0)
-            for _ in range(10)
-        ]
+        ] * 10
         results_b = [
             make_result(0.8, True, input_tokens=7000, output_tokens=3500, duration_seconds=60.0)
-            for _ in range(10)
-        ]
+        ] * 10
 
         efficiency = StatisticalAnalyzer.compare_efficiency(results_a, results_b)
 
@@ -400,15 +665,30 @@ class TestCompareEfficiency:
         """Recommendation should indicate efficiency regression."""
         results_a = [
             make_result(0.8, True, input_tokens=5000, output_tokens=2500, duration_seconds=50.0)
-            for _ in range(10)
-        ]
+        ] * 10
         results_b = [
             make_result(0.8, True, input_tokens=10000, output_tokens=5000, duration_seconds=100.0)
-            for _ in range(10)
-        ]
+        ] * 10
 
         efficiency = StatisticalAnalyzer.compare_efficiency(results_a, results_b)
 
         # Both token and duration are worse, recommendation should reflect this
         assert "more tokens" in efficiency.recommendation.lower() or "less efficient" in efficiency.recommendation.lower()
         assert "slower" in efficiency.recommendation.lower() or "less efficient" in efficiency.recommendation.lower()
+
+
+class TestJitKernels:
+    """Tests for the optional Numba kernel (run as Python without numba)."""
+
+    def test_stability_matches_reference(self):
+        """stability_jit agrees with calculate_stability."""
+        scores = [0.7, 0.8, 0.75, 0.85, 0.72]
+        expected = StatisticalAnalyzer.calculate_stability(
+            [make_result(s, True) for s in scores]
+        )
+        variance, std_dev, cv, lo, hi = stability_jit(np.array(scores))
+
+        assert variance == pytest.approx(expected.variance)
+        assert std_dev == pytest.approx(expected.std_dev)
+        assert cv == pytest.approx(expected.coefficient_of_variation)
+        assert (lo, hi) == (expected.min_score, expected.max_score)